@@ -19,7 +19,7 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import QObject, Signal, QTimer, QMessageBox
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import QObject, pyqtSignal as Signal, QTimer
@@ -55,6 +55,9 @@ class AutomaticBackupSystem(QObject):
         self.settings_file = "backup_settings.json"
         self.load_settings()
         
+        # Backup listing cache: path -> (mtime, backup entry)
+        self._backup_cache = {}
+        
         # Critical operations that trigger backups
         self.critical_operations = [
             "ecu_flash",
@@ -247,19 +250,42 @@ class AutomaticBackupSystem(QObject):
         """Liste alle verfügbaren Backups"""
         try:
             backups = []
-            
-            # Find backup files and directories
-            for item in self.backup_dir.iterdir():
-                if item.is_dir() or item.suffix == '.zip':
+            seen_paths = set()
+            
+            # Find backup files and directories, re-reading only changed entries
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if not (entry.is_dir() or entry.name.endswith('.zip')):
+                        continue
+                    
+                    stat = entry.stat()
+                    seen_paths.add(entry.path)
+                    cached = self._backup_cache.get(entry.path)
+                    if cached and cached[0] == stat.st_mtime:
+                        backups.append(cached[1])
+                        continue
+                    
+                    item = Path(entry.path)
                     backup_info = self.get_backup_info(item)
                     if backup_info:
-                        backups.append({
+                        size = self.get_backup_size(item)
+                        created = datetime.fromtimestamp(stat.st_ctime)
+                        backup = {
                             "path": item,
                             "name": item.name,
                             "info": backup_info,
-                            "size": self.get_backup_size(item),
-                            "created": datetime.fromtimestamp(item.stat().st_ctime)
-                        })
+                            "size": size,
+                            "created": created,
+                            # Vorformatierte Anzeigewerte
+                            "_display_size_mb": size / 1048576.0,
+                            "_display_created_str": created.strftime('%Y-%m-%d %H:%M:%S')
+                        }
+                        self._backup_cache[entry.path] = (stat.st_mtime, backup)
+                        backups.append(backup)
+            
+            # Drop entries removed from disk since the last scan
+            for path in self._backup_cache.keys() - seen_paths:
+                del self._backup_cache[path]
             
             # Sort by creation time (newest first)
             backups.sort(key=lambda x: x["created"], reverse=True)
@@ -270,6 +296,13 @@ class AutomaticBackupSystem(QObject):
             print(f"[ERROR] List backups failed: {e}")
             return []
     
+    def invalidate_backup_cache(self, backup_path=None):
+        """Verwerfe gecachte Backup-Einträge (einzeln oder komplett)"""
+        if backup_path is None:
+            self._backup_cache.clear()
+        else:
+            self._backup_cache.pop(str(backup_path), None)
+    
     def get_backup_info(self, backup_path):
         """Hole Backup-Informationen"""
         try:
@@ -459,6 +492,7 @@ class AutomaticBackupSystem(QObject):
             else:
                 backup_path.unlink()
             
+            self.invalidate_backup_cache(backup_path)
             print(f"[INFO] Backup deleted: {backup_path}")
             return True
             
@@ -16,7 +16,8 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QThread, Signal, QTimer, Qt, QWidget, QVBoxLayout, QLabel,
+                               QProgressBar, QPushButton, QTextEdit)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import QThread, pyqtSignal as Signal, QTimer, Qt
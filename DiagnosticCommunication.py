@@ -143,6 +143,14 @@ class DiagnosticCommunication(QThread):
         self.outputToTextEditSignal.emit(text)
 
     def writeECUCommand(self, cmd: str):
+        # Request and retry reads form one exchange: other threads must not use the port in between
+        lock = getattr(self.serialPort, 'lock', None)
+        if lock is None:
+            return self._writeECUCommand(cmd)
+        with lock:
+            return self._writeECUCommand(cmd)
+
+    def _writeECUCommand(self, cmd: str):
         self.writeToOutputView("> " + cmd)
         
         # Check if using VCI adapter
@@ -34,7 +34,10 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar,
+                               QScrollArea, QFrame, QGroupBox, QTextEdit, QTabWidget, QMessageBox,
+                               QSplitter, QDialog, QDialogButtonBox, QApplication, QThread, Signal,
+                               Qt, QTimer, QFont, QColor, QBrush, QIcon)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
@@ -14,7 +14,9 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QObject, Signal, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
+                               QPushButton, QLabel, QCheckBox, QProgressBar, QTextEdit, QComboBox,
+                               QScrollArea, QTableWidget, QTableWidgetItem, QHeaderView)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import QObject, pyqtSignal as Signal
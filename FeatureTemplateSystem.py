@@ -23,7 +23,11 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QThread, Signal, QTimer, Qt, QWidget, QVBoxLayout, QHBoxLayout,
+                               QLabel, QPushButton, QListWidget, QListWidgetItem, QTextEdit,
+                               QComboBox, QCheckBox, QGroupBox, QTabWidget, QTreeWidget,
+                               QTreeWidgetItem, QProgressBar, QSpinBox, QLineEdit, QMessageBox,
+                               QFileDialog, QSplitter, QFont, QColor, QIcon)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import QThread, pyqtSignal as Signal, QTimer, Qt
@@ -24,8 +24,12 @@ import json
 from PySide6.QtCore import Qt, QThread, Signal
 
 
+# Rows per newRowsSignal emit (without delay)
+BATCH_SIZE = 512
+
+
 class FileLoaderThread(QThread):
-    newRowSignal = Signal(list)
+    newRowsSignal = Signal(list)
     loadingFinishedSignal = Signal()
     isRunning = bool
     path = None
@@ -57,11 +61,20 @@ class FileLoaderThread(QThread):
                     self.stop()
 
                 try:
+                    # With a delay rows stay paced one by one, otherwise they go out in batches
+                    batchSize = 1 if self.delayMs else BATCH_SIZE
+                    batch = []
                     for rowData in csv.reader(stream):
                         if not self.isRunning:
                             break
-                        self.newRowSignal.emit(rowData)
-                        self.msleep(self.delayMs)
+                        batch.append(rowData)
+                        if len(batch) >= batchSize:
+                            self.newRowsSignal.emit(batch)
+                            batch = []
+                            if self.delayMs:
+                                self.msleep(self.delayMs)
+                    if batch:
+                        self.newRowsSignal.emit(batch)
                     self.loadingFinishedSignal.emit()
                 except:
                     if code == "utf-8":
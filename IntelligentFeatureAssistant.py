@@ -36,7 +36,11 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar,
+                               QScrollArea, QFrame, QGroupBox, QCheckBox, QComboBox, QTextEdit,
+                               QWizard, QWizardPage, QRadioButton, QButtonGroup, QListWidget,
+                               QListWidgetItem, QMessageBox, QThread, Signal, Qt, QFont, QPixmap,
+                               QIcon)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
@@ -20,7 +20,7 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import QObject, Signal, QThread, QTimer, QMessageBox, QProgressDialog
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import QObject, pyqtSignal as Signal, QThread, QTimer
@@ -25,7 +25,10 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QThread, Signal, QTimer, Qt, QTextCursor, QWidget, QVBoxLayout,
+                               QHBoxLayout, QLabel, QPushButton, QTextEdit, QComboBox, QCheckBox,
+                               QGroupBox, QTabWidget, QTableWidget, QTableWidgetItem, QFileDialog,
+                               QMessageBox, QSpinBox)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import QThread, pyqtSignal as Signal, QTimer, Qt
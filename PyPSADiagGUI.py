@@ -35,7 +35,14 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QCoreApplication, QDate, QDateTime, QLocale, QMetaObject, QObject,
+                               QPoint, QRect, QSize, QTime, QUrl, Qt, QBrush, QColor,
+                               QConicalGradient, QCursor, QFont, QFontDatabase, QGradient, QIcon,
+                               QImage, QKeySequence, QLinearGradient, QPainter, QPalette, QPixmap,
+                               QRadialGradient, QTransform, QApplication, QCheckBox, QComboBox,
+                               QFrame, QHBoxLayout, QLineEdit, QMainWindow, QPushButton,
+                               QSizePolicy, QSpacerItem, QSplitter, QStatusBar, QTextEdit,
+                               QVBoxLayout, QWidget, QTabWidget, QLabel, QScrollArea)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import Qt, QObject, QRect, QSize, QUrl
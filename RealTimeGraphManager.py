@@ -12,7 +12,9 @@ import json
 from collections import deque
 from datetime import datetime, timedelta
 # Use Qt compatibility layer
-from qt_compat import *
+from qt_compat import (QT_FRAMEWORK, QAction, QApplication, QCheckBox, QFileDialog, QFrame,
+                       QHBoxLayout, QLabel, QListWidget, QListWidgetItem, QMainWindow, QMessageBox,
+                       QPushButton, QSpinBox, QTextEdit, QTimer, QVBoxLayout, QWidget, Qt)
 
 try:
     # Configure PyQtGraph for Qt5/Qt6 compatibility
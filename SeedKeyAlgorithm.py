@@ -20,7 +20,40 @@
    Or, point your browser to http://www.gnu.org/copyleft/gpl.html
 """
 
-import numpy as np
+# Optional JIT for the key transform
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _transform(data_msb, data_lsb, sec0, sec1, sec2):
+    """Plain integer transform step: (data, rem, num, dom1, dom2, result)"""
+    data = (data_msb << 8) | data_lsb
+    neg = False
+    if data & 0x8000:
+        data = 0x10000 - data
+        neg = True
+
+    rem = data % sec0
+    num = data // sec0
+    if neg:
+        rem = -rem
+        num = -num
+
+    # |rem * sec2| and |num * sec1| stay inside int16 for the PSA secrets
+    dom1 = rem * sec2
+    dom2 = num * sec1
+    result = dom1 - dom2
+    if result < 0:
+        result += (sec0 * sec2) + sec1
+    return data, rem, num, dom1, dom2, result
+
+
+if NUMBA_AVAILABLE:
+    # Signature given, so compilation happens at import and not on the first seed
+    _transform = njit("UniTuple(int64, 6)(int64, int64, int64, int64, int64)", cache=True)(_transform)
 
 
 class SeedKeyAlgorithm():
@@ -29,25 +62,7 @@ class SeedKeyAlgorithm():
     # Code grabbed from ludwig-v(Vluds) Github page and adapted for Python
     # https://github.com/ludwig-v/psa-seedkey-algorithm/tree/main
     def transform(self, data_msb, data_lsb, sec):
-        data = np.int32((data_msb << 8) | data_lsb)
-        neg = False
-        val = 0
-        if data & 0x8000:
-            data -= 0x10000
-            data *= -1
-            neg = True
-
-        rem = np.int32(data % sec[0])
-        num = np.int32(data / sec[0])
-        if neg:
-            rem *= -1
-            num *= -1
-
-        dom1 = np.int32(np.int16(rem) * np.uint8(sec[2]))
-        dom2 = np.int32(np.int16(num) * np.uint8(sec[1]))
-        result = np.int32(dom1 - dom2)
-        if result < 0:
-            result += (sec[0] * sec[2]) + sec[1]
+        data, rem, num, dom1, dom2, result = _transform(data_msb, data_lsb, sec[0], sec[1], sec[2])
 
         if self.debug:
             print("  " + hex(sec[0]) + " " + hex(sec[1]) + " " + hex(sec[2]))
@@ -57,7 +72,7 @@ class SeedKeyAlgorithm():
             print("  dom1   " + hex(dom1))
             print("  dom2   " + hex(dom2))
             print("  result " + hex(result))
-        return int(result) & 0xFFFF
+        return result & 0xFFFF
 
     # Code grabbed from ludwig-v(Vluds) Github page and adapted for Python
     # https://github.com/ludwig-v/psa-seedkey-algorithm/tree/main
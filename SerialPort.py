@@ -20,6 +20,7 @@
 """
 
 import time
+import threading
 import serial.tools.list_ports
 
 from EcuSimulation import EcuSimulation
@@ -32,6 +33,13 @@ except ImportError:
     VCI_ADAPTER_CLASS = VCIAdapter
     VCI_MODE = "RegularVCI"
 
+# Seconds to wait for a reply from the Arduino interface
+READ_TIMEOUT = 5.0
+
+# Serial receive buffer of the Arduino (default 64 bytes); a batch write must fit into it
+# because the sketch does not read while it is busy with a CAN round-trip
+ARDUINO_RX_BUFFER = 64
+
 
 class SerialPort():
     ecuSimulation = EcuSimulation()
@@ -40,6 +48,10 @@ class SerialPort():
 
     def __init__(self, simulation: bool(), use_vci: bool() = False):
         self.serialPort = serial.Serial()
+        self.rxBuffer = bytearray()
+        # Serializes round-trips of the GUI command thread, DiagnosticCommunication and discovery;
+        # reentrant so a caller can hold it across a multi-read exchange
+        self.lock = threading.RLock()
         self.simulation = simulation
         self.use_vci = use_vci
         self.vci_adapter = None
@@ -58,6 +70,8 @@ class SerialPort():
             self.vci_adapter = VCI_ADAPTER_CLASS()
         elif not self.use_vci and self.vci_adapter:
             self.vci_adapter.disconnect()
+            if hasattr(self.vci_adapter, 'shutdown'):
+                self.vci_adapter.shutdown()
             self.vci_adapter = None
 
     # Get available Serial ports and put it in Combobox
@@ -98,8 +112,9 @@ class SerialPort():
             try:
                 self.serialPort.port = portNr
                 self.serialPort.baudrate = baudRate
-                self.serialPort.timeout = 5.0
+                self.serialPort.timeout = READ_TIMEOUT
                 self.serialPort.open()
+                self.rxBuffer = bytearray()
                 return True
             except serial.SerialException as e:
                 print('Error opening port: ' + str(e))
@@ -115,44 +130,114 @@ class SerialPort():
         #print(data)
         self.serialPort.write(data)
 
+    # Read one "\r\n" terminated reply; whatever arrived after it stays buffered for the next call
     def readRawData(self):
-        data = bytearray()
-        runLoop = 50
-        while runLoop > 0:
-            dataLen = self.serialPort.in_waiting
-            if dataLen > 1:
-                subData = self.serialPort.read_until(expected=b"\r\n")
-                if len(subData) > 0:
-                    data.extend(subData)
-                    if data.find(b"\r") != -1:
-#                        print(data)
-                        break
-                    time.sleep(0.1)
-                    runLoop = 10
-            else:
-                time.sleep(0.1)
-                runLoop -= 1
-        return data
+        data = self.rxBuffer
+        deadline = time.monotonic() + READ_TIMEOUT
+        end = data.find(b"\r\n")
+        while end == -1 and time.monotonic() < deadline:
+            # Blocks until at least one byte (or port timeout), then drains everything buffered
+            chunk = self.serialPort.read(max(1, self.serialPort.in_waiting))
+            if not chunk:
+                break
+            data.extend(chunk)
+            end = data.find(b"\r\n", max(0, len(data) - len(chunk) - 1))
+
+        if end == -1:
+            self.rxBuffer = bytearray()
+            return data
+        self.rxBuffer = data[end + 2:]
+        return data[:end + 2]
 
     def readData(self):
-        if self.simulation:
-            return self.ecuSimulation.receive()
-        else:
+        with self.lock:
+            if self.simulation:
+                return self.ecuSimulation.receive()
             data = self.readRawData()
-            if len(data) == 0:
-                return "Timeout"
+        if len(data) == 0:
+            return "Timeout"
 
-            i = data.find(b"\r")
-            decodedData = data[:i].decode("utf-8");
-            return decodedData
+        i = data.find(b"\r")
+        decodedData = data[:i].decode("utf-8");
+        return decodedData
 
     def sendReceive(self, cmd: str):
+        with self.lock:
+            if self.simulation:
+                return self.ecuSimulation.sendReceive(cmd)
+            elif self.use_vci and self.vci_adapter:
+                # VCI communication
+                return self.vci_adapter.send_receive(cmd)
+            else:
+                cmd += "\n"
+                self.write(cmd.encode("utf-8"))
+                return self.readData()
+
+    # Send several commands with one write and read the answers in order
+    def sendBatch(self, cmds: list):
+        with self.lock:
+            return self._sendBatch(cmds)
+
+    def _sendBatch(self, cmds: list):
         if self.simulation:
-            return self.ecuSimulation.sendReceive(cmd)
-        elif self.use_vci and self.vci_adapter:
-            # VCI communication
-            return self.vci_adapter.send_receive(cmd)
-        else:
-            cmd += "\n"
-            self.write(cmd.encode("utf-8"))
-            return self.readData()
+            return [self.sendReceive(cmd) for cmd in cmds]
+        if self.use_vci and self.vci_adapter:
+            return self.sendBatchVci(cmds)
+
+        # Write as many commands as fit into the Arduino receive buffer, read their
+        # replies, then send the next chunk
+        results = []
+        chunk = bytearray()
+        count = 0
+        for cmd in cmds:
+            line = (cmd + "\n").encode("utf-8")
+            if count and len(chunk) + len(line) > ARDUINO_RX_BUFFER:
+                self.write(bytes(chunk))
+                results.extend(self.readFinalData() for _ in range(count))
+                chunk.clear()
+                count = 0
+            chunk += line
+            count += 1
+        if count:
+            self.write(bytes(chunk))
+            results.extend(self.readFinalData() for _ in range(count))
+        return results
+
+    # VCI: ">TX:RX" headers reconfigure the adapter ("OK" on success), the hex frames
+    # between two headers are pipelined through the bridge in one go
+    def sendBatchVci(self, cmds: list):
+        sendFrames = getattr(self.vci_adapter, 'send_receive_batch', None)
+        results = []
+        frames = []
+        configured = True
+        for cmd in cmds + [None]:
+            if cmd is not None and not cmd.startswith(">"):
+                frames.append(cmd)
+                continue
+            if frames:
+                if not configured:
+                    # Never send to the previously configured ECU
+                    results.extend([""] * len(frames))
+                elif sendFrames:
+                    results.extend(sendFrames(frames))
+                else:
+                    results.extend(self.vci_adapter.send_receive(frame) for frame in frames)
+                frames = []
+            if cmd is not None:
+                txId, _, rxId = cmd[1:].partition(":")
+                configured = bool(self.configure_vci(txId, rxId))
+                results.append("OK" if configured else "")
+        return results
+
+    # Read until the final reply of one command: skip 7Fxx78 (Response Pending)
+    # and strip the custom error 7F3E03, as writeECUCommand does
+    def readFinalData(self):
+        data = self.readData()
+        i = data.find("7F3E03")
+        while i >= 0 or (data[:2] == "7F" and data[4:6] == "78"):
+            if i > 0:
+                data = data[:i] + self.readData()
+            else:
+                data = self.readData()
+            i = data.find("7F3E03")
+        return data
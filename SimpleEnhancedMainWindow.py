@@ -6,7 +6,19 @@
 
 import sys
 import os
-from qt_compat import *
+import time
+import logging
+import logging.handlers
+import queue
+import atexit
+import functools
+from collections import deque
+from qt_compat import (QApplication, QCheckBox, QColor, QComboBox, QDialog, QEvent, QFileDialog,
+                       QFont, QFormLayout, QGroupBox, QHBoxLayout, QHeaderView, QInputDialog,
+                       QKeySequence, QLabel, QLineEdit, QListWidget, QListWidgetItem, QMessageBox,
+                       QProgressBar, QPushButton, QScrollArea, QShortcut, QSpinBox, QSplitter,
+                       QStatusBar, QStyle, QSystemTrayIcon, QTabWidget, QTableWidget,
+                       QTableWidgetItem, QTextEdit, QTimer, QVBoxLayout, QWidget, Qt)
 from datetime import datetime
 
 # Import der Basis-Module (immer verfügbar)
@@ -141,6 +153,9 @@ except ImportError as e:
     PDFReportGenerator = None
     PDF_REPORTS_AVAILABLE = False
 
+# Wird beim ersten Report-Klick aufgelöst und danach wiederverwendet
+_create_sample_report = None
+
 try:
     from CodingAssistant import CodingAssistantWidget
     CODING_ASSISTANT_AVAILABLE = True
@@ -190,11 +205,175 @@ except ImportError as e:
     FEATURE_ACTIVATION_AVAILABLE = False
 
 
+# Maximale Zeilenanzahl im CAN Message Monitor
+CAN_LOG_MAX_LINES = 5000
+
+# Logger für die VCI/CAN Handler - Debug-Ausgaben werden erst bei Bedarf formatiert.
+# Die stdout-Ausgabe erfolgt über eine Queue in einem Hintergrund-Thread, damit die
+# Signal-Handler im UI-Thread nicht auf stdout warten. Records propagieren weiterhin
+# zu den Handlern von "PyPSADiag" und Root (ProfessionalLoggingSystem).
+log = logging.getLogger("PyPSADiag.VCI")
+log.setLevel(logging.INFO)
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener_started = False
+
+
+def _start_log_listener():
+    """Startet den stdout-Listener einmalig (bis dahin bleiben die Records in der Queue)"""
+    global _log_listener_started
+    if _log_listener_started:
+        return
+    _log_listener_started = True
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+_format_can_line = "{0} {1} ID:0x{2:03X} DLC:{3} Data:{4}".format
+
+# Mindestabstand zwischen zwei Hardware-Status/Timing-Abfragen (Sekunden)
+_STATUS_CACHE_TTL = 0.25
+
+# VIN-Eingabe Rahmen je Validierungszustand
+_VIN_INPUT_STYLES = {
+    'ok': "border: 2px solid green;",
+    'partial': "border: 2px solid orange;",
+    'empty': "",
+}
+
+
+# Stylesheets der Feature-Tabs (einmal definiert, von allen Buildern geteilt)
+_HEADER_CSS = "font-size: 16px; font-weight: bold; color: #0066cc; padding: 10px;"
+_INFO_CSS = "background-color: #e8f4fd; color: #0c5460; border: 1px solid #bee5eb; padding: 10px; border-radius: 4px;"
+_WARNING_CSS = "background-color: #fff3cd; color: #856404; border: 1px solid #ffeaa7; padding: 10px; border-radius: 4px;"
+_ERROR_CSS = "color: #d13438; padding: 10px;"
+_UNAVAILABLE_CSS = "color: #ff8c00; padding: 20px; font-size: 12px;"
+_PRIMARY_BTN_CSS = "QPushButton { background-color: #0066cc; color: white; font-weight: bold; padding: 8px; }"
+_SUCCESS_BTN_CSS = "QPushButton { background-color: #00d084; color: white; font-weight: bold; padding: 8px; }"
+
+# Hinweistexte für nicht verfügbare Feature-Tabs (Tab-Name -> Text)
+_MISSING_FEATURE_TEXT = {
+    'live_graphs': "⚠️ Live-Graphen nicht verfügbar\n\nBenötigt: pyqtgraph, numpy",
+    'pdf_reports': "⚠️ PDF-Reports nicht verfügbar\n\nBenötigt: reportlab, matplotlib",
+    'coding_assistant': "⚠️ ECU Coding Assistant nicht verfügbar\n\nBenötigt: CodingAssistant Modul",
+    'flash_manager': "⚠️ Flash Manager nicht verfügbar\n\nBenötigt: FlashUpdateManager Modul",
+    'config_manager': "⚠️ Config Manager nicht verfügbar\n\nBenötigt: RealConfigManager Modul",
+}
+
+
+def _missing_feature_label(key):
+    """Hinweis-Label für ein nicht verfügbares Feature aus den vorbereiteten Texten bauen"""
+    label = QLabel(_MISSING_FEATURE_TEXT[key])
+    label.setStyleSheet(_UNAVAILABLE_CSS)
+    return label
+
+
+def _require_cap(cap, title, message):
+    """Slot nur ausführen wenn das Subsystem verfügbar ist.
+    
+    Ist es nicht verfügbar, wird der Hinweis einmal gezeigt und der
+    auslösende Button deaktiviert, damit weitere Klicks nichts kosten.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self):
+            if self._caps[cap]:
+                return func(self)
+            QMessageBox.information(self, title, message)
+            sender = self.sender()
+            if sender is not None:
+                sender.setEnabled(False)
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=128)
+def _fmt_hhmmss(epoch_sec):
+    """Uhrzeit HH:MM:SS für eine ganze Sekunde (gecacht für Fehlerserien)"""
+    return time.strftime('%H:%M:%S', time.localtime(epoch_sec))
+
+
+def _cached_tab(name):
+    """Tab-Widget nur beim ersten Aufruf bauen, danach aus self._tab_cache liefern"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self):
+            widget = self._tab_cache.get(name)
+            if widget is None:
+                widget = self._tab_cache[name] = func(self)
+            return widget
+        return wrapper
+    return decorator
+
+
+class _NoopStatusBar:
+    """Platzhalter falls keine Statusleiste verfügbar ist"""
+    
+    def showMessage(self, *args):
+        pass
+    
+    def currentMessage(self):
+        return ""
+
+
+def _format_ecu_details(ecu_address, ecu):
+    """ECU-Details für die Anzeige im VIN Decoder Tab formatieren"""
+    parts = [f"""ECU DETAILS:
+
+Name: {ecu['name']}
+Short Name: {ecu['short_name']}
+Type: {ecu['type']}
+Address: 0x{ecu_address:X}
+
+PROTOCOLS:
+{', '.join(ecu['protocols'])}
+
+FUNCTIONS:"""]
+    parts.extend(f"- {func}" for func in ecu['functions'])
+    
+    parts.append("")
+    parts.append(f"DATA IDENTIFIERS ({len(ecu['data_identifiers'])}):")
+    parts.extend(f"- 0x{data_id:X}: {description}" for data_id, description in ecu['data_identifiers'].items())
+    
+    parts.append("")
+    parts.append("SUPPLIERS:")
+    parts.extend(f"- {supplier}" for supplier in ecu['suppliers'])
+    
+    parts.append("")
+    parts.append("TYPICAL ADDRESSES:")
+    parts.extend(f"- 0x{addr:X}" for addr in ecu['typical_addresses'])
+    parts.append("")
+    
+    return '\n'.join(parts)
+
+
+def _format_backup_details(backup):
+    """Backup-Details für die Anzeige im Backup Manager formatieren"""
+    info = backup["info"]
+    return f"""Backup Details:
+                    
+Name: {backup['name']}
+Created: {backup['_display_created_str']}
+Size: {backup['_display_size_mb']:.2f} MB
+Description: {info.get('description', 'N/A')}
+Operation: {info.get('operation', 'N/A')}
+Version: {info.get('backup_version', 'N/A')}
+Created by: {info.get('created_by', 'N/A')}
+
+Files: {info.get('file_count', 0)}
+Path: {backup['path']}
+"""
+
+
 class SimpleEnhancedMainWindow(MainWindow, EnhancedEventHandlers if ENHANCED_HANDLERS_AVAILABLE else object):
     """Enhanced Main Window mit Fehlerbehandlung"""
     
     def __init__(self):
         super().__init__()
+        _start_log_listener()
+        
+        # Statusleiste einmalig binden (Handler rufen sie ohne weitere Prüfung auf)
+        self.status_bar = self.statusBar() or _NoopStatusBar()
         
         # Basis-Module (immer verfügbar)
         self.ecu_detector = None
@@ -217,6 +396,15 @@ class SimpleEnhancedMainWindow(MainWindow, EnhancedEventHandlers if ENHANCED_HAN
         # Automatic Backup System
         self.backup_system = get_backup_system() if BACKUP_SYSTEM_AVAILABLE else None
         
+        # Tray-Icon für Benachrichtigungen (einmalig, nur wenn System-Tray verfügbar);
+        # sichtbar nur solange eine Meldung angezeigt wird
+        self._tray = QSystemTrayIcon(self) if QSystemTrayIcon.isSystemTrayAvailable() else None
+        if self._tray:
+            self._tray_hide_timer = QTimer(self)
+            self._tray_hide_timer.setSingleShot(True)
+            self._tray_hide_timer.timeout.connect(self._tray.hide)
+            self._tray.messageClicked.connect(self._tray.hide)
+        
         # Automatic VCI Detection
         self.vci_detection = get_vci_detection() if VCI_DETECTION_AVAILABLE else None
         if self.vci_detection:
@@ -232,6 +420,59 @@ class SimpleEnhancedMainWindow(MainWindow, EnhancedEventHandlers if ENHANCED_HAN
         # ECU/VIN Database
         self.ecu_vin_database = get_ecu_vin_database() if ECU_VIN_DATABASE_AVAILABLE else None
         
+        # ECU-Suchindex (Adresse -> Listeneintrag, Trigramm -> Adressen)
+        self._ecu_items = {}
+        self._ecu_search_text = {}
+        self._ecu_trigrams = {}
+        
+        # ECU-Suche erst nach 150 ms Tipp-Pause ausführen
+        self._pending_ecu_search = ""
+        self._ecu_search_timer = QTimer(self)
+        self._ecu_search_timer.setSingleShot(True)
+        self._ecu_search_timer.setInterval(150)
+        self._ecu_search_timer.timeout.connect(self._do_ecu_search)
+        
+        # Zeitpunkt und Text der letzten Hardware-Status/Timing-Abfrage
+        self._status_cache = {'t': 0.0, 'v': None, 'pending': False}
+        self._timing_cache = {'t': 0.0, 'v': None, 'pending': False}
+        self._timing_refresh_pending = False
+        self._hw_refresh_pending = False
+        self._last_db_stats_text = None
+        
+        # Letzter Validierungszustand der VIN-Eingabe
+        self._vin_last_state = None
+        
+        # CAN-Monitor: Zeilen sammeln und gebündelt alle 50 ms ausgeben
+        self._can_log = deque(maxlen=CAN_LOG_MAX_LINES)
+        self._can_flush_timer = QTimer(self)
+        self._can_flush_timer.setSingleShot(True)
+        self._can_flush_timer.setInterval(50)
+        self._can_flush_timer.timeout.connect(self._flush_can_buffer)
+        # Widgets des CAN-Monitors (werden nur mit Hardware-VCI-Tab erstellt)
+        self.can_message_list = None
+        self.auto_scroll_check = None
+        
+        # Statusleiste: nur die letzte Meldung alle 50 ms anzeigen
+        self._statusbar_pending = None
+        self._statusbar_timer = QTimer(self)
+        self._statusbar_timer.setSingleShot(True)
+        self._statusbar_timer.setInterval(50)
+        self._statusbar_timer.timeout.connect(self._flush_statusbar)
+        
+        # Hardware-/Timing-Ereignisse sammeln und alle 10 ms gebündelt verarbeiten
+        self._hw_events = deque()
+        self._hw_events_timer = QTimer(self)
+        self._hw_events_timer.setSingleShot(True)
+        self._hw_events_timer.setInterval(10)
+        self._hw_events_timer.timeout.connect(self._drain_hardware_events)
+        
+        # Hardware-Fehler sammeln (vci_type, error_code) -> [Anzahl, letzter Fehler]
+        self._pending_errors = {}
+        self._error_dialog_scheduled = False
+        
+        # Aktualisierungen, die bei minimiertem Fenster ausgelassen wurden
+        self._ui_refresh_deferred = False
+        
         # Hardware VCI Interface
         self.hardware_vci = get_hardware_vci() if HARDWARE_VCI_AVAILABLE else None
         if self.hardware_vci:
@@ -242,6 +483,16 @@ class SimpleEnhancedMainWindow(MainWindow, EnhancedEventHandlers if ENHANCED_HAN
             self.hardware_vci.hardware_error.connect(self.on_hardware_error)
             self.hardware_vci.timing_violation.connect(self.on_timing_violation)
         
+        # Verfügbarkeit der Subsysteme einmalig festhalten
+        self._caps = {
+            'backup': self.backup_system is not None,
+            'vci': self.hardware_vci is not None,
+            'db': self.ecu_vin_database is not None,
+        }
+        
+        # Bereits gebaute Feature-Tabs (Name -> Widget); wird nie geleert, die Tabs leben so lange wie das Fenster
+        self._tab_cache = {}
+        
         # Setup Enhanced Interface
         self.setup_enhanced_interface()
         
@@ -530,7 +781,7 @@ class SimpleEnhancedMainWindow(MainWindow, EnhancedEventHandlers if ENHANCED_HAN
         search_input_layout.addWidget(QLabel("Suche:"))
         self.ecu_search_input = QLineEdit()
         self.ecu_search_input.setPlaceholderText("ECU-ID, Name oder Hersteller...")
-        self.ecu_search_input.textChanged.connect(self.search_ecus)
+        self.ecu_search_input.textChanged.connect(self._schedule_ecu_search)
         search_input_layout.addWidget(self.ecu_search_input)
         search_layout.addLayout(search_input_layout)
         
@@ -1491,15 +1742,11 @@ Installieren Sie das FeatureActivationMatrix-Modul für diese Funktionalität.""
     def setup_auto_features(self):
         """Auto-Features - vereinfacht"""
         # Auto-Initialize nach 2 Sekunden
-        QTimer.singleShot(2000, self.auto_initialize)
-    
-    def auto_initialize(self):
-        """Auto-Initialisierung"""
-        print("[INFO] Auto-initializing enhanced features...")
-        self.init_enhanced_modules()
+        QTimer.singleShot(2000, self.init_enhanced_modules)
     
     def init_enhanced_modules(self):
         """Enhanced Module initialisieren"""
+        print("[INFO] Auto-initializing enhanced features...")
         controller = None
         
         if hasattr(self, 'vci_adapter') and self.vci_adapter:
@@ -1828,32 +2075,31 @@ Installieren Sie das FeatureActivationMatrix-Modul für diese Funktionalität.""
         
         # System Information Group
         system_group = QGroupBox("System Information")
-        system_layout = QVBoxLayout(system_group)
+        system_layout = QFormLayout(system_group)
+        system_group.setStyleSheet("QLabel { padding: 2px; font-family: monospace; }")
         
         # System info
         system_info = [
-            f"PyPSADiag Enhanced Version: 2.0",
-            f"Vehicle Profiles: {len(self.vehicle_profile_system.profiles) if self.vehicle_profile_system else 'N/A'}",
-            f"Hardware Components: {len(self.feature_activation_matrix.hardware_checker.hardware_components) if self.feature_activation_matrix and hasattr(self.feature_activation_matrix, 'hardware_checker') and self.feature_activation_matrix.hardware_checker else 'N/A'}",
-            f"Theme Manager: {'Available' if self.theme_manager else 'Not Available'}",
-            f"VCI Detection: {'Active' if self.vci_detection else 'Not Available'}",
-            f"Connected VCIs: {len(self.vci_detection.get_connected_vcis()) if self.vci_detection else 0}",
-            f"ECU/VIN Database: {'Available' if self.ecu_vin_database else 'Not Available'}",
-            f"Database ECUs: {len(self.ecu_vin_database.ecu_definitions) if self.ecu_vin_database else 0}",
-            f"Hardware VCI: {'Available' if self.hardware_vci else 'Not Available'}",
-            f"Hardware Connected: {'Yes' if self.hardware_vci and self.hardware_vci.connected else 'No'}"
+            ("PyPSADiag Enhanced Version", "2.0"),
+            ("Vehicle Profiles", len(self.vehicle_profile_system.profiles) if self.vehicle_profile_system else 'N/A'),
+            ("Hardware Components", len(self.feature_activation_matrix.hardware_checker.hardware_components) if self.feature_activation_matrix and hasattr(self.feature_activation_matrix, 'hardware_checker') and self.feature_activation_matrix.hardware_checker else 'N/A'),
+            ("Theme Manager", 'Available' if self.theme_manager else 'Not Available'),
+            ("VCI Detection", 'Active' if self.vci_detection else 'Not Available'),
+            ("Connected VCIs", len(self.vci_detection.get_connected_vcis()) if self.vci_detection else 0),
+            ("ECU/VIN Database", 'Available' if self.ecu_vin_database else 'Not Available'),
+            ("Database ECUs", len(self.ecu_vin_database.ecu_definitions) if self.ecu_vin_database else 0),
+            ("Hardware VCI", 'Available' if self.hardware_vci else 'Not Available'),
+            ("Hardware Connected", 'Yes' if self.hardware_vci and self.hardware_vci.connected else 'No')
         ]
         
-        for info in system_info:
-            info_label = QLabel(info)
-            info_label.setStyleSheet("padding: 2px; font-family: monospace;")
-            system_layout.addWidget(info_label)
+        for info_name, info_value in system_info:
+            system_layout.addRow(f"{info_name}:", QLabel(str(info_value)))
         
         layout.addWidget(system_group)
         
         # Module Status Group
         modules_group = QGroupBox("Module Status")
-        modules_layout = QVBoxLayout(modules_group)
+        modules_layout = QFormLayout(modules_group)
         
         modules_status = [
             ("ECU Database", ECU_DATABASE_AVAILABLE),
@@ -1869,16 +2115,13 @@ Installieren Sie das FeatureActivationMatrix-Modul für diese Funktionalität.""
             ("Hardware VCI Interface", HARDWARE_VCI_AVAILABLE)
         ]
         
+        available_style = "color: #28a745; font-weight: bold;"
+        unavailable_style = "color: #dc3545; font-weight: bold;"
+        
         for module_name, available in modules_status:
-            status_layout = QHBoxLayout()
-            status_layout.addWidget(QLabel(f"{module_name}:"))
-            
             status_label = QLabel("Available" if available else "Not Available")
-            status_label.setStyleSheet(f"color: {'#28a745' if available else '#dc3545'}; font-weight: bold;")
-            status_layout.addWidget(status_label)
-            status_layout.addStretch()
-            
-            modules_layout.addLayout(status_layout)
+            status_label.setStyleSheet(available_style if available else unavailable_style)
+            modules_layout.addRow(f"{module_name}:", status_label)
         
         layout.addWidget(modules_group)
         
@@ -2038,13 +2281,10 @@ Installieren Sie das FeatureActivationMatrix-Modul für diese Funktionalität.""
     
     # === Backup Management Methods ===
     
+    @_require_cap('backup', "Backup System", "Backup System is not available")
     def create_manual_backup(self):
         """Erstelle manuelles Backup"""
         try:
-            if not self.backup_system:
-                QMessageBox.information(self, "Backup System", "Backup System is not available")
-                return
-            
             # Input Dialog für Backup-Namen
             from PySide6.QtWidgets import QInputDialog
             name, ok = QInputDialog.getText(
@@ -2067,13 +2307,10 @@ Installieren Sie das FeatureActivationMatrix-Modul für diese Funktionalität.""
         except Exception as e:
             QMessageBox.critical(self, "Backup Error", f"Error creating backup: {e}")
     
+    @_require_cap('backup', "Backup System", "Backup System is not available")
     def show_backup_manager(self):
         """Zeige Backup Manager Dialog"""
         try:
-            if not self.backup_system:
-                QMessageBox.information(self, "Backup System", "Backup System is not available")
-                return
-            
             # Backup Manager Dialog erstellen
             from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                                          QListWidget, QListWidgetItem, QPushButton,
@@ -2121,36 +2358,25 @@ Installieren Sie das FeatureActivationMatrix-Modul für diese Funktionalität.""
             
             # Load backups
             def load_backups():
-                backup_list.clear()
                 details_area.clear()
                 
                 backups = self.backup_system.list_backups()
-                for backup in backups:
-                    item = QListWidgetItem(backup["name"])
-                    item.setData(1, backup)  # Store backup data
-                    backup_list.addItem(item)
+                backup_list.setUpdatesEnabled(False)
+                try:
+                    backup_list.clear()
+                    for backup in backups:
+                        item = QListWidgetItem(backup["name"])
+                        item.setData(1, backup)  # Store backup data
+                        item.setData(Qt.UserRole + 2, _format_backup_details(backup))
+                        backup_list.addItem(item)
+                finally:
+                    backup_list.setUpdatesEnabled(True)
             
             # Show backup details
             def show_details():
                 current_item = backup_list.currentItem()
                 if current_item:
-                    backup = current_item.data(1)
-                    info = backup["info"]
-                    
-                    details = f"""Backup Details:
-                    
-Name: {backup['name']}
-Created: {backup['created'].strftime('%Y-%m-%d %H:%M:%S')}
-Size: {backup['size'] / 1024 / 1024:.2f} MB
-Description: {info.get('description', 'N/A')}
-Operation: {info.get('operation', 'N/A')}
-Version: {info.get('backup_version', 'N/A')}
-Created by: {info.get('created_by', 'N/A')}
-
-Files: {info.get('file_count', 0)}
-Path: {backup['path']}
-"""
-                    details_area.setText(details)
+                    details_area.setText(current_item.data(Qt.UserRole + 2))
             
             # Restore backup
             def restore_backup():
@@ -2184,9 +2410,14 @@ Path: {backup['path']}
                         else:
                             QMessageBox.warning(dialog, "Delete Error", "Failed to delete backup")
             
+            # Full rescan on explicit refresh
+            def refresh_backups():
+                self.backup_system.invalidate_backup_cache()
+                load_backups()
+            
             # Connect signals
             backup_list.itemSelectionChanged.connect(show_details)
-            refresh_btn.clicked.connect(load_backups)
+            refresh_btn.clicked.connect(refresh_backups)
             restore_btn.clicked.connect(restore_backup)
             delete_btn.clicked.connect(delete_backup)
             close_btn.clicked.connect(dialog.accept)
@@ -2199,16 +2430,13 @@ Path: {backup['path']}
         except Exception as e:
             QMessageBox.critical(self, "Backup Manager Error", f"Error opening backup manager: {e}")
     
+    @_require_cap('backup', "Backup System", "Backup System is not available")
     def show_backup_stats(self):
         """Zeige Backup-Statistiken"""
         try:
-            if not self.backup_system:
-                QMessageBox.information(self, "Backup System", "Backup System is not available")
-                return
-            
             stats = self.backup_system.get_backup_statistics()
             
-            stats_text = f"""Backup System Statistics:
+            parts = [f"""Backup System Statistics:
 
 Total Backups: {stats.get('total_backups', 0)}
 Total Size: {stats.get('total_size_mb', 0):.2f} MB
@@ -2220,18 +2448,19 @@ Backup Settings:
 - Auto Cleanup: {'Enabled' if stats.get('settings', {}).get('cleanup_old_backups', False) else 'Disabled'}
 - Cleanup Days: {stats.get('settings', {}).get('cleanup_days', 30)}
 
-Operations:"""
+Operations:"""]
             
             operations = stats.get('operations', {})
             for operation, count in operations.items():
-                stats_text += f"\n- {operation}: {count}"
+                parts.append(f"- {operation}: {count}")
             
             if stats.get('newest_backup'):
-                stats_text += f"\n\nNewest Backup: {stats['newest_backup'].strftime('%Y-%m-%d %H:%M:%S')}"
+                parts.append("")
+                parts.append(f"Newest Backup: {stats['newest_backup'].strftime('%Y-%m-%d %H:%M:%S')}")
             if stats.get('oldest_backup'):
-                stats_text += f"\nOldest Backup: {stats['oldest_backup'].strftime('%Y-%m-%d %H:%M:%S')}"
+                parts.append(f"Oldest Backup: {stats['oldest_backup'].strftime('%Y-%m-%d %H:%M:%S')}")
             
-            QMessageBox.information(self, "Backup Statistics", stats_text)
+            QMessageBox.information(self, "Backup Statistics", '\n'.join(parts))
             
         except Exception as e:
             QMessageBox.critical(self, "Statistics Error", f"Error getting backup statistics: {e}")
@@ -2241,17 +2470,25 @@ Operations:"""
     def on_vci_detected(self, vci):
         """VCI Interface erkannt"""
         try:
-            print(f"[VCI] Detected: {vci.name} on {vci.port}")
+            log.info("[VCI] Detected: %s on %s", vci.name, vci.port)
             
             # Show notification
-            from PySide6.QtWidgets import QSystemTrayIcon
-            if QSystemTrayIcon.isSystemTrayAvailable():
-                QSystemTrayIcon.showMessage(
+            if self._tray:
+                # Fenster-Icon kann leer sein: dann Anwendungs- bzw. Standard-Icon
+                icon = self.windowIcon()
+                if icon.isNull():
+                    icon = QApplication.windowIcon()
+                if icon.isNull():
+                    icon = self.style().standardIcon(QStyle.SP_ComputerIcon)
+                self._tray.setIcon(icon)
+                self._tray.show()
+                self._tray.showMessage(
                     "VCI Detected",
                     f"Found {vci.name} on {vci.port}",
                     QSystemTrayIcon.Information,
                     3000
                 )
+                self._tray_hide_timer.start(3000)
             
             # Try auto-connect for known good interfaces
             if vci.name in ["ELM327", "OpenPort 2.0"]:
@@ -2263,11 +2500,10 @@ Operations:"""
     def on_vci_connected(self, vci):
         """VCI Interface verbunden"""
         try:
-            print(f"[VCI] Connected: {vci.name} on {vci.port}")
+            log.info("[VCI] Connected: %s on %s", vci.name, vci.port)
             
             # Update status
-            if hasattr(self, 'status_bar'):
-                self.status_bar.showMessage(f"VCI Connected: {vci.name}", 5000)
+            self.status_bar.showMessage(f"VCI Connected: {vci.name}", 5000)
             
             # Show info dialog
             QMessageBox.information(
@@ -2282,11 +2518,10 @@ Operations:"""
     def on_vci_disconnected(self, vci):
         """VCI Interface getrennt"""
         try:
-            print(f"[VCI] Disconnected: {vci.name}")
+            log.info("[VCI] Disconnected: %s", vci.name)
             
             # Update status
-            if hasattr(self, 'status_bar'):
-                self.status_bar.showMessage(f"VCI Disconnected: {vci.name}", 3000)
+            self.status_bar.showMessage(f"VCI Disconnected: {vci.name}", 3000)
             
             # Show warning
             QMessageBox.warning(
@@ -2301,11 +2536,10 @@ Operations:"""
     def on_vci_status_changed(self, status):
         """VCI Status Update"""
         try:
-            print(f"[VCI] Status: {status}")
+            log.debug("[VCI] Status: %s", status)
             
             # Update status bar if available
-            if hasattr(self, 'status_bar'):
-                self.status_bar.showMessage(f"VCI: {status}", 2000)
+            self.status_bar.showMessage(f"VCI: {status}", 2000)
                 
         except Exception as e:
             print(f"[ERROR] VCI status handler failed: {e}")
@@ -2360,7 +2594,7 @@ Operations:"""
         
         self.ecu_search_input = QLineEdit()
         self.ecu_search_input.setPlaceholderText("Search by name, function, or supplier")
-        self.ecu_search_input.textChanged.connect(self.search_ecus)
+        self.ecu_search_input.textChanged.connect(self._schedule_ecu_search)
         search_layout.addWidget(self.ecu_search_input)
         
         ecu_layout.addLayout(search_layout)
@@ -2402,24 +2636,19 @@ Operations:"""
     def on_vin_input_changed(self, text):
         """VIN Input Validation"""
         try:
-            # Real-time validation
-            if len(text) == 17:
-                self.vin_input.setStyleSheet("border: 2px solid green;")
-            elif len(text) > 0:
-                self.vin_input.setStyleSheet("border: 2px solid orange;")
-            else:
-                self.vin_input.setStyleSheet("")
+            # Real-time validation - Stylesheet nur bei Zustandswechsel setzen
+            state = 'ok' if len(text) == 17 else ('partial' if text else 'empty')
+            if state != self._vin_last_state:
+                self.vin_input.setStyleSheet(_VIN_INPUT_STYLES[state])
+                self._vin_last_state = state
                 
         except Exception as e:
             print(f"[ERROR] VIN input validation failed: {e}")
     
+    @_require_cap('db', "VIN Decoder", "ECU/VIN Database not available")
     def decode_vin(self):
         """Decode VIN using database"""
         try:
-            if not self.ecu_vin_database:
-                QMessageBox.information(self, "VIN Decoder", "ECU/VIN Database not available")
-                return
-            
             vin = self.vin_input.text().strip().upper()
             if len(vin) != 17:
                 QMessageBox.warning(self, "Invalid VIN", "VIN must be exactly 17 characters")
@@ -2430,7 +2659,7 @@ Operations:"""
             
             if result.get('valid'):
                 # Format results
-                results_text = f"""VIN DECODE RESULTS:
+                parts = [f"""VIN DECODE RESULTS:
 
 VIN: {result['vin']}
 Valid: {result['valid']}
@@ -2450,28 +2679,29 @@ Type: {result['vehicle_info'].get('type', 'Unknown')}
 Engine Code: {result['vehicle_info'].get('engine_code', 'Unknown')}
 Body Style: {result['vehicle_info'].get('body_style', 'Unknown')}
 
-POSSIBLE VEHICLES:
-"""
+POSSIBLE VEHICLES:"""]
                 
                 possible_vehicles = result.get('possible_vehicles', [])
                 if possible_vehicles:
                     for vehicle in possible_vehicles:
-                        results_text += f"- {vehicle['info']['model']} {vehicle['info']['generation']} ({vehicle['info']['years']})\n"
+                        parts.append(f"- {vehicle['info']['model']} {vehicle['info']['generation']} ({vehicle['info']['years']})")
                 else:
-                    results_text += "- No specific vehicle matches found\n"
+                    parts.append("- No specific vehicle matches found")
                 
-                results_text += f"\nRECOMMENDED ECUs:\n"
+                parts.append("")
+                parts.append("RECOMMENDED ECUs:")
                 recommended_ecus = result.get('recommended_ecus', [])
                 if recommended_ecus:
                     for ecu in recommended_ecus:
                         required = "Required" if ecu['required'] else "Optional"
-                        results_text += f"- {ecu['address']}: {ecu['name']} ({required})\n"
+                        parts.append(f"- {ecu['address']}: {ecu['name']} ({required})")
                 else:
-                    results_text += "- No specific ECU recommendations\n"
+                    parts.append("- No specific ECU recommendations")
                 
-                results_text += f"\nDecoded: {result['decoded_date']}"
+                parts.append("")
+                parts.append(f"Decoded: {result['decoded_date']}")
                 
-                self.vin_results.setText(results_text)
+                self.vin_results.setText('\n'.join(parts))
                 
             else:
                 error_msg = result.get('error', 'Unknown error')
@@ -2486,32 +2716,75 @@ POSSIBLE VEHICLES:
             if not self.ecu_vin_database:
                 return
             
-            self.ecu_list.clear()
+            self._ecu_items.clear()
+            self._ecu_search_text.clear()
+            self._ecu_trigrams.clear()
             
-            for address, ecu in self.ecu_vin_database.ecu_definitions.items():
-                item_text = f"0x{address:X}: {ecu['name']} ({ecu['type']})"
-                item = QListWidgetItem(item_text)
-                item.setData(1, address)  # Store address
-                self.ecu_list.addItem(item)
+            self.ecu_list.setUpdatesEnabled(False)
+            try:
+                self.ecu_list.clear()
+                for address, ecu in self.ecu_vin_database.ecu_definitions.items():
+                    item_text = f"0x{address:X}: {ecu['name']} ({ecu['type']})"
+                    item = QListWidgetItem(item_text)
+                    item.setData(1, address)  # Store address
+                    item.setData(Qt.UserRole + 3, _format_ecu_details(address, ecu))
+                    self.ecu_list.addItem(item)
+                    self._index_ecu(address, ecu, item)
+            finally:
+                self.ecu_list.setUpdatesEnabled(True)
                 
         except Exception as e:
             print(f"[ERROR] Load ECU list failed: {e}")
     
+    def _index_ecu(self, address, ecu, item):
+        """ECU in den Trigramm-Suchindex aufnehmen"""
+        search_text = ' '.join([
+            f"0x{address:x}",
+            ecu.get('name', ''),
+            ecu.get('type', ''),
+            ' '.join(ecu.get('functions', [])),
+            ' '.join(ecu.get('suppliers', [])),
+        ]).lower()
+        
+        self._ecu_items[address] = item
+        self._ecu_search_text[address] = search_text
+        for i in range(len(search_text) - 2):
+            self._ecu_trigrams.setdefault(search_text[i:i + 3], set()).add(address)
+    
+    def _schedule_ecu_search(self, search_text):
+        """Suche bei jeder Eingabe neu terminieren (Debounce)"""
+        self._pending_ecu_search = search_text
+        self._ecu_search_timer.start()
+    
+    def _do_ecu_search(self):
+        """Terminierte ECU-Suche ausführen"""
+        self.search_ecus(self._pending_ecu_search)
+    
     def search_ecus(self, search_text):
         """Search ECUs in real-time"""
         try:
-            if not self.ecu_vin_database or not search_text:
-                self.load_ecu_list()
+            if not self.ecu_vin_database:
                 return
             
-            results = self.ecu_vin_database.search_ecus(search_text)
+            query = search_text.strip().lower()
+            if not query:
+                matches = self._ecu_items.keys()
+            else:
+                if len(query) >= 3:
+                    # Kandidaten über Trigramm-Schnittmenge, danach exakte Teilstring-Prüfung
+                    postings = [self._ecu_trigrams.get(query[i:i + 3], set()) for i in range(len(query) - 2)]
+                    candidates = set.intersection(*sorted(postings, key=len))
+                else:
+                    candidates = self._ecu_items.keys()
+                
+                matches = {address for address in candidates if query in self._ecu_search_text[address]}
             
-            self.ecu_list.clear()
-            for address, ecu, match_type in results:
-                item_text = f"0x{address:X}: {ecu['name']} ({ecu['type']}) - Match: {match_type}"
-                item = QListWidgetItem(item_text)
-                item.setData(1, address)
-                self.ecu_list.addItem(item)
+            self.ecu_list.setUpdatesEnabled(False)
+            try:
+                for address, item in self._ecu_items.items():
+                    item.setHidden(address not in matches)
+            finally:
+                self.ecu_list.setUpdatesEnabled(True)
                 
         except Exception as e:
             print(f"[ERROR] ECU search failed: {e}")
@@ -2523,39 +2796,8 @@ POSSIBLE VEHICLES:
             if not current_item or not self.ecu_vin_database:
                 return
             
-            ecu_address = current_item.data(1)
-            ecu = self.ecu_vin_database.get_ecu_by_address(ecu_address)
-            
-            if ecu:
-                # Format ECU details
-                details_text = f"""ECU DETAILS:
-
-Name: {ecu['name']}
-Short Name: {ecu['short_name']}
-Type: {ecu['type']}
-Address: 0x{ecu_address:X}
-
-PROTOCOLS:
-{', '.join(ecu['protocols'])}
-
-FUNCTIONS:
-"""
-                for func in ecu['functions']:
-                    details_text += f"- {func}\n"
-                
-                details_text += f"\nDATA IDENTIFIERS ({len(ecu['data_identifiers'])}):\n"
-                for data_id, description in ecu['data_identifiers'].items():
-                    details_text += f"- 0x{data_id:X}: {description}\n"
-                
-                details_text += f"\nSUPPLIERS:\n"
-                for supplier in ecu['suppliers']:
-                    details_text += f"- {supplier}\n"
-                
-                details_text += f"\nTYPICAL ADDRESSES:\n"
-                for addr in ecu['typical_addresses']:
-                    details_text += f"- 0x{addr:X}\n"
-                
-                self.ecu_details.setText(details_text)
+            # Details wurden beim Laden der Liste vorformatiert
+            self.ecu_details.setText(current_item.data(Qt.UserRole + 3) or "")
             
         except Exception as e:
             print(f"[ERROR] ECU selection failed: {e}")
@@ -2569,7 +2811,7 @@ FUNCTIONS:
             
             stats = self.ecu_vin_database.get_database_statistics()
             
-            stats_text = f"""Database Statistics:
+            parts = [f"""Database Statistics:
             
 Total ECUs: {stats['total_ecus']}
 Total Vehicles: {stats['total_vehicles']}
@@ -2577,16 +2819,21 @@ WMI Codes: {stats['total_wmi_codes']}
 Supported Brands: {len(stats['brands_supported'])}
 Suppliers: {len(stats['suppliers'])}
 
-ECU Types:"""
+ECU Types:"""]
             
             for ecu_type, count in stats['ecu_types'].items():
-                stats_text += f"\n- {ecu_type}: {count}"
+                parts.append(f"- {ecu_type}: {count}")
             
-            stats_text += f"\n\nBrands: {', '.join(stats['brands_supported'][:5])}"
+            brands_line = f"Brands: {', '.join(stats['brands_supported'][:5])}"
             if len(stats['brands_supported']) > 5:
-                stats_text += f" and {len(stats['brands_supported']) - 5} more..."
+                brands_line += f" and {len(stats['brands_supported']) - 5} more..."
+            parts.append("")
+            parts.append(brands_line)
             
-            self.db_stats_label.setText(stats_text)
+            stats_text = '\n'.join(parts)
+            if stats_text != self._last_db_stats_text:
+                self.db_stats_label.setText(stats_text)
+                self._last_db_stats_text = stats_text
             
         except Exception as e:
             print(f"[ERROR] Database stats update failed: {e}")
@@ -2650,6 +2897,7 @@ ECU Types:"""
         self.can_message_list.setReadOnly(True)
         self.can_message_list.setMaximumHeight(300)
         self.can_message_list.setFont(QFont("Courier", 9))
+        self.can_message_list.document().setMaximumBlockCount(CAN_LOG_MAX_LINES)
         can_layout.addWidget(self.can_message_list)
         
         layout.addWidget(can_group)
@@ -2679,11 +2927,13 @@ ECU Types:"""
         self.test_ecu_input = QLineEdit()
         self.test_ecu_input.setPlaceholderText("0x1A0")
         self.test_ecu_input.setMaxLength(6)
+        self.test_ecu_input.textChanged.connect(self.on_test_ecu_input_changed)
         ecu_test_layout.addWidget(self.test_ecu_input)
         
-        test_ecu_btn = QPushButton("Test ECU Communication")
-        test_ecu_btn.clicked.connect(self.test_ecu_communication)
-        ecu_test_layout.addWidget(test_ecu_btn)
+        self.test_ecu_btn = QPushButton("Test ECU Communication")
+        self.test_ecu_btn.clicked.connect(self.test_ecu_communication)
+        ecu_test_layout.addWidget(self.test_ecu_btn)
+        self._test_ecu_addr = 0x1A0  # Default engine ECU
         
         test_layout.addLayout(ecu_test_layout)
         
@@ -2701,17 +2951,13 @@ ECU Types:"""
         layout.addStretch()
         return widget
     
+    @_require_cap('vci', "Hardware VCI", "Hardware VCI interface not available")
     def connect_hardware_vci(self):
         """Connect to hardware VCI"""
         try:
-            if not self.hardware_vci:
-                QMessageBox.information(self, "Hardware VCI", "Hardware VCI interface not available")
-                return
-            
             # Check if VCI detection found any interfaces
-            if self.vci_detection and self.vci_detection.get_known_vcis():
-                known_vcis = self.vci_detection.get_known_vcis()
-                
+            known_vcis = self.vci_detection.get_known_vcis() if self.vci_detection else {}
+            if known_vcis:
                 # Use first available VCI for testing
                 vci_id, vci_info = next(iter(known_vcis.items()))
                 
@@ -2747,6 +2993,7 @@ ECU Types:"""
                 if success:
                     self.connect_hardware_btn.setEnabled(True)
                     self.disconnect_hardware_btn.setEnabled(False)
+                    self._status_cache['t'] = 0.0
                     self.update_hardware_status()
                     
         except Exception as e:
@@ -2754,9 +3001,24 @@ ECU Types:"""
     
     def clear_can_messages(self):
         """Clear CAN message display"""
-        if hasattr(self, 'can_message_list'):
+        self._can_log.clear()
+        if self.can_message_list is not None:
             self.can_message_list.clear()
     
+    def _throttle_refresh(self, cache, update):
+        """True wenn der letzte Refresh jünger als die TTL ist; der Aufruf wird dann einmalig nachgeholt"""
+        remaining = cache['t'] + _STATUS_CACHE_TTL - time.monotonic()
+        if remaining <= 0:
+            return False
+        if not cache['pending']:
+            cache['pending'] = True
+            
+            def retry():
+                cache['pending'] = False
+                update()
+            QTimer.singleShot(int(remaining * 1000) + 1, retry)
+        return True
+    
     def update_hardware_status(self):
         """Update hardware status display"""
         try:
@@ -2765,6 +3027,10 @@ ECU Types:"""
                     self.hardware_status_label.setText("Hardware VCI interface not available")
                 return
             
+            if self._throttle_refresh(self._status_cache, self.update_hardware_status):
+                return
+            now = time.monotonic()
+            
             status = self.hardware_vci.get_hardware_status()
             
             status_text = f"""Hardware VCI Status:
@@ -2777,9 +3043,12 @@ DLL Available: {status['dll_available']}
 Message Queues:
 - Pending Messages: {status['pending_messages']}
 - Received Messages: {status['received_messages']}"""
+            self._status_cache['t'] = now
             
-            if hasattr(self, 'hardware_status_label'):
+            # Label nur bei geändertem Text neu setzen (vermeidet Repaint)
+            if status_text != self._status_cache['v'] and hasattr(self, 'hardware_status_label'):
                 self.hardware_status_label.setText(status_text)
+                self._status_cache['v'] = status_text
                 
         except Exception as e:
             print(f"[ERROR] Hardware status update failed: {e}")
@@ -2792,6 +3061,10 @@ Message Queues:
                     self.timing_stats_label.setText("Hardware VCI interface not available")
                 return
             
+            if self._throttle_refresh(self._timing_cache, self.update_timing_stats):
+                return
+            now = time.monotonic()
+            
             stats = self.hardware_vci.get_timing_statistics()
             
             stats_text = f"""CAN-Bus Timing Statistics:
@@ -2810,13 +3083,29 @@ Timing Parameters:
 Last Activity:
 - Time since TX: {stats['time_since_last_tx']:.3f}s
 - Time since RX: {stats['time_since_last_rx']:.3f}s"""
+            self._timing_cache['t'] = now
             
-            if hasattr(self, 'timing_stats_label'):
+            # Label nur bei geändertem Text neu setzen (vermeidet Repaint)
+            if stats_text != self._timing_cache['v'] and hasattr(self, 'timing_stats_label'):
                 self.timing_stats_label.setText(stats_text)
+                self._timing_cache['v'] = stats_text
                 
         except Exception as e:
             print(f"[ERROR] Timing stats update failed: {e}")
     
+    def on_test_ecu_input_changed(self, text):
+        """ECU-Adresse bei Eingabe parsen und Test-Button entsprechend freigeben"""
+        text = text.strip()
+        if not text:
+            self._test_ecu_addr = 0x1A0  # Default engine ECU
+        else:
+            try:
+                self._test_ecu_addr = int(text, 16)
+            except ValueError:
+                self._test_ecu_addr = None
+        
+        self.test_ecu_btn.setEnabled(self._test_ecu_addr is not None)
+    
     def test_ecu_communication(self):
         """Test ECU communication via hardware VCI"""
         try:
@@ -2824,14 +3113,9 @@ Last Activity:
                 QMessageBox.warning(self, "Not Connected", "Hardware VCI not connected")
                 return
             
-            ecu_address_str = self.test_ecu_input.text().strip()
-            if not ecu_address_str:
-                ecu_address_str = "0x1A0"  # Default engine ECU
-            
-            try:
-                ecu_address = int(ecu_address_str, 16)
-            except ValueError:
-                QMessageBox.warning(self, "Invalid Address", "Invalid ECU address format")
+            # Adresse wurde bereits bei der Eingabe geprüft
+            ecu_address = self._test_ecu_addr
+            if ecu_address is None:
                 return
             
             # Send diagnostic session control (Service 0x10)
@@ -2839,10 +3123,7 @@ Last Activity:
             
             if can_msg:
                 self.add_can_message_to_display(can_msg)
-                QMessageBox.information(
-                    self, "Test Sent",
-                    f"Test message sent to ECU 0x{ecu_address:X}\nCheck message monitor for response"
-                )
+                self._notify_status(f"Test message sent to ECU 0x{ecu_address:X} - check message monitor for response")
             else:
                 QMessageBox.warning(self, "Send Failed", "Failed to send test message")
                 
@@ -2861,105 +3142,238 @@ Last Activity:
             
             if can_msg:
                 self.add_can_message_to_display(can_msg)
-                QMessageBox.information(
-                    self, "VIN Request Sent",
-                    "VIN read request sent to Engine ECU (0x1A0)\nCheck message monitor for response"
-                )
+                self._notify_status("VIN read request sent to Engine ECU (0x1A0) - check message monitor for response")
             else:
                 QMessageBox.warning(self, "Send Failed", "Failed to send VIN request")
                 
         except Exception as e:
             QMessageBox.critical(self, "VIN Read Error", f"VIN read failed: {e}")
     
+    def _notify_status(self, text, ms=3000):
+        """Nicht-blockierende Rückmeldung in der Statusleiste"""
+        self.status_bar.showMessage(text, ms)
+    
+    def _queue_status(self, text, ms=3000):
+        """Statusmeldung vormerken; schnelle Folgen werden zusammengefasst"""
+        self._statusbar_pending = (text, ms)
+        if not self._statusbar_timer.isActive():
+            self._statusbar_timer.start()
+    
+    def _flush_statusbar(self):
+        """Zuletzt vorgemerkte Statusmeldung anzeigen"""
+        pending, self._statusbar_pending = self._statusbar_pending, None
+        # Gleiche Meldung wird bereits angezeigt -> kein erneutes Zeichnen
+        if pending and pending[0] != self.status_bar.currentMessage():
+            self.status_bar.showMessage(*pending)
+    
     def add_can_message_to_display(self, can_msg):
         """Add CAN message to display"""
         try:
-            if not hasattr(self, 'can_message_list'):
+            if self.can_message_list is None:
                 return
             
-            timestamp = datetime.fromtimestamp(can_msg.timestamp).strftime("%H:%M:%S.%f")[:-3]
+            msg_time = can_msg.timestamp
+            timestamp = f"{time.strftime('%H:%M:%S', time.localtime(msg_time))}.{int(msg_time * 1000) % 1000:03d}"
             direction = "TX" if can_msg.direction == 'TX' else "RX"
             
-            msg_line = f"{timestamp} {direction} ID:0x{can_msg.msg_id:03X} DLC:{can_msg.dlc} Data:{can_msg.data.hex().upper()}"
+            msg_line = _format_can_line(timestamp, direction, can_msg.msg_id, can_msg.dlc, can_msg.data.hex().upper())
             
-            self.can_message_list.append(msg_line)
+            self._can_log.append(msg_line)
+            if not self._can_flush_timer.isActive():
+                self._can_flush_timer.start()
+                
+        except Exception as e:
+            print(f"[ERROR] Add CAN message failed: {e}")
+    
+    def _flush_can_buffer(self):
+        """Gepufferte CAN-Zeilen in einem Schritt anzeigen"""
+        try:
+            if not self._can_log or self.can_message_list is None:
+                return
+            
+            self.can_message_list.append('\n'.join(self._can_log))
+            self._can_log.clear()
             
             # Auto scroll if enabled
-            if hasattr(self, 'auto_scroll_check') and self.auto_scroll_check.isChecked():
+            if self.auto_scroll_check is not None and self.auto_scroll_check.isChecked():
                 scrollbar = self.can_message_list.verticalScrollBar()
                 scrollbar.setValue(scrollbar.maximum())
                 
         except Exception as e:
-            print(f"[ERROR] Add CAN message failed: {e}")
+            print(f"[ERROR] Flush CAN messages failed: {e}")
     
     # === Hardware VCI Signal Handlers ===
     
     def on_can_message_received(self, can_msg):
         """Handle received CAN message"""
         try:
-            print(f"[CAN RX] ID:0x{can_msg.msg_id:X} Data:{can_msg.data.hex().upper()}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[CAN RX] ID:0x%X Data:%s", can_msg.msg_id, can_msg.data.hex().upper())
             self.add_can_message_to_display(can_msg)
-            self.update_timing_stats()
+            
+            # Timing-Statistik höchstens alle 200 ms aktualisieren
+            self._schedule_timing_refresh()
             
         except Exception as e:
             print(f"[ERROR] CAN message received handler failed: {e}")
     
+    def _schedule_hw_refresh(self):
+        """Hardware-Status verzögert aktualisieren; Folgeereignisse werden zusammengefasst"""
+        if not self._hw_refresh_pending:
+            self._hw_refresh_pending = True
+            QTimer.singleShot(100, self._do_hw_refresh)
+    
+    def _do_hw_refresh(self):
+        """Verzögerte Hardware-Status-Aktualisierung"""
+        self._hw_refresh_pending = False
+        self._status_cache['t'] = 0.0
+        self.update_hardware_status()
+    
+    def _schedule_timing_refresh(self):
+        """Timing-Statistik verzögert aktualisieren; Folgeereignisse werden zusammengefasst"""
+        if not self._timing_refresh_pending:
+            self._timing_refresh_pending = True
+            QTimer.singleShot(200, self._do_timing_refresh)
+    
+    def _do_timing_refresh(self):
+        """Verzögerte Timing-Aktualisierung nach CAN-Empfang"""
+        self._timing_refresh_pending = False
+        self._timing_cache['t'] = 0.0
+        self.update_timing_stats()
+    
     def on_can_message_sent(self, can_msg):
         """Handle sent CAN message"""
         try:
-            print(f"[CAN TX] ID:0x{can_msg.msg_id:X} Data:{can_msg.data.hex().upper()}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[CAN TX] ID:0x%X Data:%s", can_msg.msg_id, can_msg.data.hex().upper())
             # Message already added to display by send function
             
         except Exception as e:
             print(f"[ERROR] CAN message sent handler failed: {e}")
     
-    def on_hardware_connection_changed(self, vci_type, connected):
-        """Handle hardware connection status change"""
+    def _push_hardware_event(self, event):
+        """Ereignis vormerken; Verarbeitung erfolgt gebündelt"""
+        self._hw_events.append(event)
+        if not self._hw_events_timer.isActive():
+            self._hw_events_timer.start()
+    
+    def _drain_hardware_events(self):
+        """Alle vorgemerkten Ereignisse in einem Durchlauf abarbeiten"""
+        events = list(self._hw_events)
+        self._hw_events.clear()
+        if events:
+            self.on_hardware_events_batch(events)
+    
+    def on_hardware_events_batch(self, events):
+        """Handle a batch of hardware connection / timing events"""
         try:
-            status = "connected" if connected else "disconnected"
-            print(f"[HARDWARE] {vci_type} {status}")
-            
-            self.update_hardware_status()
+            status_changed = False
+            timing_changed = False
+            last_message = None
+            
+            for kind, *args in events:
+                if kind == 'connection':
+                    vci_type, connected = args
+                    status = "connected" if connected else "disconnected"
+                    log.info("[HARDWARE] %s %s", vci_type, status)
+                    status_changed = True
+                    last_message = (f"Hardware VCI {vci_type} {status}", 5000)
+                elif kind == 'timing':
+                    message, actual_time = args
+                    log.info("[TIMING] Violation: %s (%.3fs)", message, actual_time)
+                    timing_changed = True
+                    # Show warning for critical violations
+                    if "timeout" in message.lower():
+                        last_message = (f"Timing violation: {message}", 3000)
+            
+            # Fenster nicht sichtbar: nur protokollieren, UI beim Wiederherstellen aktualisieren
+            if not self._ui_visible():
+                self._ui_refresh_deferred = True
+                return
             
-            if hasattr(self, 'status_bar'):
-                self.status_bar.showMessage(f"Hardware VCI {vci_type} {status}", 5000)
+            if status_changed:
+                self._schedule_hw_refresh()
+            if timing_changed:
+                self._schedule_timing_refresh()
+            if last_message:
+                self._queue_status(*last_message)
                 
         except Exception as e:
-            print(f"[ERROR] Hardware connection handler failed: {e}")
+            print(f"[ERROR] Hardware event batch handler failed: {e}")
+    
+    def _ui_visible(self):
+        """True wenn das Fenster sichtbar und nicht minimiert ist"""
+        return self.isVisible() and not self.isMinimized()
+    
+    def changeEvent(self, event):
+        """Ausgelassene UI-Aktualisierungen nach dem Wiederherstellen nachholen"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and self._ui_visible():
+            if self._ui_refresh_deferred:
+                self._ui_refresh_deferred = False
+                self._schedule_hw_refresh()
+                self._schedule_timing_refresh()
+            if self._pending_errors and not self._error_dialog_scheduled:
+                self._error_dialog_scheduled = True
+                QTimer.singleShot(0, self._show_aggregated_errors)
+    
+    def on_hardware_connection_changed(self, vci_type, connected):
+        """Handle hardware connection status change"""
+        self._push_hardware_event(('connection', vci_type, connected))
     
     def on_hardware_error(self, error):
         """Handle hardware error"""
         try:
-            print(f"[HARDWARE ERROR] {error.vci_type}: {error} (Code: {error.error_code})")
-            
-            QMessageBox.critical(
-                self, "Hardware Error",
-                f"Hardware VCI Error: {error}\n\n"
-                f"VCI Type: {error.vci_type}\n"
-                f"Error Code: {error.error_code}\n"
-                f"Time: {error.timestamp.strftime('%H:%M:%S')}"
-            )
+            log.error("[HARDWARE ERROR] %s: %s (Code: %s)", error.vci_type, error, error.error_code)
+            
+            # Dialog nicht sofort öffnen: gleiche Fehler zusammenfassen
+            key = (error.vci_type, error.error_code)
+            entry = self._pending_errors.get(key)
+            if entry:
+                entry[0] += 1
+                entry[1] = error
+            else:
+                self._pending_errors[key] = [1, error]
+            
+            if not self._error_dialog_scheduled:
+                self._error_dialog_scheduled = True
+                QTimer.singleShot(250, self._show_aggregated_errors)
             
         except Exception as e:
             print(f"[ERROR] Hardware error handler failed: {e}")
     
-    def on_timing_violation(self, message, actual_time):
-        """Handle timing violation"""
+    def _show_aggregated_errors(self):
+        """Gesammelte Hardware-Fehler in einem Dialog anzeigen"""
+        self._error_dialog_scheduled = False
+        # Bei minimiertem Fenster gesammelt lassen; changeEvent zeigt sie später
+        if not self._ui_visible():
+            return
+        errors, self._pending_errors = self._pending_errors, {}
+        if not errors:
+            return
+        
         try:
-            print(f"[TIMING] Violation: {message} ({actual_time:.3f}s)")
+            parts = []
+            for (vci_type, error_code), (count, error) in errors.items():
+                repeat = f" (x{count})" if count > 1 else ""
+                parts.append(
+                    f"Hardware VCI Error: {error}{repeat}\n"
+                    f"VCI Type: {vci_type}\n"
+                    f"Error Code: {error_code}\n"
+                    f"Time: {_fmt_hhmmss(int(error.timestamp.timestamp()))}"
+                )
             
-            # Update timing stats
-            self.update_timing_stats()
+            QMessageBox.critical(self, "Hardware Error", "\n\n".join(parts))
             
-            # Show warning for critical violations
-            if "timeout" in message.lower():
-                if hasattr(self, 'status_bar'):
-                    self.status_bar.showMessage(f"Timing violation: {message}", 3000)
-                    
         except Exception as e:
-            print(f"[ERROR] Timing violation handler failed: {e}")
+            print(f"[ERROR] Show hardware errors failed: {e}")
+    
+    def on_timing_violation(self, message, actual_time):
+        """Handle timing violation"""
+        self._push_hardware_event(('timing', message, actual_time))
 
     # Professional Features Tab Methods
+    @_cached_tab('live_graphs')
     def create_live_graphs_tab(self):
         """Live-Graphen Tab erstellen"""
         widget = QWidget()
@@ -2967,7 +3381,7 @@ Last Activity:
         
         # Header
         header = QLabel("📊 Live ECU Parameter Monitoring")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #0066cc; padding: 10px;")
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         if REALTIME_GRAPHS_AVAILABLE:
@@ -2979,20 +3393,19 @@ Last Activity:
                 # Quick-Start Button
                 start_btn = QPushButton("🚀 Live-Monitoring starten")
                 start_btn.clicked.connect(self.start_live_monitoring)
-                start_btn.setStyleSheet("QPushButton { background-color: #0066cc; color: white; font-weight: bold; padding: 8px; }")
+                start_btn.setStyleSheet(_PRIMARY_BTN_CSS)
                 layout.addWidget(start_btn)
                 
             except Exception as e:
                 error_label = QLabel(f"❌ Live-Graphen Fehler: {str(e)}")
-                error_label.setStyleSheet("color: #d13438; padding: 10px;")
+                error_label.setStyleSheet(_ERROR_CSS)
                 layout.addWidget(error_label)
         else:
-            info_label = QLabel("⚠️ Live-Graphen nicht verfügbar\n\nBenötigt: pyqtgraph, numpy")
-            info_label.setStyleSheet("color: #ff8c00; padding: 20px; font-size: 12px;")
-            layout.addWidget(info_label)
+            layout.addWidget(_missing_feature_label('live_graphs'))
             
         return widget
     
+    @_cached_tab('pdf_reports')
     def create_pdf_reports_tab(self):
         """PDF-Reports Tab erstellen"""
         widget = QWidget()
@@ -3000,7 +3413,7 @@ Last Activity:
         
         # Header
         header = QLabel("📄 Professional PDF Reports")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #0066cc; padding: 10px;")
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         if PDF_REPORTS_AVAILABLE:
@@ -3041,19 +3454,18 @@ Last Activity:
             
             generate_btn = QPushButton("📄 Report erstellen")
             generate_btn.clicked.connect(self.generate_pdf_report)
-            generate_btn.setStyleSheet("QPushButton { background-color: #00d084; color: white; font-weight: bold; padding: 8px; }")
+            generate_btn.setStyleSheet(_SUCCESS_BTN_CSS)
             button_layout.addWidget(generate_btn)
             
             layout.addLayout(button_layout)
             
         else:
-            info_label = QLabel("⚠️ PDF-Reports nicht verfügbar\n\nBenötigt: reportlab, matplotlib")
-            info_label.setStyleSheet("color: #ff8c00; padding: 20px; font-size: 12px;")
-            layout.addWidget(info_label)
+            layout.addWidget(_missing_feature_label('pdf_reports'))
             
         layout.addStretch()
         return widget
     
+    @_cached_tab('coding_assistant')
     def create_coding_assistant_tab(self):
         """ECU Coding Assistant Tab erstellen"""
         widget = QWidget()
@@ -3061,7 +3473,7 @@ Last Activity:
         
         # Header
         header = QLabel("🛠️ ECU Coding Assistant")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #0066cc; padding: 10px;")
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         if CODING_ASSISTANT_AVAILABLE:
@@ -3072,15 +3484,14 @@ Last Activity:
                 
             except Exception as e:
                 error_label = QLabel(f"❌ Coding Assistant Fehler: {str(e)}")
-                error_label.setStyleSheet("color: #d13438; padding: 10px;")
+                error_label.setStyleSheet(_ERROR_CSS)
                 layout.addWidget(error_label)
         else:
-            info_label = QLabel("⚠️ ECU Coding Assistant nicht verfügbar\n\nBenötigt: CodingAssistant Modul")
-            info_label.setStyleSheet("color: #ff8c00; padding: 20px; font-size: 12px;")
-            layout.addWidget(info_label)
+            layout.addWidget(_missing_feature_label('coding_assistant'))
             
         return widget
     
+    @_cached_tab('flash_manager')
     def create_flash_manager_tab(self):
         """Flash Manager Tab erstellen"""
         widget = QWidget()
@@ -3088,12 +3499,12 @@ Last Activity:
         
         # Header
         header = QLabel("💾 ECU Flash/Update Manager")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #0066cc; padding: 10px;")
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         # Warnung
         warning = QLabel("⚠️ WARNUNG: ECU-Flash kann bei Fehlern zu irreparablen Schäden führen!")
-        warning.setStyleSheet("background-color: #fff3cd; color: #856404; border: 1px solid #ffeaa7; padding: 10px; border-radius: 4px;")
+        warning.setStyleSheet(_WARNING_CSS)
         layout.addWidget(warning)
         
         if FLASH_MANAGER_AVAILABLE:
@@ -3104,15 +3515,14 @@ Last Activity:
                 
             except Exception as e:
                 error_label = QLabel(f"❌ Flash Manager Fehler: {str(e)}")
-                error_label.setStyleSheet("color: #d13438; padding: 10px;")
+                error_label.setStyleSheet(_ERROR_CSS)
                 layout.addWidget(error_label)
         else:
-            info_label = QLabel("⚠️ Flash Manager nicht verfügbar\n\nBenötigt: FlashUpdateManager Modul")
-            info_label.setStyleSheet("color: #ff8c00; padding: 20px; font-size: 12px;")
-            layout.addWidget(info_label)
+            layout.addWidget(_missing_feature_label('flash_manager'))
             
         return widget
     
+    @_cached_tab('config_manager')
     def create_config_manager_tab(self):
         """PSA Config Manager Tab erstellen"""
         widget = QWidget()
@@ -3120,12 +3530,12 @@ Last Activity:
         
         # Header
         header = QLabel("PSA Config Manager - ECHTE .nac/.cmb Dateien")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #0066cc; padding: 10px;")
+        header.setStyleSheet(_HEADER_CSS)
         layout.addWidget(header)
         
         # Info
         info = QLabel("Arbeitet mit echten PSA/Stellantis Konfigurationsdateien aus dem Configs-Verzeichnis")
-        info.setStyleSheet("background-color: #e8f4fd; color: #0c5460; border: 1px solid #bee5eb; padding: 10px; border-radius: 4px;")
+        info.setStyleSheet(_INFO_CSS)
         layout.addWidget(info)
         
         if CONFIG_MANAGER_AVAILABLE:
@@ -3136,12 +3546,10 @@ Last Activity:
                 
             except Exception as e:
                 error_label = QLabel(f"❌ Config Manager Fehler: {str(e)}")
-                error_label.setStyleSheet("color: #d13438; padding: 10px;")
+                error_label.setStyleSheet(_ERROR_CSS)
                 layout.addWidget(error_label)
         else:
-            info_label = QLabel("⚠️ Config Manager nicht verfügbar\n\nBenötigt: RealConfigManager Modul")
-            info_label.setStyleSheet("color: #ff8c00; padding: 20px; font-size: 12px;")
-            layout.addWidget(info_label)
+            layout.addWidget(_missing_feature_label('config_manager'))
             
         return widget
     
@@ -3158,10 +3566,13 @@ Last Activity:
     
     def generate_pdf_report(self):
         """PDF-Report generieren"""
+        global _create_sample_report
         if PDF_REPORTS_AVAILABLE:
             try:
-                from PDFReportGenerator import create_sample_report
-                success, message, filename = create_sample_report()
+                if _create_sample_report is None:
+                    from PDFReportGenerator import create_sample_report
+                    _create_sample_report = create_sample_report
+                success, message, filename = _create_sample_report()
                 
                 if success:
                     QMessageBox.information(
@@ -5,14 +5,33 @@ Automatische ECU-Erkennung und intelligente JSON-Auto-Loading
 """
 
 import os
+import sys
 import json
 import time
+import mmap
+import random
+import itertools
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+from functools import lru_cache
 import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
 try:
     from PySide6.QtCore import QThread, Signal, QTimer, Qt
     from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
@@ -21,7 +40,9 @@ try:
     QT_FRAMEWORK = "PySide6"
 except ImportError:
     try:
-        from qt_compat import *
+        from qt_compat import (QThread, Signal, QTimer, Qt, QWidget, QVBoxLayout, QHBoxLayout,
+                               QLabel, QPushButton, QProgressBar, QListWidget, QListWidgetItem,
+                               QTextEdit, QComboBox, QCheckBox, QGroupBox)
         QT_FRAMEWORK = "qt_compat"
     except ImportError:
         from PyQt5.QtCore import QThread, pyqtSignal as Signal, QTimer, Qt
@@ -30,7 +51,103 @@ except ImportError:
                                    QTextEdit, QComboBox, QCheckBox, QGroupBox)
         QT_FRAMEWORK = "PyQt5"
 
-@dataclass
+# Manufacturer mapping (WMI -> Hersteller)
+_MANUFACTURER_MAP = {
+    "VF7": "Peugeot",
+    "VF3": "Peugeot", 
+    "VF6": "Renault",
+    "WDB": "Mercedes",
+    "WBA": "BMW",
+    "ZFA": "Fiat"
+}
+
+# Jahr-Dekodierung (vereinfacht)
+_YEAR_MAP = {
+    "L": 2020, "M": 2021, "N": 2022, "P": 2023, 
+    "R": 2024, "S": 2025, "T": 2026
+}
+
+
+@lru_cache(maxsize=128)
+def _parse_vin(vin: str) -> Tuple[str, int, str]:
+    """VIN-Parsing (vereinfacht): (Hersteller, Baujahr, Plattform-Code)"""
+    if len(vin) < 10:
+        raise ValueError(f"VIN zu kurz ({len(vin)} Zeichen)")
+    
+    manufacturer = _MANUFACTURER_MAP.get(vin[:3], "Unknown")
+    year = _YEAR_MAP.get(vin[9], 2020)
+    return manufacturer, year, vin[3:8]
+
+
+# Simulierte Antwortzeiten ohne Hardware (deterministisch, Ringpuffer); 0.0 = keine Antwort
+_SIM_TABLE_SIZE = 1024
+_sim_rng = random.Random(42)
+_SIM_TIMES = tuple(
+    _sim_rng.uniform(8.0, 25.0) if _sim_rng.random() > 0.3 else 0.0
+    for _ in range(_SIM_TABLE_SIZE)
+)
+_SIM_IDX = itertools.count()
+del _sim_rng
+
+# Ab dieser Dateigröße werden JSON-Metadaten gestreamt statt komplett geladen
+_STREAM_PARSE_MIN_SIZE = 32 * 1024
+_JSON_META_KEYS = ("name", "tx_id", "protocol", "rx_id")
+_JSON_SCALAR_EVENTS = ("string", "number", "boolean", "null")
+_JSON_ZONE_ITEM_EVENTS = ("start_map", "start_array") + _JSON_SCALAR_EVENTS
+
+# Format/Logik-Version des JSON-Index Caches; erhöhen wenn sich die abgeleiteten
+# Metadaten (z.B. Plattform-Erkennung) ändern, alte Caches werden dann verworfen
+_JSON_INDEX_VERSION = 2
+
+# Cache-Verzeichnis des Benutzers (wie qt_compat): %LOCALAPPDATA% bzw. $XDG_CACHE_HOME / ~/.cache
+if sys.platform == "win32":
+    _CACHE_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "PyPSADiag")
+else:
+    _CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "pypsadiag")
+
+# Ab dieser Dateigröße wird für orjson per mmap gelesen statt die Datei zu kopieren
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Metadaten-Felder mit wenigen, oft wiederholten Werten (werden interniert)
+_INTERNED_CONFIG_KEYS = ("protocol", "platform", "rx_id")
+
+# Bekannte Plattform-Identifikatoren in Pfaden (Reihenfolge = Priorität innerhalb eines Pfadteils)
+_PLATFORMS = ("PSA", "FIAT", "OPEL", "DS", "PEUGEOT", "CITROEN", "ALFA", "JEEP")
+
+
+def _platform_for_part(part: str) -> Optional[str]:
+    """Erste Plattform (nach Priorität), die im Pfadteil vorkommt"""
+    part_upper = part.upper()
+    for platform in _PLATFORMS:
+        if platform in part_upper:
+            return platform
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _platform_for_dir(dir_path: str) -> Optional[str]:
+    """Plattform aus einem Verzeichnispfad (Geschwister-Dateien teilen das Ergebnis)"""
+    for part in Path(dir_path).parts:
+        platform = _platform_for_part(part)
+        if platform:
+            return platform
+    return None
+
+
+def _iter_json_files(directory: str):
+    """Rekursiver os.scandir-Durchlauf, liefert DirEntry aller *.json Dateien"""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_json_files(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield entry
+    except OSError as e:
+        print(f"[DISCOVERY] Verzeichnis nicht lesbar {directory}: {e}")
+
+
+@dataclass(slots=True)
 class ECUDiscoveryResult:
     """Ergebnis einer ECU-Discovery"""
     ecu_id: str
@@ -43,7 +160,7 @@ class ECUDiscoveryResult:
     suggested_json: Optional[str] = None
     additional_info: Dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class VehicleProfile:
     """Fahrzeugprofil basierend auf VIN-Analyse"""
     vin: str
@@ -54,6 +171,15 @@ class VehicleProfile:
     expected_ecus: List[str] = field(default_factory=list)
     recommended_configs: List[str] = field(default_factory=list)
 
+# Feldnamen einmal bestimmen; Signale bekommen daraus gebaute Dicts
+_ECU_RESULT_FIELDS = tuple(f.name for f in fields(ECUDiscoveryResult))
+_VEHICLE_PROFILE_FIELDS = tuple(f.name for f in fields(VehicleProfile))
+
+
+def _as_signal_dict(obj, field_names: Tuple[str, ...]) -> Dict:
+    """Dataclass-Instanz (mit __slots__) als Dict für Qt-Signale"""
+    return {name: getattr(obj, name) for name in field_names}
+
 class SmartECUAutoDiscovery(QThread):
     """Intelligente ECU-Discovery mit automatischer JSON-Zuordnung"""
     
@@ -70,6 +196,7 @@ class SmartECUAutoDiscovery(QThread):
         
         self.serial_controller = serial_controller
         self.json_directory = Path("json")
+        self.json_cache_file = Path(_CACHE_DIR) / "discovery_index.json"
         self.discovered_ecus = []
         self.vehicle_profile = None
         self.discovery_active = False
@@ -92,11 +219,19 @@ class SmartECUAutoDiscovery(QThread):
             "1E0": {"name": "Gateway", "protocol": "uds", "rx_offset": 0x400},
         }
         
+        # Vorberechnete Integer-Adressen mit fertigen TX/RX-Strings für den Scan
+        self._common_int = {
+            int(k, 16): {**v, "tx_id_str": k, "rx_id_str": format(int(k, 16) + v["rx_offset"], 'X')}
+            for k, v in self.common_ecu_addresses.items()
+        }
+        
         self.load_json_database()
     
     def load_json_database(self):
         """Lädt JSON-Datei Datenbank für intelligente Zuordnung"""
         self.json_database = {}
+        self.json_database_int = {}
+        self._configs_by_platform = {}
         
         if not self.json_directory.exists():
             print("[DISCOVERY] JSON-Verzeichnis nicht gefunden")
@@ -104,50 +239,156 @@ class SmartECUAutoDiscovery(QThread):
         
         print("[DISCOVERY] Lade JSON-Datenbank...")
         json_count = 0
+        parsed_count = 0
         
-        for json_file in self.json_directory.rglob("*.json"):
+        # Index der letzten Ladung: Pfad -> [mtime, size, Metadaten oder None]
+        cached_index = self._load_cached_index(self.json_cache_file)
+        new_index = {}
+        
+        for entry in _iter_json_files(str(self.json_directory)):
+            file_path = entry.path
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    if "name" in data and "tx_id" in data:
-                        ecu_name = data["name"]
-                        tx_id = data["tx_id"]
-                        
-                        # Index nach TX-ID
-                        if tx_id not in self.json_database:
-                            self.json_database[tx_id] = []
-                        
-                        self.json_database[tx_id].append({
-                            "path": str(json_file),
-                            "name": ecu_name,
-                            "protocol": data.get("protocol", "unknown"),
-                            "rx_id": data.get("rx_id", ""),
-                            "zones": len(data.get("zones", {})),
-                            "platform": self.extract_platform_from_path(json_file)
-                        })
-                        
-                        json_count += 1
+                stat = entry.stat()
+                cached = cached_index.get(file_path)
+                
+                # Nur geänderte oder neue Dateien parsen
+                if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                    config = cached[2]
+                else:
+                    config = self._read_json_metadata(file_path, stat.st_size)
+                    parsed_count += 1
+                
+                new_index[file_path] = [stat.st_mtime, stat.st_size, config]
+                
+                if config:
+                    # Index nach TX-ID; Großschreibung für die Bewertung einmal vorberechnen
+                    db_entry = {k: v for k, v in config.items() if k != "tx_id"}
+                    db_entry["name_upper"] = db_entry["name"].upper()
+                    # Wiederholte Werte teilen sich ein String-Objekt
+                    for key in _INTERNED_CONFIG_KEYS:
+                        if isinstance(db_entry[key], str):
+                            db_entry[key] = sys.intern(db_entry[key])
+                    self.json_database.setdefault(config["tx_id"], []).append(db_entry)
+                    json_count += 1
                         
             except Exception as e:
-                print(f"[DISCOVERY] Fehler beim Laden von {json_file}: {e}")
+                print(f"[DISCOVERY] Fehler beim Laden von {file_path}: {e}")
+        
+        if new_index != cached_index:
+            self._save_cached_index(self.json_cache_file, new_index)
+        
+        # Zusätzlicher Index nach numerischer TX-ID (gleiche Listen, unabhängig von Schreibweise)
+        for tx_id, configs in self.json_database.items():
+            try:
+                self.json_database_int.setdefault(int(tx_id, 16), []).extend(configs)
+            except (TypeError, ValueError):
+                continue
+        
+        # Konfigurationspfade nach Plattform für find_matching_configs
+        for configs in self.json_database.values():
+            for config in configs:
+                self._configs_by_platform.setdefault(config["platform"], []).append(config["path"])
         
-        print(f"[DISCOVERY] {json_count} JSON-Dateien in Datenbank geladen")
+        print(f"[DISCOVERY] {json_count} JSON-Dateien in Datenbank geladen ({parsed_count} neu eingelesen)")
     
-    def extract_platform_from_path(self, json_path: Path) -> str:
-        """Extrahiert Fahrzeugplattform aus JSON-Pfad"""
-        path_parts = json_path.parts
+    def _read_json_metadata(self, json_file: str, file_size: int = 0) -> Optional[Dict]:
+        """Liest die für die Zuordnung benötigten Metadaten einer JSON-Datei"""
+        if IJSON_AVAILABLE and file_size >= _STREAM_PARSE_MIN_SIZE:
+            data, zone_count = self._stream_json_metadata(json_file)
+        else:
+            data = self._load_json_file(json_file, file_size)
+            zone_count = len(data.get("zones", {})) if isinstance(data, dict) else 0
         
-        # Suche nach bekannten Plattform-Identifikatoren
-        platforms = ["PSA", "FIAT", "OPEL", "DS", "PEUGEOT", "CITROEN", "ALFA", "JEEP"]
+        if "name" not in data or "tx_id" not in data:
+            return None
         
-        for part in path_parts:
-            part_upper = part.upper()
-            for platform in platforms:
-                if platform in part_upper:
-                    return platform
+        return {
+            "tx_id": data["tx_id"],
+            "path": json_file,
+            "name": data["name"],
+            "protocol": data.get("protocol", "unknown"),
+            "rx_id": data.get("rx_id", ""),
+            "zones": zone_count,
+            "platform": self.extract_platform_from_path(json_file)
+        }
+    
+    @staticmethod
+    def _load_json_file(json_file: str, file_size: int):
+        """Lädt eine JSON-Datei, mit orjson (ggf. über mmap) falls installiert"""
+        if ORJSON_AVAILABLE:
+            try:
+                if file_size >= _MMAP_MIN_SIZE:
+                    with open(json_file, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                            memoryview(mm) as view:
+                        return orjson.loads(view)
+                with open(json_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                pass  # z.B. NaN-Werte: vom Standard-Parser erneut versuchen lassen
+        
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _stream_json_metadata(json_file: str) -> Tuple[Dict, int]:
+        """Liest Top-Level Metadaten und zählt Zonen per ijson, ohne die Zonen zu laden"""
+        data = {}
+        zone_count = 0
+        
+        with open(json_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix in _JSON_META_KEYS and event in _JSON_SCALAR_EVENTS:
+                    data[prefix] = value
+                elif prefix == "zones" and event == "map_key":
+                    zone_count += 1
+                elif prefix == "zones.item" and event in _JSON_ZONE_ITEM_EVENTS:
+                    zone_count += 1
+        
+        return data, zone_count
+    
+    def _load_cached_index(self, cache_path: Path) -> Dict:
+        """Lädt den gespeicherten JSON-Index (leer falls nicht vorhanden/ungültig/andere Version)"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[DISCOVERY] JSON-Index Cache ungültig, wird neu erstellt: {e}")
+            return {}
+        
+        if not isinstance(data, dict) or data.get("version") != _JSON_INDEX_VERSION \
+                or data.get("json_directory") != str(self.json_directory.resolve()):
+            return {}
+        index = data.get("files")
+        return index if isinstance(index, dict) else {}
+    
+    def _save_cached_index(self, cache_path: Path, index: Dict):
+        """Speichert den JSON-Index atomar (temp-Datei + os.replace)"""
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(tmp_path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": _JSON_INDEX_VERSION,
+                    "json_directory": str(self.json_directory.resolve()),
+                    "files": index,
+                }, f, default=str)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"[DISCOVERY] JSON-Index Cache konnte nicht gespeichert werden: {e}")
+    
+    def extract_platform_from_path(self, json_path) -> str:
+        """Extrahiert Fahrzeugplattform aus JSON-Pfad"""
+        dir_path, file_name = os.path.split(str(json_path))
         
-        return "UNKNOWN"
+        # Pfadteile von vorne nach hinten: Verzeichnis zuerst (gecacht), danach Dateiname
+        platform = _platform_for_dir(dir_path)
+        if platform:
+            return platform
+        
+        return _platform_for_part(file_name) or "UNKNOWN"
     
     def start_discovery(self, vin: str = None, scan_mode: str = "smart"):
         """Startet ECU-Discovery"""
@@ -175,29 +416,7 @@ class SmartECUAutoDiscovery(QThread):
         print(f"[DISCOVERY] Analysiere VIN: {vin}")
         
         try:
-            # VIN-Parsing (vereinfacht)
-            manufacturer_code = vin[:3]
-            platform_code = vin[3:8]
-            year_code = vin[9]
-            
-            # Manufacturer mapping
-            manufacturer_map = {
-                "VF7": "Peugeot",
-                "VF3": "Peugeot", 
-                "VF6": "Renault",
-                "WDB": "Mercedes",
-                "WBA": "BMW",
-                "ZFA": "Fiat"
-            }
-            
-            manufacturer = manufacturer_map.get(manufacturer_code, "Unknown")
-            
-            # Jahr-Dekodierung (vereinfacht)
-            year_map = {
-                "L": 2020, "M": 2021, "N": 2022, "P": 2023, 
-                "R": 2024, "S": 2025, "T": 2026
-            }
-            year = year_map.get(year_code, 2020)
+            manufacturer, year, platform_code = _parse_vin(vin)
             
             self.vehicle_profile = VehicleProfile(
                 vin=vin,
@@ -212,7 +431,7 @@ class SmartECUAutoDiscovery(QThread):
                 self.vehicle_profile.expected_ecus = ["BSI", "NAC", "ESP", "Engine", "Climate"]
                 self.vehicle_profile.recommended_configs = self.find_matching_configs(manufacturer, year)
             
-            self.vehicle_identified.emit(self.vehicle_profile.__dict__)
+            self.vehicle_identified.emit(_as_signal_dict(self.vehicle_profile, _VEHICLE_PROFILE_FIELDS))
             print(f"[DISCOVERY] Fahrzeug identifiziert: {manufacturer} ({year})")
             
         except Exception as e:
@@ -220,17 +439,8 @@ class SmartECUAutoDiscovery(QThread):
     
     def find_matching_configs(self, manufacturer: str, year: int) -> List[str]:
         """Findet passende Konfigurationsdateien"""
-        matching_configs = []
-        
-        for tx_id, configs in self.json_database.items():
-            for config in configs:
-                config_path = Path(config["path"])
-                
-                # Platform-basierte Filterung
-                if manufacturer.upper() in config_path.parts[0].upper():
-                    matching_configs.append(config["path"])
-        
-        return matching_configs[:10]  # Top 10
+        # Platform-basierte Filterung über den beim Laden erstellten Index
+        return self._configs_by_platform.get(manufacturer.upper(), [])[:10]  # Top 10
     
     def run(self):
         """Hauptschleife für ECU-Discovery"""
@@ -257,7 +467,7 @@ class SmartECUAutoDiscovery(QThread):
                 self.calculate_confidence_scores()
             
             self.discovery_progress.emit(100, "Discovery completed!")
-            self.discovery_completed.emit([ecu.__dict__ for ecu in self.discovered_ecus])
+            self.discovery_completed.emit([_as_signal_dict(ecu, _ECU_RESULT_FIELDS) for ecu in self.discovered_ecus])
             
         except Exception as e:
             print(f"[DISCOVERY] Discovery-Fehler: {e}")
@@ -268,34 +478,75 @@ class SmartECUAutoDiscovery(QThread):
         """Scannt bekannte ECU-Adressen"""
         print("[DISCOVERY] Scanne bekannte ECU-Adressen...")
         
-        for tx_id, ecu_info in self.common_ecu_addresses.items():
+        # Adapter mit Batch-Unterstützung: alle Tester-Present Anfragen in einem Durchgang
+        send_batch = getattr(self.serial_controller, "sendBatch", None)
+        if send_batch and self.serial_controller.isOpen():
+            try:
+                self.scan_common_ecus_batch(send_batch)
+                return
+            except Exception as e:
+                print(f"[DISCOVERY] Batch-Scan fehlgeschlagen, scanne einzeln: {e}")
+        
+        for ecu_info in self._common_int.values():
             if not self.discovery_active:
                 break
-                
+            
+            tx_id = ecu_info["tx_id_str"]
             try:
                 response_time = self.test_ecu_communication(tx_id, ecu_info)
                 
                 if response_time > 0:
-                    rx_id = hex(int(tx_id, 16) + ecu_info["rx_offset"])[2:].upper()
-                    
-                    ecu_result = ECUDiscoveryResult(
-                        ecu_id=tx_id,
-                        name=ecu_info["name"],
-                        protocol=ecu_info["protocol"],
-                        tx_id=tx_id,
-                        rx_id=rx_id,
-                        response_time=response_time,
-                        confidence_score=0.8  # Hoch für bekannte ECUs
-                    )
-                    
-                    self.discovered_ecus.append(ecu_result)
-                    self.ecu_discovered.emit(ecu_result.__dict__)
-                    print(f"[DISCOVERY] ✅ Gefunden: {ecu_info['name']} ({tx_id})")
+                    self.add_common_ecu(ecu_info, response_time)
                     
             except Exception as e:
                 print(f"[DISCOVERY] Fehler bei {tx_id}: {e}")
                 continue
     
+    def scan_common_ecus_batch(self, send_batch):
+        """Scannt bekannte ECU-Adressen mit einem einzigen Schreibvorgang"""
+        ecu_infos = list(self._common_int.values())
+        
+        # Pro ECU: Header setzen (>TX:RX), dann Tester Present (3E00)
+        commands = []
+        for ecu_info in ecu_infos:
+            commands.append(f">{ecu_info['tx_id_str']}:{ecu_info['rx_id_str']}")
+            commands.append("3E00")
+        
+        start_time = time.time()
+        responses = send_batch(commands)
+        # Einzelzeiten sind im Batch nicht messbar - Mittelwert pro ECU
+        response_time = (time.time() - start_time) * 1000 / len(ecu_infos)
+        
+        if not self.discovery_active:
+            return
+        
+        # Jede ECU hat ein (Header, 3E00) Antwortpaar; bestätigt ein Header nicht mit "OK",
+        # ist die Zuordnung der 3E00-Antworten nicht verlässlich -> Einzelscan durch den Aufrufer
+        if len(responses) != len(commands) or any(r != "OK" for r in responses[0::2]):
+            raise ValueError(f"Unerwartete Header-Antworten im Batch: {responses[0::2]}")
+        
+        for ecu_info, response in zip(ecu_infos, responses[1::2]):
+            if response and "7E" in response:  # Positive Response
+                self.add_common_ecu(ecu_info, response_time)
+    
+    def add_common_ecu(self, ecu_info: Dict, response_time: float):
+        """Übernimmt eine antwortende bekannte ECU in die Ergebnisliste"""
+        tx_id = ecu_info["tx_id_str"]
+        
+        ecu_result = ECUDiscoveryResult(
+            ecu_id=tx_id,
+            name=ecu_info["name"],
+            protocol=ecu_info["protocol"],
+            tx_id=tx_id,
+            rx_id=ecu_info["rx_id_str"],
+            response_time=response_time,
+            confidence_score=0.8  # Hoch für bekannte ECUs
+        )
+        
+        self.discovered_ecus.append(ecu_result)
+        self.ecu_discovered.emit(_as_signal_dict(ecu_result, _ECU_RESULT_FIELDS))
+        print(f"[DISCOVERY] ✅ Gefunden: {ecu_info['name']} ({tx_id})")
+    
     def scan_address_ranges(self):
         """Scannt Adressbereiche für unbekannte ECUs"""
         print("[DISCOVERY] Scanne Adressbereiche...")
@@ -317,31 +568,48 @@ class SmartECUAutoDiscovery(QThread):
                 name=ecu_data["name"],
                 protocol=ecu_data["protocol"],
                 tx_id=ecu_data["tx_id"],
-                rx_id=hex(int(ecu_data["tx_id"], 16) + 0x400)[2:].upper(),
+                rx_id=format(int(ecu_data["tx_id"], 16) + 0x400, 'X'),
                 response_time=response_time,
                 confidence_score=0.6  # Niedrigere Konfidenz für unbekannte
             )
             
             self.discovered_ecus.append(ecu_result)
-            self.ecu_discovered.emit(ecu_result.__dict__)
+            self.ecu_discovered.emit(_as_signal_dict(ecu_result, _ECU_RESULT_FIELDS))
             
-            time.sleep(0.5)  # Simuliert Scan-Zeit
+            # Simuliert Scan-Zeit; Stop wird spätestens nach 50 ms erkannt
+            if not self.wait_while_active(500):
+                break
+    
+    def wait_while_active(self, duration_ms: int, step_ms: int = 50) -> bool:
+        """Wartet in kurzen Schritten; False sobald die Discovery gestoppt wurde"""
+        for _ in range(max(1, duration_ms // step_ms)):
+            if not self.discovery_active:
+                return False
+            self.msleep(step_ms)
+        return self.discovery_active
     
     def test_ecu_communication(self, tx_id: str, ecu_info: Dict) -> float:
         """Testet Kommunikation mit ECU"""
         
         if not self.serial_controller or not self.serial_controller.isOpen():
             # Simulation für Tests
-            import random
-            return random.uniform(8.0, 25.0) if random.random() > 0.3 else 0.0
+            return _SIM_TIMES[next(_SIM_IDX) % _SIM_TABLE_SIZE]
         
         try:
             # Echter Communication Test würde hier stattfinden
             start_time = time.time()
             
+            # ECU auswählen: VCI wird konfiguriert, der Arduino bekommt den >TX:RX Header
+            rx_id = ecu_info["rx_id_str"]
+            if getattr(self.serial_controller, "use_vci", False):
+                if not self.serial_controller.configure_vci(tx_id, rx_id):
+                    return 0.0
+            elif self.serial_controller.sendReceive(f">{tx_id}:{rx_id}") != "OK":
+                return 0.0
+            
             # UDS-Ping (Service 0x3E - Tester Present)
-            test_command = f"3E00"  # Tester Present
-            response = self.serial_controller.sendReceive(test_command, timeout=2.0)
+            test_command = "3E00"  # Tester Present
+            response = self.serial_controller.sendReceive(test_command)
             
             if response and "7E" in response:  # Positive Response
                 return (time.time() - start_time) * 1000  # ms
@@ -357,9 +625,12 @@ class SmartECUAutoDiscovery(QThread):
         print("[DISCOVERY] Ordne JSON-Konfigurationen zu...")
         
         for ecu in self.discovered_ecus:
-            if ecu.tx_id in self.json_database:
-                configs = self.json_database[ecu.tx_id]
-                
+            try:
+                configs = self.json_database_int.get(int(ecu.tx_id, 16))
+            except ValueError:
+                configs = self.json_database.get(ecu.tx_id)
+            
+            if configs:
                 # Wähle beste Konfiguration basierend auf Fahrzeugprofil
                 best_config = self.select_best_config(ecu, configs)
                 
@@ -377,19 +648,27 @@ class SmartECUAutoDiscovery(QThread):
         if not configs:
             return None
         
+        # Häufigster Fall: nur eine passende Konfiguration
+        if len(configs) == 1:
+            return configs[0]
+        
         # Scoring-System für Konfigurationen
         scored_configs = []
         
+        manufacturer_upper = None
+        if self.vehicle_profile and self.vehicle_profile.manufacturer:
+            manufacturer_upper = self.vehicle_profile.manufacturer.upper()
+        ecu_name_upper = ecu.name.upper()
+        
         for config in configs:
             score = 0
             
             # Platform-Match
-            if self.vehicle_profile and self.vehicle_profile.manufacturer:
-                if self.vehicle_profile.manufacturer.upper() in config["platform"]:
-                    score += 30
+            if manufacturer_upper and manufacturer_upper in config["platform"]:
+                score += 30
             
             # Name-Match
-            if ecu.name.upper() in config["name"].upper():
+            if ecu_name_upper in config["name_upper"]:
                 score += 25
             
             # Protocol-Match
@@ -412,6 +691,9 @@ class SmartECUAutoDiscovery(QThread):
         """Berechnet finale Konfidenz-Scores"""
         print("[DISCOVERY] Berechne Konfidenz-Scores...")
         
+        # Erwartete ECUs einmal als Set statt Listensuche pro ECU
+        expected_ecus = set(self.vehicle_profile.expected_ecus) if self.vehicle_profile else set()
+        
         for ecu in self.discovered_ecus:
             base_score = ecu.confidence_score
             
@@ -420,15 +702,15 @@ class SmartECUAutoDiscovery(QThread):
                 base_score += 0.2
             
             # Response-Time Bewertung (bessere Zeit = höhere Konfidenz)
-            if ecu.response_time > 0:
-                if ecu.response_time < 15.0:
+            response_time = ecu.response_time
+            if response_time > 0:
+                if response_time < 15.0:
                     base_score += 0.1
-                elif ecu.response_time > 50.0:
+                elif response_time > 50.0:
                     base_score -= 0.1
             
             # Vehicle Profile Match
-            if (self.vehicle_profile and 
-                ecu.name in self.vehicle_profile.expected_ecus):
+            if ecu.name in expected_ecus:
                 base_score += 0.1
             
             ecu.confidence_score = min(1.0, max(0.0, base_score))
@@ -445,6 +727,14 @@ class SmartECUAutoDiscoveryWidget(QWidget):
         super().__init__(parent)
         
         self.discovery_system = discovery_system
+        
+        # Gefundene ECUs sammeln und alle 50 ms gebündelt in die Liste übernehmen
+        self._pending_items = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
         self.setup_ui()
         self.connect_signals()
     
@@ -542,6 +832,7 @@ class SmartECUAutoDiscoveryWidget(QWidget):
         """Behandelt Discovery-Start"""
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
+        self._pending_items.clear()
         self.results_list.clear()
         self.status_label.setText("🔍 Discovery started...")
     
@@ -558,11 +849,24 @@ class SmartECUAutoDiscoveryWidget(QWidget):
         if ecu.suggested_json:
             item_text += f" 📄 JSON: {Path(ecu.suggested_json).name}"
         
-        item = QListWidgetItem(item_text)
-        self.results_list.addItem(item)
+        self._pending_items.append(item_text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_pending(self):
+        """Übernimmt gesammelte ECU-Einträge in einem Schritt"""
+        if not self._pending_items:
+            return
+        
+        self.results_list.setUpdatesEnabled(False)
+        self.results_list.addItems(self._pending_items)
+        self.results_list.setUpdatesEnabled(True)
+        self._pending_items.clear()
     
     def on_discovery_completed(self, results: List[Dict]):
         """Behandelt Discovery-Abschluss"""
+        self._flush_timer.stop()
+        self._flush_pending()
         self.start_btn.setEnabled(True) 
         self.stop_btn.setEnabled(False)
         self.status_label.setText(f"✅ Discovery completed - {len(results)} ECUs found")
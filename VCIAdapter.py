@@ -15,13 +15,141 @@
 import json
 import subprocess
 import threading
-import queue
 import time
 import os
 import sys
-from datetime import datetime
+import itertools
+import re
 from PySide6.QtCore import QObject, Signal
 
+# Bridge framing: [4B header length][JSON header][4B data length][raw ECU bytes]
+# (lengths little-endian, JSON via orjson if installed)
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _decode_frame = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _decode_frame = json.loads
+
+# Bridge working directory (VCIBridge.py lives next to this module)
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A 32-bit Windows interpreter can load the VCI DLL directly (no bridge process)
+_IN_PROCESS_DLL = sys.platform == "win32" and sys.maxsize <= 2**32
+
+# Resolved 32-bit Python command, kept across program starts
+_BRIDGE_CACHE_FILE = os.path.join(os.environ.get("APPDATA") or os.path.expanduser("~"),
+                                  "PyPSADiag", "vci_bridge.json")
+
+# Seconds to wait for the bridge's "ready" message after spawning it
+_BRIDGE_READY_TIMEOUT = 5
+
+# Map PyPSADiag protocol names to VCI protocols
+_PROTOCOL_MAP = {
+    "uds": "DIAGONCAN",
+    "kwp_is": "DIAGONCAN",
+    "kwp_hab": "DIAGONCAN",
+    "kwp2000": "PSA2000",
+    "psa2000": "PSA2000",
+    "fiat_kwp": "KWPONCAN_FIAT"
+}
+
+# Protocols that run on the I/S bus when bus == "auto"
+_IS_PROTOCOLS = frozenset({"kwp_is"})
+
+
+def _load_bridge_args_cache():
+    """Bridge command from the last successful start (None if missing/stale)"""
+    try:
+        with open(_BRIDGE_CACHE_FILE, "r", encoding="utf-8") as f:
+            bridge_args = json.load(f).get("bridge_args")
+    except (OSError, ValueError, AttributeError):
+        return None
+    if not isinstance(bridge_args, list) or not bridge_args:
+        return None
+    # py launcher is on PATH; a direct interpreter path must still exist
+    if bridge_args[0] != "py" and not os.path.exists(bridge_args[0]):
+        return None
+    return bridge_args
+
+
+def _save_bridge_args_cache(bridge_args):
+    """Remember the bridge command (None removes the cache)"""
+    try:
+        if bridge_args is None:
+            os.remove(_BRIDGE_CACHE_FILE)
+            return
+        os.makedirs(os.path.dirname(_BRIDGE_CACHE_FILE), exist_ok=True)
+        tmp_path = f"{_BRIDGE_CACHE_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"bridge_args": bridge_args}, f)
+        os.replace(tmp_path, _BRIDGE_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"[VCI] Bridge cache not written: {e}")
+
+
+def _write_frame(stream, obj, payload=b""):
+    """Write one frame into the (buffered) stream; the caller flushes"""
+    header = _dumps(obj)
+    stream.write(len(header).to_bytes(4, "little"))
+    stream.write(header)
+    stream.write(len(payload).to_bytes(4, "little"))
+    if payload:
+        stream.write(payload)
+
+
+_ID_RE = re.compile(rb'"id":(\d+)')
+
+
+def _route_keys(header):
+    """Pull command and id out of a compact bridge header without a full JSON parse"""
+    start = header.find(b'"command":"')
+    if start < 0:
+        return None, None
+    start += 11
+    command = header[start:header.find(b'"', start)].decode("utf-8")
+    # "id" is the last key of a bridge response
+    match = _ID_RE.match(header, header.rfind(b'"id":'))
+    return command, int(match.group(1)) if match else None
+
+
+def _response_data(header, payload):
+    """Decode a matched response frame into its data dict"""
+    data = _decode_frame(header).get("data", {})
+    if payload and isinstance(data, dict):
+        data["payload"] = payload
+    return data
+
+
+def _read_exact(stream, size):
+    """Read exactly size bytes from a pipe (None on EOF)"""
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _read_segment(stream):
+    """Read one length-prefixed frame segment (None on EOF)"""
+    size = _read_exact(stream, 4)
+    if size is None:
+        return None
+    return _read_exact(stream, int.from_bytes(size, "little"))
+
+
+def _to_ecu_bytes(data):
+    """Hex string (API) -> raw bytes (wire)"""
+    return bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+
 class VCIAdapter(QObject):
     """
     Evolution XS VCI Adapter
@@ -35,63 +163,56 @@ class VCIAdapter(QObject):
     def __init__(self):
         super().__init__()
         self.bridge_process = None
-        self.response_queue = queue.Queue()
-        self.log_queue = queue.Queue()
+        # Offene Anfragen: request_id -> (erwartete Antwort, Event, [Antwortdaten])
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
         self.reader_thread = None
         self.connected = False
         self.configured = False
+        # Resolved 32-bit Python command, reused on reconnect
+        self._cached_bridge_args = None
+        # In-process VCIBridge when running on 32-bit Python
+        self._direct = None
+        # Per-packet log messages (e.g. analog readings) only when debugging
+        self.debug = False
+        # QMetaMethod of logSignal for isSignalConnected (works with PySide6 and PyQt5)
+        meta = self.metaObject()
+        self._logSignalMethod = meta.method(meta.indexOfSignal("logSignal(QString)"))
         
     def log(self, message):
         """Log message"""
+        # No console (pythonw) and no connected slot: nobody reads the message
+        if sys.stdout is None and not self.isSignalConnected(self._logSignalMethod):
+            return
         log_msg = f"[VCI] {message}"
         print(log_msg)
         self.logSignal.emit(log_msg)
     
     def start_bridge(self):
         """Start the 32-bit VCI bridge subprocess"""
+        if self._direct is not None:
+            return True
         if self.bridge_process and self.bridge_process.poll() is None:
             return True
+        
+        if _IN_PROCESS_DLL:
+            try:
+                from VCIBridge import VCIBridge
+                bridge = VCIBridge(log_callback=self.log)
+                if bridge.loadDll():
+                    self._direct = bridge
+                    self.log("32-bit Python: using VCI DLL in-process")
+                    return True
+            except Exception as e:
+                self.log(f"In-process VCI DLL access failed: {e}")
             
         try:
-            # Try py launcher first (preferred method)
-            try:
-                # Test if py -3-32 works
-                test_result = subprocess.run(
-                    ["py", "-3-32", "--version"], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=5
-                )
-                if test_result.returncode == 0:
-                    bridge_args = ["py", "-3-32", "VCIBridge.py"]
-                    self.log("Using py launcher for 32-bit Python")
-                else:
-                    raise subprocess.SubprocessError("py -3-32 not available")
-                    
-            except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError):
-                # Fallback to direct Python paths
-                self.log("py launcher not available, trying direct paths...")
-                python32_paths = [
-                    r"C:\Python32\python.exe",
-                    r"C:\Python311-32\python.exe", 
-                    r"C:\Python310-32\python.exe",
-                    r"C:\Python39-32\python.exe",
-                    r"C:\Python38-32\python.exe",
-                    "python32.exe",
-                    "python.exe"  # Last resort - might be 32-bit
-                ]
-                
-                python32_exe = None
-                for path in python32_paths:
-                    if os.path.exists(path):
-                        python32_exe = path
-                        break
-                
-                if python32_exe:
-                    bridge_args = [python32_exe, "VCIBridge.py"]
-                    self.log(f"Using direct Python path: {python32_exe}")
-                else:
-                    raise FileNotFoundError("No 32-bit Python installation found")
+            bridge_args = self._cached_bridge_args or _load_bridge_args_cache()
+            probed = bridge_args is None
+            if probed:
+                bridge_args = self._resolve_bridge_args()
             
             # Start bridge process
             self.bridge_process = subprocess.Popen(
@@ -99,25 +220,90 @@ class VCIAdapter(QObject):
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__)),
-                bufsize=0
+                cwd=_MODULE_DIR,
+                bufsize=-1  # buffered pipes, _send_command flushes once per command
             )
+            self._cached_bridge_args = bridge_args
+            
+            # Wait for the bridge's ready message (id 0 is never used by _send_command)
+            ready = threading.Event()
+            with self._pending_lock:
+                self._pending[0] = ("ready", ready, [])
             
-            # Start reader thread
+            # Start reader threads (stderr must be drained or the bridge blocks on a full pipe)
             self.reader_thread = threading.Thread(target=self._read_bridge_output, daemon=True)
             self.reader_thread.start()
+            threading.Thread(target=self._drain_bridge_stderr, args=(self.bridge_process.stderr,),
+                             daemon=True).start()
+            
+            try:
+                if not ready.wait(_BRIDGE_READY_TIMEOUT):
+                    raise TimeoutError("VCI bridge did not report ready")
+            finally:
+                with self._pending_lock:
+                    self._pending.pop(0, None)
             
+            if probed:
+                _save_bridge_args_cache(bridge_args)
             self.log("VCI Bridge started")
-            time.sleep(1)  # Give bridge time to initialize
             return True
             
         except Exception as e:
             self.log(f"Failed to start VCI bridge: {e}")
+            if self.bridge_process and self.bridge_process.poll() is None:
+                self.bridge_process.kill()
+            self.bridge_process = None
+            self._cached_bridge_args = None
+            _save_bridge_args_cache(None)
             return False
     
+    def _resolve_bridge_args(self):
+        """Find a 32-bit Python interpreter and return the bridge command line"""
+        # Try py launcher first (preferred method)
+        try:
+            # Test if py -3-32 works
+            test_result = subprocess.run(
+                ["py", "-3-32", "--version"], 
+                capture_output=True, 
+                text=True, 
+                timeout=5
+            )
+            if test_result.returncode == 0:
+                self.log("Using py launcher for 32-bit Python")
+                return ["py", "-3-32", "VCIBridge.py", "--framed"]
+            else:
+                raise subprocess.SubprocessError("py -3-32 not available")
+                
+        except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError):
+            # Fallback to direct Python paths
+            self.log("py launcher not available, trying direct paths...")
+            python32_paths = [
+                r"C:\Python32\python.exe",
+                r"C:\Python311-32\python.exe", 
+                r"C:\Python310-32\python.exe",
+                r"C:\Python39-32\python.exe",
+                r"C:\Python38-32\python.exe",
+                "python32.exe",
+                "python.exe"  # Last resort - might be 32-bit
+            ]
+            
+            python32_exe = None
+            for path in python32_paths:
+                if os.path.exists(path):
+                    python32_exe = path
+                    break
+            
+            if python32_exe:
+                self.log(f"Using direct Python path: {python32_exe}")
+                return [python32_exe, "VCIBridge.py", "--framed"]
+            raise FileNotFoundError("No 32-bit Python installation found")
+    
     def stop_bridge(self):
         """Stop the VCI bridge subprocess"""
+        if self._direct is not None:
+            self._direct.disconnect()
+            self._direct = None
+            
         if self.bridge_process:
             try:
                 # Send quit command
@@ -145,19 +331,24 @@ class VCIAdapter(QObject):
         """Read output from bridge subprocess"""
         try:
             while self.bridge_process and self.bridge_process.poll() is None:
-                line = self.bridge_process.stdout.readline()
-                if not line:
+                stdout = self.bridge_process.stdout
+                header = _read_segment(stdout)
+                payload = _read_segment(stdout) if header is not None else None
+                if payload is None:
                     break
                     
                 try:
-                    response = json.loads(line.strip())
-                    command = response.get("command")
-                    data = response.get("data", {})
+                    # Routing keys only; the waiting caller decodes its own response
+                    command, request_id = _route_keys(header)
+                    if command is None or command == "log":
+                        response = _decode_frame(header)
+                        command = response.get("command")
+                        if command == "log":
+                            self.log(response.get("data", {}).get("message", ""))
+                            continue
+                        request_id = response.get("id")
                     
-                    if command == "log":
-                        self.log(data.get("message", ""))
-                    else:
-                        self.response_queue.put(response)
+                    self._dispatch_response(command, request_id, (header, payload))
                         
                 except json.JSONDecodeError:
                     continue
@@ -167,42 +358,109 @@ class VCIAdapter(QObject):
         except Exception as e:
             self.log(f"Bridge reader thread error: {e}")
     
-    def _send_command(self, command, params=None, timeout=10):
+    def _drain_bridge_stderr(self, stderr):
+        """Forward bridge stderr (tracebacks etc.) to the log"""
+        pending = b""
+        try:
+            while True:
+                chunk = stderr.read1(65536)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        self.log(f"Bridge stderr: {line.decode('utf-8', 'replace').rstrip()}")
+            if pending.strip():
+                self.log(f"Bridge stderr: {pending.decode('utf-8', 'replace').rstrip()}")
+        except Exception as e:
+            self.log(f"Bridge stderr reader error: {e}")
+    
+    def _dispatch_response(self, command, request_id, frame):
+        """Antwort direkt an den wartenden Aufrufer übergeben"""
+        with self._pending_lock:
+            pending = self._pending.get(request_id)
+            if pending is None or pending[0] != command:
+                # Bridge ohne ID-Echo: ältesten Wartenden für diese Antwort nehmen
+                pending = next((p for p in self._pending.values()
+                                if p[0] == command and not p[1].is_set()), None)
+        
+        if pending is not None:
+            pending[2].append(frame)
+            pending[1].set()
+    
+    def _send_command(self, command, params=None, timeout=10, payload=b""):
         """Send command to bridge and wait for response"""
+        return self._send_commands([(command, params, payload)], timeout)[0]
+    
+    def _send_commands(self, commands, timeout=10):
+        """Send (command, params, payload) tuples in one flush and wait for all responses (in order)"""
+        if self._direct is not None:
+            with self._write_lock:
+                return [self._call_direct(*cmd) for cmd in commands]
+        
         if not self.bridge_process or self.bridge_process.poll() is not None:
             self.log("Bridge process not running")
-            return None
-            
+            return [None] * len(commands)
+        
+        waiters = []
         try:
-            cmd_data = {
-                "command": command,
-                "params": params or {},
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Send command
-            cmd_json = json.dumps(cmd_data) + "\n"
-            self.bridge_process.stdin.write(cmd_json)
-            self.bridge_process.stdin.flush()
+            # Register before sending so a fast response cannot be missed
+            with self._pending_lock:
+                for command, _params, _payload in commands:
+                    request_id = next(self._request_ids)
+                    event = threading.Event()
+                    slot = []
+                    self._pending[request_id] = (f"{command}_response", event, slot)
+                    waiters.append((request_id, command, event, slot))
             
-            # Wait for response
-            expected_response = f"{command}_response"
-            start_time = time.time()
+            # Send all commands, flush once
+            with self._write_lock:
+                stdin = self.bridge_process.stdin
+                for (request_id, command, _event, _slot), (_cmd, params, payload) in zip(waiters, commands):
+                    cmd_data = {
+                        "command": command,
+                        "id": request_id,
+                        "params": params or {}
+                    }
+                    _write_frame(stdin, cmd_data, payload)
+                stdin.flush()
             
-            while time.time() - start_time < timeout:
-                try:
-                    response = self.response_queue.get(timeout=1)
-                    if response.get("command") == expected_response:
-                        return response.get("data")
-                except queue.Empty:
-                    continue
-                    
-            self.log(f"Command {command} timed out")
-            return None
+            # Wait for responses (reader thread wakes us directly)
+            deadline = time.monotonic() + timeout
+            results = []
+            for request_id, command, event, slot in waiters:
+                if event.wait(max(0.0, deadline - time.monotonic())) and slot:
+                    try:
+                        results.append(_response_data(*slot[0]))
+                    except ValueError as e:
+                        self.log(f"Invalid response to {command}: {e}")
+                        results.append(None)
+                else:
+                    self.log(f"Command {command} timed out")
+                    results.append(None)
+            return results
             
         except Exception as e:
-            self.log(f"Error sending command {command}: {e}")
+            self.log(f"Error sending command {commands[0][0]}: {e}")
+            return [None] * len(commands)
+        finally:
+            with self._pending_lock:
+                for request_id, *_rest in waiters:
+                    self._pending.pop(request_id, None)
+    
+    def _call_direct(self, command, params, payload):
+        """Run a bridge command on the in-process VCIBridge (same response data as the bridge)"""
+        try:
+            result = self._direct.execute(command, params, payload)
+        except Exception as e:
+            self.log(f"Error in VCI command {command}: {e}")
+            return None
+        if result is None:
             return None
+        data, response = result
+        if response:
+            data["payload"] = response
+        return data
     
     def connect(self):
         """Connect to VCI"""
@@ -219,7 +477,7 @@ class VCIAdapter(QObject):
             return False
     
     def disconnect(self):
-        """Disconnect from VCI"""
+        """Disconnect from VCI (bridge process stays alive for the next connect)"""
         if self.connected:
             response = self._send_command("disconnect")
             if response and response.get("success"):
@@ -227,33 +485,33 @@ class VCIAdapter(QObject):
             else:
                 self.log("Error disconnecting from VCI")
                 
-        self.stop_bridge()
+        self.connected = False
+        self.configured = False
         return True
     
+    def shutdown(self):
+        """Disconnect and terminate the bridge process"""
+        self.stop_bridge()
+    
+    def __del__(self):
+        try:
+            if self.bridge_process and self.bridge_process.poll() is None:
+                self.bridge_process.kill()
+        except Exception:
+            pass
+    
     def configure(self, tx_id, rx_id, protocol="uds", bus="DIAG", target=None, dialog_type="0"):
         """Configure VCI for ECU communication"""
         if not self.connected:
             if not self.connect():
                 return False
         
-        # Map PyPSADiag protocol names to VCI protocols
-        protocol_map = {
-            "uds": "DIAGONCAN",
-            "kwp_is": "DIAGONCAN", 
-            "kwp_hab": "DIAGONCAN",
-            "kwp2000": "PSA2000",
-            "psa2000": "PSA2000",
-            "fiat_kwp": "KWPONCAN_FIAT"
-        }
-        
-        vci_protocol = protocol_map.get(protocol.lower(), "DIAGONCAN")
+        protocol = protocol.lower()
+        vci_protocol = _PROTOCOL_MAP.get(protocol, "DIAGONCAN")
         
         # Auto-detect bus type based on protocol if not specified
         if bus == "auto":
-            if protocol.lower() in ["kwp_is"]:
-                vci_bus = "IS"
-            else:
-                vci_bus = "DIAG"
+            vci_bus = "IS" if protocol in _IS_PROTOCOLS else "DIAG"
         else:
             vci_bus = "IS" if bus == "IS" else "DIAG"
         
@@ -285,21 +543,56 @@ class VCIAdapter(QObject):
             self.log("VCI not configured")
             return ""
             
+        try:
+            payload = _to_ecu_bytes(data)
+        except ValueError as e:
+            self.log(f"Invalid send data {data!r}: {e}")
+            return ""
+        
         params = {
-            "data": data,
             "timeout": timeout
         }
         
-        response = self._send_command("send_receive", params)
+        response = self._send_command("send_receive", params, payload=payload)
         if response:
-            result = response.get("response", "")
+            result = response.get("payload", b"").hex().upper()
             if result:
-                self.packetReceivedSignal.emit(data, result)
+                self.packetReceivedSignal.emit(data if isinstance(data, str) else payload.hex().upper(), result)
             return result
         else:
             self.log("Send/Receive failed")
             return ""
     
+    def send_receive_batch(self, frames, timeout=1500):
+        """Send several ECU requests pipelined through the bridge, responses in submission order"""
+        if not self.configured:
+            self.log("VCI not configured")
+            return [""] * len(frames)
+        
+        results = [""] * len(frames)
+        commands = []
+        indices = []
+        for i, data in enumerate(frames):
+            try:
+                commands.append(("send_receive", {"timeout": timeout}, _to_ecu_bytes(data)))
+                indices.append(i)
+            except ValueError as e:
+                self.log(f"Invalid send data {data!r}: {e}")
+        if not commands:
+            return results
+        
+        # Bridge handles the requests one after another: allow each its ECU timeout
+        responses = self._send_commands(commands, 10 + len(commands) * timeout / 1000)
+        for i, (_cmd, _params, payload), response in zip(indices, commands, responses):
+            if not response:
+                continue
+            result = response.get("payload", b"").hex().upper()
+            if result:
+                data = frames[i]
+                self.packetReceivedSignal.emit(data if isinstance(data, str) else payload.hex().upper(), result)
+            results[i] = result
+        return results
+    
     def is_connected(self):
         """Check if VCI is connected"""
         return self.connected
@@ -314,17 +607,22 @@ class VCIAdapter(QObject):
             self.log("VCI not configured")
             return ""
             
+        try:
+            payload = _to_ecu_bytes(data)
+        except ValueError as e:
+            self.log(f"Invalid send data {data!r}: {e}")
+            return ""
+        
         params = {
-            "data": data,
             "responses": responses,
             "timeout": timeout
         }
         
-        response = self._send_command("send_receive_multiple", params)
+        response = self._send_command("send_receive_multiple", params, payload=payload)
         if response:
-            result = response.get("response", "")
+            result = response.get("payload", b"").hex().upper()
             if result:
-                self.packetReceivedSignal.emit(data, result)
+                self.packetReceivedSignal.emit(data if isinstance(data, str) else payload.hex().upper(), result)
             return result
         else:
             self.log("Send/Receive Multiple failed")
@@ -354,7 +652,7 @@ class VCIAdapter(QObject):
         response = self._send_command("get_analog_data", params)
         if response:
             voltage = response.get("voltage")
-            if voltage is not None:
+            if voltage is not None and self.debug:
                 self.log(f"Analog channel {channel}: {voltage:.2f}V")
             return voltage
         else:
@@ -16,16 +16,56 @@ import sys
 import json
 import ctypes
 import time
-import re
-from datetime import datetime
+from collections import OrderedDict
+
+# Compact JSON for framed mode (orjson if installed in the 32-bit Python)
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+_c_float_p = ctypes.POINTER(ctypes.c_float)
+
+# Encoded request buffers kept for repeated requests (live data polling)
+_REQUEST_CACHE_SIZE = 128
+
+# VCIAccess.dll exports: name -> (attribute, argtypes); all return c_int
+_VCI_FUNCTIONS = {
+    "_openSession": ("vciOpenSession", None),
+    "_closeSession": ("vciCloseSession", None),
+    "_getVersion": ("vciGetVersion", None),
+    "_getFirmwareVersion": ("vciGetFirmwareVersion", [ctypes.c_char_p, ctypes.c_int]),
+    "_changeComLine": ("vciChangeComLine", [ctypes.c_int]),
+    "_bindProtocol": ("vciBindProtocol", [ctypes.c_char_p, ctypes.c_int]),
+    "_writeAndRead": ("vciWriteAndRead", [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                                          ctypes.c_char_p, ctypes.c_int, ctypes.c_int]),
+    "_writeAndReadMultipleFrames": ("vciWriteAndReadMF", [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p,
+                                                          ctypes.c_int, ctypes.c_int, ctypes.c_char_p,
+                                                          ctypes.c_int, ctypes.c_int]),
+    "_performInit": ("vciPerformInit", [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]),
+    "_getAnalogicData": ("vciGetAnalogicData", [ctypes.c_int, _c_float_p]),
+}
 
 class VCIBridge:
     """
     32-bit bridge to access Evolution XS VCI DLL
     Communicates via stdin/stdout JSON messages
+    (newline-delimited, or with --framed: [4B header len][JSON header][4B data len][raw bytes])
+    On a 32-bit host VCIAdapter uses the class in-process with log_callback instead.
     """
     
-    def __init__(self):
+    def __init__(self, framed=False, log_callback=None):
+        self.framed = framed
+        self.log_callback = log_callback
+        # Pending output (log lines buffered while a command runs)
+        self._out_parts = []
+        self._in_command = False
         self.vci = None
         self.connected = False
         self.currEcuDesc = None
@@ -54,25 +94,123 @@ class VCIBridge:
         self.pd_KWP2000PSA = "01 00"
         self.pd_UDS_PSA = "0B"
         
+        # ID of the command currently being handled (echoed in its response)
+        self.current_request_id = None
+        
+        # Response buffer shared by all DLL calls (commands are handled one at a time)
+        self.outputBuffer = ctypes.create_string_buffer(self.MSG_BUFFER)
+        
+        # request (bytes/hex) -> (ctypes buffer, length), LRU
+        self._request_cache = OrderedDict()
+        
+        # command -> handler(params, payload) returning (response data, response payload)
+        self._dispatch = {
+            "connect": lambda p, d: ({"success": self.connect()}, b""),
+            "disconnect": lambda p, d: ({"success": self.disconnect()}, b""),
+            "configure": lambda p, d: ({"success": self.configure(**p)}, b""),
+            "send_receive": lambda p, d: ({}, self.send_receive(d or p.get("data", ""), p.get("timeout", 1500))),
+            "send_receive_multiple": lambda p, d: ({}, self.send_receive_multiple(
+                d or p.get("data", ""), p.get("responses", 1), p.get("timeout", 1500))),
+            "perform_init": lambda p, d: ({"success": self.perform_init()}, b""),
+            "get_analog_data": lambda p, d: ({"voltage": self.get_analog_data(p.get("channel", 0))}, b""),
+            "quit": lambda p, d: ({"success": self.disconnect() or True}, b""),
+        }
+        
+        # DLL is loaded on first use (loadDll), keeps bridge startup short
+        self._bindFunctions()
+    
+    def loadDll(self):
+        """Load VCIAccess.dll once; False if it is not available"""
+        if self.vci is not None:
+            return True
         try:
             self.vci = ctypes.CDLL("C:\\AWRoot\\drv\\VCIAccess.dll")
             self.log("VCI DLL loaded successfully")
         except Exception as e:
             self.log(f"Failed to load VCI DLL: {e}")
             self.vci = None
+            return False
+        self._bindFunctions()
+        return True
+    
+    def _bindFunctions(self):
+        """Look up the DLL exports once and set their restype/argtypes"""
+        for name, (attr, argtypes) in _VCI_FUNCTIONS.items():
+            func = None
+            if self.vci is not None:
+                try:
+                    func = self.vci[name]
+                    func.restype = ctypes.c_int
+                    if argtypes is not None:
+                        func.argtypes = argtypes
+                except AttributeError:
+                    self.log(f"VCI DLL export missing: {name}")
+                    func = None
+            setattr(self, attr, func)
     
     def log(self, message):
         """Send log message to parent process"""
-        self.send_response("log", {"message": f"[VCI-32] {message}"})
+        if self.log_callback:
+            self.log_callback(f"[VCI-32] {message}")
+        else:
+            self.send_response("log", {"message": f"[VCI-32] {message}"})
     
-    def send_response(self, command, data):
+    def send_response(self, command, data, payload=b""):
         """Send JSON response to parent process"""
         response = {
             "command": command,
-            "timestamp": datetime.now().isoformat(),
             "data": data
         }
-        print(json.dumps(response), flush=True)
+        if self.current_request_id is not None and command != "log":
+            response["id"] = self.current_request_id
+        parts = self._out_parts
+        if self.framed:
+            header = _dumps(response)
+            parts.append(len(header).to_bytes(4, "little"))
+            parts.append(header)
+            parts.append(len(payload).to_bytes(4, "little"))
+            if payload:
+                parts.append(payload)
+        else:
+            if payload:
+                data["response"] = payload.hex().upper()
+            parts.append(json.dumps(response).encode("utf-8") + b"\n")
+        
+        # Log lines during a command go out together with its response
+        if not (self._in_command and command == "log"):
+            self._flush_output()
+    
+    def _flush_output(self):
+        """Write all pending messages with a single flush"""
+        if not self._out_parts:
+            return
+        out = sys.stdout.buffer
+        for part in self._out_parts:
+            out.write(part)
+        out.flush()
+        self._out_parts.clear()
+    
+    def _read_segment(self):
+        """Read one length-prefixed segment from stdin (None on EOF)"""
+        size = sys.stdin.buffer.read(4)
+        if len(size) < 4:
+            return None
+        size = int.from_bytes(size, "little")
+        segment = sys.stdin.buffer.read(size)
+        return segment if len(segment) == size else None
+    
+    def read_command(self):
+        """Read the next command from the parent process: (header, payload), None on EOF"""
+        if not self.framed:
+            # Binary stdin: no text decoding, the JSON parser takes bytes and ignores the newline
+            line = sys.stdin.buffer.readline()
+            return (line, b"") if line else None
+        
+        header = self._read_segment()
+        payload = self._read_segment() if header is not None else None
+        if payload is None:
+            return None
+        return header, payload
     
     def statusToStr(self, code):
         """Convert VCI status code to string"""
@@ -97,35 +235,45 @@ class VCIBridge:
         }
         return status_codes.get(code, f"UNKNOWN ERROR {code}")
     
-    def bytesEncode(self, pd, divisor=" "):
-        """Convert string format to descriptor"""
-        if divisor is None:
-            byt = re.findall('.{1,2}', pd)
+    def ecuBuffer(self, data):
+        """Raw bytes or hex string -> ctypes buffer (cached for repeated requests)"""
+        cached = self._request_cache.get(data)
+        if cached is not None:
+            self._request_cache.move_to_end(data)
+            return cached
+        
+        if isinstance(data, str):
+            cached = self.bytesEncode(data)
         else:
-            byt = pd.split(" ")
-        out = []
-        for by in byt:
-            out.append(int(by, 16))
-        return ctypes.create_string_buffer(bytes(out), len(out)), len(out)
+            cached = ctypes.create_string_buffer(data, len(data)), len(data)
+        self._request_cache[data] = cached
+        if len(self._request_cache) > _REQUEST_CACHE_SIZE:
+            self._request_cache.popitem(last=False)
+        return cached
+    
+    def bytesEncode(self, pd):
+        """Convert hex string (with or without spaces) to descriptor"""
+        pd = pd.replace(" ", "")
+        if len(pd) % 2:
+            # Trailing single digit is its own byte ("7" -> 07)
+            pd = pd[:-1] + "0" + pd[-1]
+        raw = bytes.fromhex(pd)
+        return ctypes.create_string_buffer(raw, len(raw)), len(raw)
     
     def connect(self):
         """Connect to VCI"""
-        if self.vci is None:
+        if not self.loadDll():
             return False
             
         try:
-            vciOpenSession = self.vci["_openSession"]
-            vciOpenSession.restype = ctypes.c_int
-            result = vciOpenSession()
+            result = self.vciOpenSession()
             
             if result == 0 or result == 1:
                 self.log("Connected to Evolution XS VCI successfully")
                 self.connected = True
                 
                 # Get version info - this returns the actual version number, not a status code
-                vciGetVersion = self.vci["_getVersion"]
-                vciGetVersion.restype = ctypes.c_int
-                version = vciGetVersion()
+                version = self.vciGetVersion()
                 if version > 0:
                     # Convert version number to readable format (e.g. 322 might be v3.22)
                     major = version // 100
@@ -135,16 +283,11 @@ class VCIBridge:
                     self.log(f"VCI API Version: Unknown ({version})")
                 
                 # Get firmware version
-                vciGetFirmwareVersion = self.vci["_getFirmwareVersion"]
-                vciGetFirmwareVersion.restype = ctypes.c_int
-                vciGetFirmwareVersion.argtypes = [ctypes.c_char_p, ctypes.c_int]
                 outputBuffer = ctypes.create_string_buffer(40)
-                fw_result = vciGetFirmwareVersion(outputBuffer, ctypes.c_int(len(outputBuffer)))
+                fw_result = self.vciGetFirmwareVersion(outputBuffer, len(outputBuffer))
                 
                 if fw_result > 0:
-                    fw_version = ""
-                    for i in range(0, fw_result):
-                        fw_version += chr(outputBuffer.raw[i])
+                    fw_version = outputBuffer.raw[:fw_result].decode("latin-1")
                     self.log(f"VCI Firmware Version: {fw_version}")
                 else:
                     self.log("VCI Firmware Version not available")
@@ -162,9 +305,7 @@ class VCIBridge:
         """Disconnect from VCI"""
         if self.connected and self.vci:
             try:
-                vciCloseSession = self.vci["_closeSession"]
-                vciCloseSession.restype = ctypes.c_int
-                result = vciCloseSession()
+                result = self.vciCloseSession()
                 self.connected = False
                 
                 if result >= 0:
@@ -269,10 +410,7 @@ class VCIBridge:
     def _changeComLine(self, num_line):
         """Change VCI communication line"""
         try:
-            vciChangeComLine = self.vci["_changeComLine"]
-            vciChangeComLine.restype = ctypes.c_int
-            vciChangeComLine.argtypes = [ctypes.c_int]
-            result = vciChangeComLine(num_line)
+            result = self.vciChangeComLine(num_line)
             
             self.log(f"ChangeComLine({num_line}): {self.statusToStr(result)}")
             return result >= 0
@@ -284,10 +422,7 @@ class VCIBridge:
         """Bind VCI to specific protocol"""
         try:
             protocolDescriptor, pDlen = self.protocolToProtocolDescriptor(protocol)
-            vciBindProtocol = self.vci["_bindProtocol"]
-            vciBindProtocol.restype = ctypes.c_int
-            vciBindProtocol.argtypes = [ctypes.c_char_p, ctypes.c_int]
-            result = vciBindProtocol(protocolDescriptor, pDlen)
+            result = self.vciBindProtocol(protocolDescriptor, pDlen)
             
             self.log(f"BindProtocol: {self.statusToStr(result)}")
             return result >= 0
@@ -318,7 +453,7 @@ class VCIBridge:
                     if len(rx_h) == 3:
                         rx_h = "0" + rx_h
                     # Format: RX_H + TX_H (reversed for VCI)
-                    return self.strby_to_char(rx_h + tx_h)
+                    return self.bytesEncode(rx_h + tx_h)
                 else:
                     self.log("Invalid ECU headers for DIAG_ON_CAN")
                     return None
@@ -336,21 +471,21 @@ class VCIBridge:
                     # Format: RX_H + TX_H + KWP_ID + 00
                     descriptor = rx_h + tx_h + str(kwp_id) + "00"
                     self.log(f"FIAT ECU descriptor: {descriptor}")
-                    return self.strby_to_char(descriptor)
+                    return self.bytesEncode(descriptor)
                 else:
                     self.log("Invalid parameters for KWP_ON_CAN_FIAT")
                     return None
                     
             elif protocol == self.PSA2:
                 if kwp_id:
-                    return self.strby_to_char(str(kwp_id))
+                    return self.bytesEncode(str(kwp_id))
                 else:
                     self.log("KWP ID required for PSA2")
                     return None
                     
             elif protocol == self.KWP2000_PSA:
                 if kwp_id:
-                    return self.strby_to_char(str(kwp_id))
+                    return self.bytesEncode(str(kwp_id))
                 else:
                     self.log("KWP ID required for KWP2000_PSA")
                     return None
@@ -363,72 +498,51 @@ class VCIBridge:
             self.log(f"Error creating ECU descriptor: {e}")
             return None
     
-    def strby_to_char(self, inp):
-        """Convert string bytes to char buffer"""
-        bys = re.findall('.{1,2}', inp)
-        return self.bytesEncode(" ".join(bys))
-    
     def send_receive(self, data, timeout=1500):
-        """Send data to ECU and receive response"""
+        """Send data to ECU and receive response (raw bytes)"""
         if self.currEcuDesc is None:
             self.log("VCI not configured")
-            return ""
+            return b""
         
         try:
-            inBuffer, inLen = self.bytesEncode(data, None)
+            inBuffer, inLen = self.ecuBuffer(data)
             ecuDesc, ecuDescLen = self.currEcuDesc
             
-            vciWriteAndRead = self.vci["_writeAndRead"]
-            vciWriteAndRead.restype = ctypes.c_int
-            vciWriteAndRead.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
-            outputBuffer = ctypes.create_string_buffer(self.MSG_BUFFER)
             
-            result = vciWriteAndRead(ecuDesc, ecuDescLen, inBuffer, inLen, outputBuffer, self.MSG_BUFFER, timeout)
+            result = self.vciWriteAndRead(ecuDesc, ecuDescLen, inBuffer, inLen, self.outputBuffer, self.MSG_BUFFER, timeout)
             
             if result > 0:
-                out = ""
-                for i in range(0, result):
-                    hex_val = hex(outputBuffer.raw[i]).replace("0x", "").upper().zfill(2)
-                    out += hex_val
-                return out
+                return ctypes.string_at(self.outputBuffer, result)
             else:
                 self.log(f"WriteAndRead error: {self.statusToStr(result)}")
-                return ""
+                return b""
                 
         except Exception as e:
             self.log(f"Send/Receive error: {e}")
-            return ""
+            return b""
     
     def send_receive_multiple(self, data, responses=1, timeout=1500):
-        """Send data and receive multiple responses (for KWP2000)"""
+        """Send data and receive multiple responses (for KWP2000, raw bytes)"""
         if self.currEcuDesc is None:
             self.log("VCI not configured")
-            return ""
+            return b""
         
         try:
-            inBuffer, inLen = self.bytesEncode(data, None)
+            inBuffer, inLen = self.ecuBuffer(data)
             ecuDesc, ecuDescLen = self.currEcuDesc
             
-            vciWriteAndReadMF = self.vci["_writeAndReadMultipleFrames"]
-            vciWriteAndReadMF.restype = ctypes.c_int
-            vciWriteAndReadMF.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
-            outputBuffer = ctypes.create_string_buffer(self.MSG_BUFFER)
             
-            result = vciWriteAndReadMF(ecuDesc, ecuDescLen, inBuffer, inLen, responses, outputBuffer, self.MSG_BUFFER, timeout)
+            result = self.vciWriteAndReadMF(ecuDesc, ecuDescLen, inBuffer, inLen, responses, self.outputBuffer, self.MSG_BUFFER, timeout)
             
             if result > 0:
-                out = ""
-                for i in range(0, result):
-                    hex_val = hex(outputBuffer.raw[i]).replace("0x", "").upper().zfill(2)
-                    out += hex_val
-                return out
+                return ctypes.string_at(self.outputBuffer, result)
             else:
                 self.log(f"WriteAndReadMultipleFrames error: {self.statusToStr(result)}")
-                return ""
+                return b""
                 
         except Exception as e:
             self.log(f"Send/Receive Multiple error: {e}")
-            return ""
+            return b""
     
     def perform_init(self, ecu_descriptor=None):
         """Perform ECU initialization (for KWP2000/PSA2 protocols)"""
@@ -442,19 +556,11 @@ class VCIBridge:
         try:
             ecuDesc, ecuDescLen = ecu_descriptor
             
-            vciPerformInit = self.vci["_performInit"]
-            vciPerformInit.restype = ctypes.c_int
-            vciPerformInit.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
-            outputBuffer = ctypes.create_string_buffer(self.MSG_BUFFER)
             
-            result = vciPerformInit(ecuDesc, ecuDescLen, outputBuffer, self.MSG_BUFFER)
+            result = self.vciPerformInit(ecuDesc, ecuDescLen, self.outputBuffer, self.MSG_BUFFER)
             
             if result > 0:
-                out = ""
-                for i in range(0, result):
-                    hex_val = hex(outputBuffer.raw[i]).replace("0x", "").upper().zfill(2)
-                    out += hex_val
-                self.log(f"ECU Init Response: {out}")
+                self.log(f"ECU Init Response: {ctypes.string_at(self.outputBuffer, result).hex().upper()}")
                 return True
             elif result == 0:
                 self.log("ECU initialization completed (no response)")
@@ -469,14 +575,11 @@ class VCIBridge:
     
     def get_analog_data(self, channel_index):
         """Get analog voltage reading from VCI"""
+        if not self.loadDll():
+            return None
         try:
-            c_float_p = ctypes.POINTER(ctypes.c_float)
-            vciGetAnalogicData = self.vci["_getAnalogicData"]
-            vciGetAnalogicData.restype = ctypes.c_int
-            vciGetAnalogicData.argtypes = [ctypes.c_int, c_float_p]
-            
             data_value = ctypes.c_float()
-            result = vciGetAnalogicData(channel_index, ctypes.byref(data_value))
+            result = self.vciGetAnalogicData(channel_index, ctypes.byref(data_value))
             
             if result >= 0:
                 voltage = data_value.value
@@ -490,66 +593,46 @@ class VCIBridge:
             self.log(f"Analog data error: {e}")
             return None
     
-    def handle_command(self, cmd_data):
+    def execute(self, command, params, payload=b""):
+        """Run one bridge command: (response data, response payload), None if unknown"""
+        handler = self._dispatch.get(command)
+        if handler is None:
+            self.log(f"Unknown command: {command}")
+            return None
+        return handler(params or {}, payload)
+    
+    def handle_command(self, cmd_data, payload=b""):
         """Handle command from parent process"""
         command = cmd_data.get("command")
-        params = cmd_data.get("params", {})
+        self.current_request_id = cmd_data.get("id")
         
-        if command == "connect":
-            success = self.connect()
-            self.send_response("connect_response", {"success": success})
-            
-        elif command == "disconnect":
-            success = self.disconnect()
-            self.send_response("disconnect_response", {"success": success})
-            
-        elif command == "configure":
-            success = self.configure(**params)
-            self.send_response("configure_response", {"success": success})
-            
-        elif command == "send_receive":
-            response = self.send_receive(params.get("data", ""), params.get("timeout", 1500))
-            self.send_response("send_receive_response", {"response": response})
-            
-        elif command == "send_receive_multiple":
-            response = self.send_receive_multiple(
-                params.get("data", ""), 
-                params.get("responses", 1), 
-                params.get("timeout", 1500)
-            )
-            self.send_response("send_receive_multiple_response", {"response": response})
-            
-        elif command == "perform_init":
-            success = self.perform_init()
-            self.send_response("perform_init_response", {"success": success})
-            
-        elif command == "get_analog_data":
-            voltage = self.get_analog_data(params.get("channel", 0))
-            self.send_response("get_analog_data_response", {"voltage": voltage})
-            
-        elif command == "quit":
-            self.disconnect()
-            self.send_response("quit_response", {"success": True})
-            return False
-            
-        else:
-            self.log(f"Unknown command: {command}")
+        self._in_command = True
+        try:
+            result = self.execute(command, cmd_data.get("params", {}), payload)
+            if result is not None:
+                data, response = result
+                self.send_response(f"{command}_response", data, response)
+        finally:
+            self._in_command = False
+            self._flush_output()
             
-        return True
+        return command != "quit"
     
     def run(self):
         """Main bridge loop"""
         self.log("VCI Bridge started")
+        self.send_response("ready", {})
         
         try:
             while True:
-                line = sys.stdin.readline()
-                if not line:
+                frame = self.read_command()
+                if frame is None:
                     break
                     
                 try:
-                    cmd_data = json.loads(line.strip())
-                    if not self.handle_command(cmd_data):
+                    header, payload = frame
+                    cmd_data = _loads(header)
+                    if not self.handle_command(cmd_data, payload):
                         break
                         
                 except json.JSONDecodeError as e:
@@ -566,5 +649,5 @@ class VCIBridge:
             self.log("VCI Bridge stopped")
 
 if __name__ == "__main__":
-    bridge = VCIBridge()
+    bridge = VCIBridge(framed="--framed" in sys.argv)
     bridge.run()
\ No newline at end of file
@@ -20,23 +20,32 @@
 """
 
 import sys
+import argparse
 import random
 import json
 import csv
 import time
 import os
-from datetime import datetime
+import threading
+from collections import deque
+from itertools import chain
 try:
-    from PySide6.QtCore import Qt, Slot, QIODevice, QTranslator
+    from PySide6.QtCore import Qt, Slot, Signal, QThread, QTimer, QIODevice, QTranslator
     from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox
 except ImportError:
     try:
-        from qt_compat import Qt, Slot, QIODevice, QTranslator, QApplication, QMainWindow, QFileDialog, QMessageBox
+        from qt_compat import Qt, Slot, Signal, QThread, QTimer, QIODevice, QTranslator, QApplication, QMainWindow, QFileDialog, QMessageBox
     except ImportError:
-        from PyQt5.QtCore import Qt, QIODevice, QTranslator
-        from PyQt5.QtCore import pyqtSlot as Slot
+        from PyQt5.QtCore import Qt, QThread, QTimer, QIODevice, QTranslator
+        from PyQt5.QtCore import pyqtSlot as Slot, pyqtSignal as Signal
         from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox
 
+# Schnellerer JSON-Parser für Zonen-Dateien falls installiert
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from PyPSADiagGUI import PyPSADiagGUI
 import FileLoader
 from DiagnosticCommunication import DiagnosticCommunication
@@ -47,27 +56,186 @@ from EcuZoneTreeView  import EcuZoneTreeView
 from MessageDialog  import MessageDialog
 from i18n import i18n
 
-# Enhanced Feature Activation System
-try:
-    from EnhancedFeatureActivationSystem import EnhancedFeatureActivationSystem
-    ENHANCED_FEATURES_AVAILABLE = True
-    print("[ENHANCED] Enhanced Feature Activation System verfügbar")
-except ImportError as e:
-    ENHANCED_FEATURES_AVAILABLE = False
-    print(f"[ENHANCED] Enhanced Features nicht verfügbar: {e}")
-
-# Professional Systems Integration
-try:
-    from ConnectionHealthMonitor import ConnectionHealthMonitor, integrate_connection_health_monitor
-    from EnhancedErrorRecovery import EnhancedErrorRecovery, integrate_error_recovery
-    from SmartECUAutoDiscovery import SmartECUAutoDiscovery, integrate_ecu_auto_discovery
-    from ProfessionalLoggingSystem import PyPSALogger, integrate_professional_logging
-    from FeatureTemplateSystem import FeatureTemplateManager, integrate_feature_template_system
-    PROFESSIONAL_SYSTEMS_AVAILABLE = True
-    print("[SYSTEMS] Professional Systems verfügbar")
-except ImportError as e:
-    PROFESSIONAL_SYSTEMS_AVAILABLE = False
-    print(f"[SYSTEMS] Professional Systems nicht verfügbar: {e}")
+def _resolve_qshortcut():
+    """QShortcut aus der verfügbaren Qt-Bindung (PySide6: QtGui, ältere: QtWidgets, PyQt5)"""
+    for module in ("PySide6.QtGui", "PySide6.QtWidgets", "PyQt5.QtWidgets"):
+        try:
+            return getattr(__import__(module, fromlist=["QShortcut"]), "QShortcut")
+        except (ImportError, AttributeError):
+            continue
+    return None
+
+_QShortcut = _resolve_qshortcut()
+
+# Professional Shortcuts: (Taste, benötigtes Widget-Attribut, Shortcut-Attribut, Slot, Bezeichnung)
+_PROFESSIONAL_SHORTCUTS = (
+    ("Ctrl+L", "logging_widget", "logging_shortcut", "showLoggingSystem", "Logging"),
+    ("Ctrl+H", "health_widget", "health_shortcut", "showHealthMonitor", "Health Monitor"),
+    ("Ctrl+D", "discovery_widget", "discovery_shortcut", "showECUDiscovery", "ECU Discovery"),
+    ("Ctrl+T", "template_widget", "template_shortcut", "showTemplateSystem", "Templates"),
+)
+
+# Protokolle die Reboot bzw. Fehlerspeicher unterstützen (Zonen lesen/schreiben: alle)
+REBOOT_PROTOCOLS = frozenset(("uds", "kwp_hab"))
+FAULT_PROTOCOLS = frozenset(("uds",))
+
+# Datei-Dialoge: keine Symlink-Auflösung, beim Öffnen keine Schreibrechte-Prüfung
+FILE_DIALOG_OPEN_OPTIONS = QFileDialog.DontResolveSymlinks | QFileDialog.ReadOnly
+FILE_DIALOG_SAVE_OPTIONS = QFileDialog.DontResolveSymlinks
+
+# Mindestabstand zwischen PSA-RE Fortschrittsmeldungen in Sekunden
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Schreibpuffer für CSV-Ausgabe (Zonen-Dumps)
+CSV_BUFFER_SIZE = 1 << 20
+# Empfangene Pakete werden alle N Zeilen auf die Platte geschrieben
+CSV_FLUSH_PACKETS = 256
+
+# Start-Banner nur mit PYPSADIAG_VERBOSE=1 ausgeben (ein Schreibaufruf statt vieler prints)
+_VERBOSE = os.environ.get("PYPSADIAG_VERBOSE") == "1"
+_BANNER_ENHANCED = "\n".join([
+    "[ENHANCED] Enhanced Feature System erfolgreich initialisiert",
+    "[ENHANCED] >> Zugriff über Tastenkombination: Strg+E",
+    "[ENHANCED] >> Verfügbare Features:",
+    "[ENHANCED]    * Intelligenter Feature-Assistent",
+    "[ENHANCED]    * Visual Feature Browser",
+    "[ENHANCED]    * Erweiterte Pre-Activation Checks",
+    "[ENHANCED]    * Smart Backup System",
+]) + "\n"
+_BANNER_SYSTEMS = "\n".join([
+    "[SYSTEMS] Professional Systems erfolgreich initialisiert",
+    "[SYSTEMS] >> Verfügbare Professional Features:",
+    "[SYSTEMS]    * Connection Health Monitoring",
+    "[SYSTEMS]    * Enhanced Error Recovery",
+    "[SYSTEMS]    * Smart ECU Auto-Discovery",
+    "[SYSTEMS]    * Professional Logging",
+    "[SYSTEMS]    * Feature Template System",
+]) + "\n"
+
+# Enhanced/Professional Systeme werden erst beim Setup importiert (schnellerer Start, --help/--checkcalc ohne Last)
+def _try_import_enhanced():
+    """Enhanced Feature Activation System Klasse oder None"""
+    try:
+        from EnhancedFeatureActivationSystem import EnhancedFeatureActivationSystem
+        print("[ENHANCED] Enhanced Feature Activation System verfügbar")
+        return EnhancedFeatureActivationSystem
+    except ImportError as e:
+        print(f"[ENHANCED] Enhanced Features nicht verfügbar: {e}")
+        return None
+
+
+def _try_import_professional():
+    """Integrations-Funktionen der Professional Systems oder None"""
+    try:
+        from ConnectionHealthMonitor import integrate_connection_health_monitor
+        from EnhancedErrorRecovery import integrate_error_recovery
+        from SmartECUAutoDiscovery import integrate_ecu_auto_discovery
+        from ProfessionalLoggingSystem import integrate_professional_logging
+        from FeatureTemplateSystem import integrate_feature_template_system
+        print("[SYSTEMS] Professional Systems verfügbar")
+        return (integrate_professional_logging, integrate_connection_health_monitor, integrate_error_recovery,
+                integrate_ecu_auto_discovery, integrate_feature_template_system)
+    except ImportError as e:
+        print(f"[SYSTEMS] Professional Systems nicht verfügbar: {e}")
+        return None
+
+
+# Menü-Namen unter denen Enhanced Features eingehängt werden (inkl. selbst erstelltem Menü)
+_FEATURE_MENU_NAMES = frozenset(("Features", "&Features", "Tools", "&Tools", "&Enhanced Features"))
+
+
+def _find_menu(menubar, names):
+    """Erstes Menü der Menüleiste dessen Text in names enthalten ist, sonst None"""
+    for action in menubar.actions():
+        if action.text() in names:
+            return action.menu()
+    return None
+
+
+def _load_json_file(path):
+    """Zonen-Datei binär lesen und direkt parsen (orjson falls vorhanden)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # z.B. UTF-8 BOM: json erkennt die Kodierung selbst
+    return json.loads(data)
+
+
+def _parse_args(argv):
+    """Kommandozeile auswerten; unbekannte Optionen (z.B. Qt) werden ignoriert"""
+    parser = argparse.ArgumentParser(description="PyPSADiag")
+    parser.add_argument("--lang", default="en", help="Language, e.g. --lang nl for NL translation")
+    parser.add_argument("--simu", action="store_true", help="For simulation")
+    parser.add_argument("--scan", action="store_true", help="Scan mode")
+    parser.add_argument("--checkcalc", action="store_true", help="Test seed/key calculations")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def _run_checkcalc():
+    """Seed/Key Testberechnungen ausführen und beenden (benötigt kein Qt)"""
+    try:
+        calc = SeedKeyAlgorithm()
+        calc.testCalculations()
+        sys.exit(0)
+    except Exception as e:
+        print(f"Error running seed key calculations: {e}")
+        sys.exit(1)
+
+
+class SendReceiveThread(QThread):
+    """Manual command round-trips off the GUI thread (commands are sent in order)"""
+    replySignal = Signal(str)
+
+    def __init__(self, serialController):
+        super(SendReceiveThread, self).__init__()
+        self.serialController = serialController
+        self.commands = deque()
+        self.lock = threading.Lock()
+        self.active = False
+
+    def send(self, cmd: str, replyPrefix: str = ""):
+        with self.lock:
+            self.commands.append((cmd, replyPrefix))
+            if self.active:
+                return
+            self.active = True
+        # Thread may still be returning from a previous run()
+        self.wait()
+        self.start()
+
+    def run(self):
+        while True:
+            with self.lock:
+                if not self.commands:
+                    self.active = False
+                    return
+                cmd, replyPrefix = self.commands.popleft()
+            try:
+                receiveData = self.serialController.sendReceive(cmd)
+            except Exception as e:
+                receiveData = f"Error: {e}"
+            self.replySignal.emit(replyPrefix + receiveData)
+
+
+class BackupThread(QThread):
+    """Creates the safety snapshot before a zone write without blocking the GUI"""
+    backupDoneSignal = Signal(object, str)
+
+    def __init__(self, backupManager, parent=None, **snapshotArgs):
+        super(BackupThread, self).__init__(parent)
+        self.backupManager = backupManager
+        self.snapshotArgs = snapshotArgs
+
+    def run(self):
+        try:
+            snapshot = self.backupManager.create_snapshot(**self.snapshotArgs)
+            self.backupDoneSignal.emit(snapshot, "")
+        except Exception as e:
+            self.backupDoneSignal.emit(None, str(e))
 
 
 """
@@ -82,38 +250,42 @@ class MainWindow(QMainWindow):
     stream = None
     csvWriter = None
 
-    def __init__(self):
+    def __init__(self, args=None):
         super(MainWindow, self).__init__()
-        self.lang_code = "en"
-        self.lang = False
-        if len(sys.argv) >= 2:
-            for arg in sys.argv:
-                if arg == "--lang":
-                    self.lang = True
-                elif self.lang:
-                    self.lang = False
-                    self.lang_code = str(arg)
-                elif arg == "--simu":
-                    self.simulation = True
-                elif arg == "--scan":
-                    self.scan = True
-                elif arg == "--checkcalc":
-                    try:
-                        calc = SeedKeyAlgorithm()
-                        calc.testCalculations()
-                        sys.exit(0)
-                    except Exception as e:
-                        print(f"Error running seed key calculations: {e}")
-                        sys.exit(1)
-                elif arg == "--help":
-                    print("Use --simu      For simulation")
-                    print("Use --lang nl   For NL translation")
-                    print("Use --checkcalc Test seed/key calculations")
-                    sys.exit(0)
+        # Ausgabezeilen werden gesammelt und einmal pro Frame angehängt
+        self._logBuffer = []
+        self._tsSecond = None
+        self._tsText = ""
+        # Enhanced System vorhanden / zuletzt synchronisierter ECU-Stand
+        self._hasEnhanced = False
+        # PSA-RE Module nach erstem erfolgreichen Import
+        self._psaReModules = None
+        self._lastProgressTs = 0.0
+        self._lastDefsPrinted = None
+        self._enhancedDirty = True
+        self._lastEcuSignature = None
+        # i18n ist zustandslos, gebundene Methode einmal merken
+        self._tr = i18n().tr
+        # Verzeichnisse einmal bestimmen
+        self._baseDir = os.path.dirname(os.path.abspath(__file__))
+        self._qmDir = os.path.join(self._baseDir, "i18n", "translations")
+        self._csvDir = os.path.join(self._baseDir, "csv")
+        self._jsonDir = os.path.join(self._baseDir, "json")
+        # Zuletzt benutzte Verzeichnisse der Datei-Dialoge
+        self._lastCsvDir = self._csvDir
+        self._lastJsonDir = self._jsonDir
+        if args is None:
+            args = _parse_args(sys.argv[1:])
+        if args.checkcalc:
+            _run_checkcalc()
+        self.lang_code = args.lang
+        self.simulation = args.simu
+        self.scan = args.scan
 
         self.addTranslators()
 
         self.ui.setupGUI(self, self.scan, self.lang_code)
+        self._ui_caps = self._probe_ui_caps()
         self.ui.languageComboBox.currentIndexChanged.connect(self.changeLanguage)
         
         # PSA-RE Button ist immer aktiv - Dependencies werden zur Laufzeit geprüft
@@ -160,58 +332,65 @@ class MainWindow(QMainWindow):
         self.serialController = SerialPort(self.simulation)
         self.serialController.fillPortNameCombobox(self.ui.portNameComboBox)
 
+        # Manual commands (Reset on connect, command line) run without blocking the GUI
+        self.sendReceiveThread = SendReceiveThread(self.serialController)
+        self.sendReceiveThread.replySignal.connect(self.writeToOutputView)
+
         # Set initial button states
         self.ui.DisconnectPort.setEnabled(False)
-        self.ui.readZone.setEnabled(False)
-        self.ui.writeZone.setEnabled(False)
-        self.ui.rebootEcu.setEnabled(False)
-        self.ui.clearEcuFaults.setEnabled(False)
-        self.ui.readEcuFaults.setEnabled(False)
+        self._setEcuButtonsEnabled(False)
         self.ui.virginWriteZone.setCheckState(Qt.Unchecked)
         self.ui.writeSecureTraceability.setCheckState(Qt.Checked)
 #        self.ui.useSketchSeedGenerator.setCheckState(Qt.Unchecked)
 
-        # UDS
-        self.udsCommunication = DiagnosticCommunication(self.serialController, "uds")
-        self.udsCommunication.receivedPacketSignal.connect(self.serialPacketReceiverCallback)
-        self.udsCommunication.outputToTextEditSignal.connect(self.outputToTextEditCallback)
-        self.udsCommunication.updateZoneDataSignal.connect(self.updateZoneDataback)
-
-        # KWP_IS
-        self.kwpisCommunication = DiagnosticCommunication(self.serialController, "kwp_is")
-        self.kwpisCommunication.receivedPacketSignal.connect(self.serialPacketReceiverCallback)
-        self.kwpisCommunication.outputToTextEditSignal.connect(self.outputToTextEditCallback)
-        self.kwpisCommunication.updateZoneDataSignal.connect(self.updateZoneDataback)
-
-        # KWP_HAB
-        self.kwphabCommunication = DiagnosticCommunication(self.serialController, "kwp_hab")
-        self.kwphabCommunication.receivedPacketSignal.connect(self.serialPacketReceiverCallback)
-        self.kwphabCommunication.outputToTextEditSignal.connect(self.outputToTextEditCallback)
-        self.kwphabCommunication.updateZoneDataSignal.connect(self.updateZoneDataback)
+        # UDS, KWP_IS, KWP_HAB: one DiagnosticCommunication per protocol, looked up by ecuObjectList["protocol"]
+        self._comms = {protocol: DiagnosticCommunication(self.serialController, protocol)
+                       for protocol in ("uds", "kwp_is", "kwp_hab")}
+        for communication in self._comms.values():
+            communication.receivedPacketSignal.connect(self.serialPacketReceiverCallback)
+            communication.outputToTextEditSignal.connect(self.outputToTextEditCallback)
+            communication.updateZoneDataSignal.connect(self.updateZoneDataback)
+        self.udsCommunication = self._comms["uds"]
+        self.kwpisCommunication = self._comms["kwp_is"]
+        self.kwphabCommunication = self._comms["kwp_hab"]
 
         # Open CSV reader, load file with method "enable(path)"
         self.fileLoaderThread = FileLoader.FileLoaderThread()
-        self.fileLoaderThread.newRowSignal.connect(self.csvReadCallback)
+        self.fileLoaderThread.newRowsSignal.connect(self.csvReadCallback, Qt.QueuedConnection)
 
         # Initialize Enhanced Feature Activation System (after all communication objects are created)
         self.setupEnhancedFeatures()
 
+    def _probe_ui_caps(self):
+        """Prüft einmalig welche optionalen UI-Elemente vorhanden sind"""
+        menubar = getattr(self.ui, 'menubar', None) or getattr(self.ui, 'menuBar', None)
+        features_menu = _find_menu(menubar, _FEATURE_MENU_NAMES) if menubar else None
+        return {
+            'tabWidget': getattr(self.ui, 'tabWidget', None),
+            'menubar': menubar,
+            'features_menu': features_menu,
+        }
+
     def setupEnhancedFeatures(self):
         """Initialisiert Enhanced Feature Activation System"""
-        if ENHANCED_FEATURES_AVAILABLE:
+        self._EnhancedCls = _try_import_enhanced()
+        if self._EnhancedCls is not None:
             try:
                 print("[ENHANCED] Initialisiere Enhanced Feature System...")
                 
                 # Enhanced System erstellen mit realer ECU-Liste
-                self.enhanced_system = EnhancedFeatureActivationSystem(
+                self.enhanced_system = self._EnhancedCls(
                     communication_bridge=self.udsCommunication,
                     real_ecu_list=self.ecuObjectList
                 )
+                self._hasEnhanced = True
                 
                 # Als neuen Tab hinzufügen (falls Tab-System vorhanden)
-                if hasattr(self.ui, 'tabWidget'):
+                tab_widget = self._ui_caps['tabWidget']
+                if tab_widget is not None:
                     try:
-                        tab_index = self.ui.tabWidget.addTab(self.enhanced_system, "🚀 Enhanced Features")
+                        tab_index = tab_widget.addTab(self.enhanced_system, "🚀 Enhanced Features")
+                        tab_widget.currentChanged.connect(self._onTabChanged)
                         print(f"[ENHANCED] Enhanced Features Tab hinzugefügt (Index: {tab_index})")
                     except Exception as e:
                         print(f"[ENHANCED] Tab-Integration fehlgeschlagen: {e}")
@@ -220,65 +399,39 @@ class MainWindow(QMainWindow):
                         print("[ENHANCED] Enhanced System als eigenständiges Fenster verfügbar")
                 
                 # Enhanced Features Menü-Eintrag hinzufügen (falls Menü vorhanden)
-                if hasattr(self.ui, 'menubar') or hasattr(self.ui, 'menuBar'):
+                menubar = self._ui_caps['menubar']
+                if menubar:
                     try:
-                        menubar = getattr(self.ui, 'menubar', None) or getattr(self.ui, 'menuBar', None)
-                        if menubar:
-                            # Versuche existierendes "Features" Menü zu finden oder erstelle neues
-                            features_menu = None
-                            for action in menubar.actions():
-                                if action.text() in ["Features", "&Features", "Tools", "&Tools"]:
-                                    features_menu = action.menu()
-                                    break
-                            
-                            if not features_menu:
-                                # Neues Features-Menü erstellen
-                                features_menu = menubar.addMenu("&Enhanced Features")
-                            
-                            # Enhanced Features Action hinzufügen
-                            enhanced_action = features_menu.addAction("🚀 Enhanced Feature Activation")
-                            enhanced_action.triggered.connect(self.showEnhancedFeatures)
-                            print("[ENHANCED] Menü-Eintrag für Enhanced Features hinzugefügt")
-                            
+                        # Existierendes "Features"/"Tools" Menü verwenden oder neues erstellen
+                        features_menu = self._ui_caps['features_menu']
+                        if not features_menu:
+                            # Neues Features-Menü erstellen
+                            features_menu = menubar.addMenu("&Enhanced Features")
+                            self._ui_caps['features_menu'] = features_menu
+                        
+                        # Enhanced Features Action hinzufügen
+                        enhanced_action = features_menu.addAction("🚀 Enhanced Feature Activation")
+                        enhanced_action.triggered.connect(self.showEnhancedFeatures)
+                        print("[ENHANCED] Menü-Eintrag für Enhanced Features hinzugefügt")
+                        
                     except Exception as e:
                         print(f"[ENHANCED] Menü-Integration fehlgeschlagen: {e}")
                 
-                print("[ENHANCED] Enhanced Feature System erfolgreich initialisiert")
-                print("[ENHANCED] >> Zugriff über Tastenkombination: Strg+E")
-                print("[ENHANCED] >> Verfügbare Features:")
-                print("[ENHANCED]    * Intelligenter Feature-Assistent")
-                print("[ENHANCED]    * Visual Feature Browser")
-                print("[ENHANCED]    * Erweiterte Pre-Activation Checks")
-                print("[ENHANCED]    * Smart Backup System")
+                if _VERBOSE:
+                    sys.stderr.write(_BANNER_ENHANCED)
                 
                 # Professional Systems Integration
                 self.setupProfessionalSystems()
                 
                 # Keyboard-Shortcut hinzufügen
-                try:
-                    try:
-                        from PySide6.QtGui import QShortcut, QKeySequence
-                    except ImportError:
-                        from PySide6.QtWidgets import QShortcut
-                        from PySide6.QtGui import QKeySequence
-                    
-                    self.enhanced_shortcut = QShortcut("Ctrl+E", self)
-                    self.enhanced_shortcut.activated.connect(self.showEnhancedFeatures)
-                    print("[ENHANCED] Keyboard-Shortcut Strg+E aktiviert")
-                    
-                except ImportError:
+                if _QShortcut is None:
+                    print("[ENHANCED] Keyboard-Shortcuts nicht verfügbar")
+                else:
                     try:
-                        from PyQt5.QtWidgets import QShortcut
-                        from PyQt5.QtGui import QKeySequence
-                        
-                        self.enhanced_shortcut = QShortcut("Ctrl+E", self)
-                        self.enhanced_shortcut.activated.connect(self.showEnhancedFeatures)
+                        self.enhanced_shortcut = _QShortcut("Ctrl+E", self, activated=self.showEnhancedFeatures)
                         print("[ENHANCED] Keyboard-Shortcut Strg+E aktiviert")
-                        
-                    except Exception:
-                        print("[ENHANCED] Keyboard-Shortcuts nicht verfügbar")
-                except Exception as e:
-                    print(f"[ENHANCED] Shortcut-Fehler: {e}")
+                    except Exception as e:
+                        print(f"[ENHANCED] Shortcut-Fehler: {e}")
                 
             except Exception as e:
                 print(f"[ENHANCED] Fehler bei Enhanced Features Setup: {e}")
@@ -289,7 +442,10 @@ class MainWindow(QMainWindow):
     
     def setupProfessionalSystems(self):
         """Initialisiert Professional Systems"""
-        if PROFESSIONAL_SYSTEMS_AVAILABLE:
+        professional = _try_import_professional()
+        if professional is not None:
+            (integrate_professional_logging, integrate_connection_health_monitor, integrate_error_recovery,
+             integrate_ecu_auto_discovery, integrate_feature_template_system) = professional
             try:
                 print("[SYSTEMS] Initialisiere Professional Systems...")
                 
@@ -348,13 +504,8 @@ class MainWindow(QMainWindow):
                     except Exception:
                         pass  # Logging-Fehler nicht weiter propagieren
                 
-                print("[SYSTEMS] Professional Systems erfolgreich initialisiert")
-                print("[SYSTEMS] >> Verfügbare Professional Features:")
-                print("[SYSTEMS]    * Connection Health Monitoring")
-                print("[SYSTEMS]    * Enhanced Error Recovery")
-                print("[SYSTEMS]    * Smart ECU Auto-Discovery") 
-                print("[SYSTEMS]    * Professional Logging")
-                print("[SYSTEMS]    * Feature Template System")
+                if _VERBOSE:
+                    sys.stderr.write(_BANNER_SYSTEMS)
                 
                 # Keyboard-Shortcuts für Professional Features
                 self.setupProfessionalShortcuts()
@@ -370,33 +521,13 @@ class MainWindow(QMainWindow):
     
     def setupProfessionalShortcuts(self):
         """Erstellt Keyboard-Shortcuts für Professional Features"""
+        if _QShortcut is None:
+            return
         try:
-            # Strg+L für Logging System
-            try:
-                from PySide6.QtGui import QShortcut
-            except ImportError:
-                from PyQt5.QtWidgets import QShortcut
-            
-            if hasattr(self, 'logging_widget'):
-                self.logging_shortcut = QShortcut("Ctrl+L", self)
-                self.logging_shortcut.activated.connect(self.showLoggingSystem)
-                print("[SYSTEMS] Keyboard-Shortcut Strg+L für Logging aktiviert")
-            
-            if hasattr(self, 'health_widget'):
-                self.health_shortcut = QShortcut("Ctrl+H", self)
-                self.health_shortcut.activated.connect(self.showHealthMonitor)
-                print("[SYSTEMS] Keyboard-Shortcut Strg+H für Health Monitor aktiviert")
-            
-            if hasattr(self, 'discovery_widget'):
-                self.discovery_shortcut = QShortcut("Ctrl+D", self)
-                self.discovery_shortcut.activated.connect(self.showECUDiscovery)
-                print("[SYSTEMS] Keyboard-Shortcut Strg+D für ECU Discovery aktiviert")
-            
-            if hasattr(self, 'template_widget'):
-                self.template_shortcut = QShortcut("Ctrl+T", self)
-                self.template_shortcut.activated.connect(self.showTemplateSystem)
-                print("[SYSTEMS] Keyboard-Shortcut Strg+T für Templates aktiviert")
-                
+            for key, widget, attribute, slot, label in _PROFESSIONAL_SHORTCUTS:
+                if hasattr(self, widget):
+                    setattr(self, attribute, _QShortcut(key, self, activated=getattr(self, slot)))
+                    print(f"[SYSTEMS] Keyboard-Shortcut {key.replace('Ctrl', 'Strg')} für {label} aktiviert")
         except Exception as e:
             print(f"[SYSTEMS] Shortcut-Fehler: {e}")
     
@@ -437,58 +568,79 @@ class MainWindow(QMainWindow):
         self.showEnhancedFeatures()
     
     def syncEnhancedFeaturesEcuList(self):
-        """Synchronisiert ECU-Liste mit Enhanced Features System"""
-        if hasattr(self, 'enhanced_system') and self.enhanced_system:
-            # Sammle alle verfügbaren ECU-Informationen
-            all_ecus = {}
-            
-            # Einzelne ECU aus ecuObjectList
-            if self.ecuObjectList and isinstance(self.ecuObjectList, dict):
-                if "name" in self.ecuObjectList:
-                    all_ecus[self.ecuObjectList["name"]] = self.ecuObjectList
-            
-            # Multi-ECU Support: Prüfe ecuComboBox für weitere ECUs
-            if hasattr(self.ui, 'ecuComboBox') and self.ui.ecuComboBox:
-                combo_count = self.ui.ecuComboBox.count()
-                if combo_count > 1:  # Mehr als nur die aktuelle ECU
-                    print(f"[ENHANCED] Multi-ECU erkannt: {combo_count} ECUs in ComboBox")
-                    for i in range(combo_count):
-                        ecu_name = self.ui.ecuComboBox.itemText(i)
-                        if ecu_name and ecu_name not in all_ecus:
-                            # Erstelle ECU-Entry für alle ComboBox-ECUs
-                            all_ecus[ecu_name] = {
-                                "name": ecu_name,
-                                "tx_id": "auto",  # Wird vom System ermittelt
-                                "rx_id": "auto",
-                                "protocol": "uds",  # Standard
-                                "zones": {},  # Wird beim ersten Zugriff gefüllt
-                                "multi_ecu_mode": True
-                            }
-            
-            # Erweiterte ECU-Discovery: Prüfe auf erkannte ECUs über VCI-Scan
-            if hasattr(self, 'scan') and self.scan:
-                print("[ENHANCED] Scan-Modus aktiv - erweiterte ECU-Erkennung")
-                # Hier könnte erweiterte ECU-Discovery implementiert werden
-            
-            if all_ecus:
-                self.enhanced_system.update_ecu_list(all_ecus)
-                print(f"[ENHANCED] ECU-Liste synchronisiert: {len(all_ecus)} ECUs")
-            else:
-                print("[ENHANCED] Keine ECUs für Synchronisation verfügbar")
+        """Markiert ECU-Liste als geändert; übertragen wird erst wenn das Enhanced System sichtbar ist"""
+        if not self._hasEnhanced:
+            return
+        self._enhancedDirty = True
+        if self.enhanced_system.isVisible():
+            self._pushEnhancedEcuList()
+
+    def _onTabChanged(self, index):
+        if self._hasEnhanced and self._ui_caps['tabWidget'].widget(index) is self.enhanced_system:
+            self._pushEnhancedEcuList()
+
+    def _pushEnhancedEcuList(self):
+        """Synchronisiert ECU-Liste mit Enhanced Features System (nur wenn geändert)"""
+        if not self._hasEnhanced or not self._enhancedDirty:
+            return
+        self._enhancedDirty = False
+
+        # ComboBox einmal auslesen; unverändert gegenüber letzter Synchronisation -> nichts zu tun
+        ecuObjectList = self.ecuObjectList if isinstance(self.ecuObjectList, dict) else None
+        comboBox = self.ui.ecuComboBox
+        comboTexts = [comboBox.itemText(i) for i in range(comboBox.count())]
+        signature = (id(ecuObjectList), ecuObjectList.get("name") if ecuObjectList else None, tuple(comboTexts))
+        if signature == self._lastEcuSignature:
+            return
+        self._lastEcuSignature = signature
+
+        # Sammle alle verfügbaren ECU-Informationen
+        all_ecus = {}
+
+        # Einzelne ECU aus ecuObjectList
+        if ecuObjectList and "name" in ecuObjectList:
+            all_ecus[ecuObjectList["name"]] = ecuObjectList
+
+        # Multi-ECU Support: Prüfe ecuComboBox für weitere ECUs
+        if len(comboTexts) > 1:  # Mehr als nur die aktuelle ECU
+            print(f"[ENHANCED] Multi-ECU erkannt: {len(comboTexts)} ECUs in ComboBox")
+            for ecu_name in comboTexts:
+                if ecu_name and ecu_name not in all_ecus:
+                    # Erstelle ECU-Entry für alle ComboBox-ECUs
+                    all_ecus[ecu_name] = {
+                        "name": ecu_name,
+                        "tx_id": "auto",  # Wird vom System ermittelt
+                        "rx_id": "auto",
+                        "protocol": "uds",  # Standard
+                        "zones": {},  # Wird beim ersten Zugriff gefüllt
+                        "multi_ecu_mode": True
+                    }
+
+        # Erweiterte ECU-Discovery: Prüfe auf erkannte ECUs über VCI-Scan
+        if self.scan:
+            print("[ENHANCED] Scan-Modus aktiv - erweiterte ECU-Erkennung")
+            # Hier könnte erweiterte ECU-Discovery implementiert werden
+
+        if all_ecus:
+            self.enhanced_system.update_ecu_list(all_ecus)
+            print(f"[ENHANCED] ECU-Liste synchronisiert: {len(all_ecus)} ECUs")
+        else:
+            print("[ENHANCED] Keine ECUs für Synchronisation verfügbar")
 
     def showEnhancedFeatures(self):
         """Zeigt Enhanced Features System"""
         if hasattr(self, 'enhanced_system'):
             try:
                 # ECU-Liste vor dem Anzeigen synchronisieren
-                self.syncEnhancedFeaturesEcuList()
+                self._pushEnhancedEcuList()
                 
-                # Falls als Tab integriert, zum Tab wechseln
-                if hasattr(self.ui, 'tabWidget'):
-                    for i in range(self.ui.tabWidget.count()):
-                        if self.ui.tabWidget.tabText(i).contains("Enhanced Features"):
-                            self.ui.tabWidget.setCurrentIndex(i)
-                            return
+                # Falls als Tab integriert, zum Tab wechseln (indexOf bleibt auch nach Verschieben korrekt)
+                tab_widget = self._ui_caps['tabWidget']
+                if tab_widget is not None:
+                    tab_index = tab_widget.indexOf(self.enhanced_system)
+                    if tab_index >= 0:
+                        tab_widget.setCurrentIndex(tab_index)
+                        return
                 
                 # Falls als eigenständiges Fenster, zeigen
                 self.enhanced_system.show()
@@ -507,8 +659,9 @@ class MainWindow(QMainWindow):
 
     def changeLanguage(self, index):
             lang_code = self.ui.languageComboBox.itemData(index)
-            if lang_code:
-                self.lang_code = lang_code
+            if not lang_code or lang_code == self.lang_code:
+                return
+            self.lang_code = lang_code
 
             self.loadTranslator()
             self.ui.translateGUI(self)
@@ -516,37 +669,45 @@ class MainWindow(QMainWindow):
                 self.updateEcuZonesAndKeys(self.ecuObjectList)
 
     def loadTranslator(self):
-            qm_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "i18n", "translations", f"PyPSADiag_{self.lang_code}.qm")
+            qm_path = os.path.join(self._qmDir, f"PyPSADiag_{self.lang_code}.qm")
             self.translator.load(qm_path)
 
     # Update ECU Combobox and Zone Tree view with "new" Zone file
     def updateEcuZonesAndKeys(self, ecuObjectList: dict):
-        # Update ECU Zone ComboBox
-        self.ui.ecuComboBox.clear()
-        name = ecuObjectList["name"]
-        self.ui.ecuComboBox.addItem(name)
-        if "zones" in ecuObjectList:
-            zoneObjectList = ecuObjectList["zones"]
-            # Update ECU Key ComboBox
-            self.ui.ecuKeyComboBox.clear()
-            keyType = ecuObjectList["key_type"]
-            if keyType == "single":
-                key = str(ecuObjectList["keys"])
-                item = name + " - " + key
-                self.ui.ecuKeyComboBox.addItem(item, key)
-            elif keyType == "multi":
-                for keyItem in ecuObjectList["keys"]:
-                    key = str(ecuObjectList["keys"][keyItem])
-                    item = str(keyItem) + " - " + key
+        # Beide ComboBoxen ohne Signale/Repaints befüllen, ein Repaint am Ende
+        comboBoxes = (self.ui.ecuComboBox, self.ui.ecuKeyComboBox)
+        for comboBox in comboBoxes:
+            comboBox.setUpdatesEnabled(False)
+            comboBox.blockSignals(True)
+        try:
+            # Update ECU Zone ComboBox
+            self.ui.ecuComboBox.clear()
+            name = ecuObjectList["name"]
+            if "zones" in ecuObjectList:
+                zoneObjectList = ecuObjectList["zones"]
+                # Update ECU Key ComboBox
+                self.ui.ecuKeyComboBox.clear()
+                keyType = ecuObjectList["key_type"]
+                if keyType == "single":
+                    key = str(ecuObjectList["keys"])
+                    item = name + " - " + key
                     self.ui.ecuKeyComboBox.addItem(item, key)
-        elif "ecu" in ecuObjectList:
-            zoneObjectList = ecuObjectList["ecu"]
-        else:
-            self.writeToOutputView(i18n().tr("Not correct JSON file"))
-            return;
+                elif keyType == "multi":
+                    items = [(str(keyItem) + " - " + str(key), str(key)) for keyItem, key in ecuObjectList["keys"].items()]
+                    for item, key in items:
+                        self.ui.ecuKeyComboBox.addItem(item, key)
+            elif "ecu" in ecuObjectList:
+                zoneObjectList = ecuObjectList["ecu"]
+            else:
+                self.ui.ecuComboBox.addItem(name)
+                self.writeToOutputView(self._tr("Not correct JSON file"))
+                return;
 
-        for zoneObject in zoneObjectList:
-            self.ui.ecuComboBox.addItem(str(zoneObject))
+            self.ui.ecuComboBox.addItems([name] + [str(zoneObject) for zoneObject in zoneObjectList])
+        finally:
+            for comboBox in comboBoxes:
+                comboBox.blockSignals(False)
+                comboBox.setUpdatesEnabled(True)
 
         self.ui.treeView.updateView(ecuObjectList)
         
@@ -554,8 +715,36 @@ class MainWindow(QMainWindow):
         self.syncEnhancedFeaturesEcuList()
 
     def writeToOutputView(self, text: str):
-        self.ui.output.append(str(datetime.now()) + " --|  " + text)
-        self.ui.output.viewport().repaint()
+        if not self._logBuffer:
+            QTimer.singleShot(16, self._flushOutputView)
+        self._logBuffer.append(self._timestamp() + " --|  " + text)
+
+    def writeLinesToOutputView(self, lines):
+        # Mehrere Zeilen auf einmal in den Puffer (ein Zeitstempel, ein Append beim Flush)
+        lines = list(lines)
+        if not lines:
+            return
+        if not self._logBuffer:
+            QTimer.singleShot(16, self._flushOutputView)
+        timestamp = self._timestamp() + " --|  "
+        self._logBuffer.extend(timestamp + line for line in lines)
+
+    def _timestamp(self):
+        """Zeitstempel, nur einmal pro Sekunde neu formatiert"""
+        now = int(time.time())
+        if now != self._tsSecond:
+            self._tsSecond = now
+            self._tsText = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        return self._tsText
+
+    def _flushOutputView(self):
+        if self._logBuffer:
+            output = self.ui.output
+            output.setUpdatesEnabled(False)
+            output.append("\n".join(self._logBuffer))
+            self._logBuffer.clear()
+            output.setUpdatesEnabled(True)
+            output.ensureCursorVisible()
 
     @Slot()
     def searchConnectPort(self):
@@ -568,8 +757,7 @@ class MainWindow(QMainWindow):
         
         if success:
             # Set button states
-            self.ui.ConnectPort.setEnabled(False)
-            self.ui.DisconnectPort.setEnabled(True)
+            self._setConnected(True)
             
             # Check if using VCI
             if port_name == "Evolution XS VCI" or self.serialController.use_vci:
@@ -589,27 +777,32 @@ class MainWindow(QMainWindow):
                 # Traditional serial communication - send Reset command
                 cmd = "R"
                 self.writeToOutputView("> " + cmd)
-                receiveData = self.serialController.sendReceive(cmd)
-                self.writeToOutputView("< " + receiveData)
+                self.sendReceiveThread.send(cmd, "< ")
         else:
             self.writeToOutputView("Failed to connect to " + port_name)
         
         # Enhanced Features ECU-Liste nach Verbindung synchronisieren
         self.syncEnhancedFeaturesEcuList()
 
+    def _setConnected(self, connected: bool):
+        self.ui.ConnectPort.setEnabled(not connected)
+        self.ui.DisconnectPort.setEnabled(connected)
+
+    def _setEcuButtonsEnabled(self, enabled: bool):
+        # ECU-Buttons sind aktiv sobald eine Zonen-Datei geladen ist
+        for button in (self.ui.readZone, self.ui.writeZone, self.ui.rebootEcu, self.ui.clearEcuFaults, self.ui.readEcuFaults):
+            button.setEnabled(enabled)
+
     @Slot()
     def disconnectPort(self):
         if self.stream != None:
             self.stream.close()
+            self.stream = None
         self.serialController.close()
-        self.ui.ConnectPort.setEnabled(True)
-        self.ui.DisconnectPort.setEnabled(False)
-        self.ui.readZone.setEnabled(False)
-        self.ui.writeZone.setEnabled(False)
-        self.ui.writeZone.setEnabled(False)
-        self.ui.clearEcuFaults.setEnabled(False)
-        self.ui.readEcuFaults.setEnabled(False)
-        self.ui.rebootEcu.setEnabled(False)
+        self.setUpdatesEnabled(False)
+        self._setConnected(False)
+        self._setEcuButtonsEnabled(False)
+        self.setUpdatesEnabled(True)
 #        self.ui.useSketchSeedGenerator.setCheckState(Qt.Unchecked)
 #        self.ui.useSketchSeedGenerator.setEnabled(True)
 
@@ -623,17 +816,17 @@ class MainWindow(QMainWindow):
             cmd = self.ui.command.text()
             self.ui.command.clear()
             self.writeToOutputView(cmd)
-            self.receiveData = self.serialController.sendReceive(cmd)
-            self.writeToOutputView(self.receiveData)
+            self.sendReceiveThread.send(cmd)
         else:
-            self.writeToOutputView(i18n().tr("Port not open!"))
+            self.writeToOutputView(self._tr("Port not open!"))
 
     @Slot()
     def openCSVFile(self):
-        path = os.path.join(os.path.dirname(__file__), "csv")
-        fileName = QFileDialog.getOpenFileName(self, i18n().tr("Open CSV Zone File"), path, i18n().tr("CSV Files") + "(*.csv)")
+        fileName = QFileDialog.getOpenFileName(self, self._tr("Open CSV Zone File"), self._lastCsvDir, self._tr("CSV Files") + "(*.csv)",
+                                               options=FILE_DIALOG_OPEN_OPTIONS)
         if fileName[0] == "":
             return
+        self._lastCsvDir = os.path.dirname(fileName[0])
 
         self.ui.treeView.clearZoneListValues()
         self.ui.setFilePathInWindowsTitle(fileName[0])
@@ -641,50 +834,60 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def saveCSVFile(self):
-        path = os.path.join(os.path.dirname(__file__), "csv")
-        fileName = QFileDialog.getSaveFileName(self, i18n().tr("Save CSV Zone File"), path, i18n().tr("CSV Files") + "(*.csv)")
+        fileName = QFileDialog.getSaveFileName(self, self._tr("Save CSV Zone File"), self._lastCsvDir, self._tr("CSV Files") + "(*.csv)",
+                                               options=FILE_DIALOG_SAVE_OPTIONS)
         if fileName[0] == "":
             return
+        self._lastCsvDir = os.path.dirname(fileName[0])
 
         # Open CSV for writing
         self.ui.setFilePathInWindowsTitle(fileName[0])
-        self.stream = open(fileName[0], 'w', newline='')
-        self.csvWriter = csv.writer(self.stream)
+        self.openCsvStream(fileName[0])
         if self.stream != None:
             valueList = self.ui.treeView.getValuesAsCSV()
-            for tabList in valueList:
-                for zone in tabList:
-                    self.csvWriter.writerow(zone)
+            self.csvWriter.writerows(chain.from_iterable(valueList))
             self.stream.flush()
 
+    def openCsvStream(self, path):
+        # Großer Puffer: Zeilen werden gesammelt geschrieben, geleert periodisch und beim Schließen
+        self._packetsSinceFlush = 0
+        if self.stream != None and not self.stream.closed and self.stream.name == path:
+            # Gleiche Datei erneut: Stream und Writer wiederverwenden, Inhalt verwerfen
+            self.stream.seek(0)
+            self.stream.truncate()
+            return
+        if self.stream != None:
+            self.stream.close()
+        self.stream = open(path, 'w', newline='', buffering=CSV_BUFFER_SIZE)
+        self.csvWriter = csv.writer(self.stream)
+
     @Slot()
     def openZoneFile(self):
-        path = os.path.join(os.path.dirname(__file__), "json")
-        fileName = QFileDialog.getOpenFileName(self, i18n().tr("Open JSON Zone File"), path, i18n().tr("JSON Files") + "(*.json)")
+        fileName = QFileDialog.getOpenFileName(self, self._tr("Open JSON Zone File"), self._lastJsonDir, self._tr("JSON Files") + "(*.json)",
+                                               options=FILE_DIALOG_OPEN_OPTIONS)
         if fileName[0] == "":
             return
-        file = open(fileName[0], 'r', encoding='utf-8')
-        jsonFile = file.read()
-        self.ecuObjectList = json.loads(jsonFile.encode("utf-8"))
+        self._lastJsonDir = os.path.dirname(fileName[0])
+        self.ecuObjectList = _load_json_file(fileName[0])
         # Do we need to include a JSON File and attach it to 'zones'
         if "include_zone_object" in self.ecuObjectList:
-            includeZonePath = os.path.join(os.path.dirname(__file__), self.ecuObjectList["include_zone_object"])
+            includeZonePath = os.path.join(self._baseDir, self.ecuObjectList["include_zone_object"])
             if os.path.exists(includeZonePath):
-                includeZoneFile = open(includeZonePath, 'r', encoding='utf-8')
-                includeJsonFile = includeZoneFile.read()
-                includeObjectList = json.loads(includeJsonFile.encode("utf-8"))
+                includeObjectList = _load_json_file(includeZonePath)
                 self.ecuObjectList["zones"].update(includeObjectList)
             else:
-                self.writeToOutputView(i18n().tr("Include Zone file not found: ") + includeZonePath)
+                self.writeToOutputView(self._tr("Include Zone file not found: ") + includeZonePath)
+
+        # Setup CAN_EMIT_ID and LIN_ID (if present) once per loaded ECU
+        if "tx_id" in self.ecuObjectList and "rx_id" in self.ecuObjectList:
+            self._ecuAddr = ">" + self.ecuObjectList["tx_id"] + ":" + self.ecuObjectList["rx_id"]
+        else:
+            self._ecuAddr = ""
+        self._linAddr = "L" + self.ecuObjectList["lin_id"] if "lin_id" in self.ecuObjectList else ""
 
         self.updateEcuZonesAndKeys(self.ecuObjectList)
         self.ui.setFilePathInWindowsTitle("")
-        self.ui.readZone.setEnabled(True)
-        self.ui.writeZone.setEnabled(True)
-        self.ui.writeZone.setEnabled(True)
-        self.ui.clearEcuFaults.setEnabled(True)
-        self.ui.readEcuFaults.setEnabled(True)
-        self.ui.rebootEcu.setEnabled(True)
+        self._setEcuButtonsEnabled(True)
         
         # Configure VCI if already connected
         if self.serialController.isOpen() and self.serialController.use_vci:
@@ -698,56 +901,44 @@ class MainWindow(QMainWindow):
             else:
                 self.writeToOutputView("VCI configuration failed for ECU: " + self.ecuObjectList["name"])
 
+    def _communicationFor(self, protocols=None):
+        """DiagnosticCommunication für das Protokoll der geladenen ECU, None wenn nicht unterstützt"""
+        protocol = self.ecuObjectList["protocol"]
+        if protocols is not None and protocol not in protocols:
+            return None
+        return self._comms.get(protocol)
+
     @Slot()
     def readZone(self):
         if self.serialController.isOpen():
-            path = os.path.join(os.path.dirname(__file__), "csv")
-            fileName = QFileDialog.getSaveFileName(self, i18n().tr("Save CSV Zone File"), path, i18n().tr("CSV Files") + "(*.csv)")
+            fileName = QFileDialog.getSaveFileName(self, self._tr("Save CSV Zone File"), self._lastCsvDir, self._tr("CSV Files") + "(*.csv)",
+                                                   options=FILE_DIALOG_SAVE_OPTIONS)
             if fileName[0] == "":
                 return
+            self._lastCsvDir = os.path.dirname(fileName[0])
 
             # Open CSV for writing
             self.ui.setFilePathInWindowsTitle(fileName[0])
-            self.stream = open(fileName[0], 'w', newline='')
-            self.csvWriter = csv.writer(self.stream)
+            self.openCsvStream(fileName[0])
 
-            # Setup CAN_EMIT_ID
-            ecu = ">" + self.ecuObjectList["tx_id"] + ":" + self.ecuObjectList["rx_id"]
+            # CAN_EMIT_ID / LIN_ID (set up in openZoneFile)
+            ecu = self._ecuAddr
+            lin = self._linAddr
 
-            # Setup LIN_ID if present
-            lin = ""
-            if "lin_id" in self.ecuObjectList:
-                lin = "L" + self.ecuObjectList["lin_id"]
-
-            if self.ecuObjectList["protocol"] == "uds":
-                # Read Requested Zone or ALL Zones from ECU
-                if self.ui.ecuComboBox.currentIndex() == 0:
-                    self.udsCommunication.setZonesToRead(ecu, lin, self.ecuObjectList["zones"])
-                else:
-                    zone = {}
-                    zone[self.ui.ecuComboBox.currentText()] = self.ecuObjectList["zones"][self.ui.ecuComboBox.currentText()];
-                    self.udsCommunication.setZonesToRead(ecu, lin, zone)
-            elif self.ecuObjectList["protocol"] == "kwp_is":
+            communication = self._communicationFor()
+            if communication is not None:
                 # Read Requested Zone or ALL Zones from ECU
                 if self.ui.ecuComboBox.currentIndex() == 0:
-                    self.kwpisCommunication.setZonesToRead(ecu, lin, self.ecuObjectList["zones"])
+                    communication.setZonesToRead(ecu, lin, self.ecuObjectList["zones"])
                 else:
                     zone = {}
                     zone[self.ui.ecuComboBox.currentText()] = self.ecuObjectList["zones"][self.ui.ecuComboBox.currentText()];
-                    self.kwpisCommunication.setZonesToRead(ecu, lin, zone)
-            elif self.ecuObjectList["protocol"] == "kwp_hab":
-                # Read Requested Zone or ALL Zones from ECU
-                if self.ui.ecuComboBox.currentIndex() == 0:
-                    self.kwphabCommunication.setZonesToRead(ecu, lin, self.ecuObjectList["zones"])
-                else:
-                    zone = {}
-                    zone[self.ui.ecuComboBox.currentText()] = self.ecuObjectList["zones"][self.ui.ecuComboBox.currentText()];
-                    self.kwphabCommunication.setZonesToRead(ecu, lin, zone)
+                    communication.setZonesToRead(ecu, lin, zone)
             else:
-                self.writeToOutputView(i18n().tr("Protocol not supported yet!"))
+                self.writeToOutputView(self._tr("Protocol not supported yet!"))
                 return
         else:
-            self.writeToOutputView(i18n().tr("Port not open!"))
+            self.writeToOutputView(self._tr("Port not open!"))
 
 
     @Slot()
@@ -756,121 +947,138 @@ class MainWindow(QMainWindow):
             # Setup text of changed zones and put it into MessageBox
             virginWrite = self.ui.virginWriteZone.isChecked()
             self.ui.virginWriteZone.setCheckState(Qt.Unchecked)
-            text = ""
-            changeCount = 0
             valueList = self.ui.treeView.getZoneListOfHexValue(virginWrite)
-            for tabList in valueList:
-                for zone in tabList:
-                    text += str(zone) + "\r\n"
-                    changeCount += 1
+            zoneLines = [str(zone) for zone in chain.from_iterable(valueList)]
+            changeCount = len(zoneLines)
+            text = "".join(line + "\r\n" for line in zoneLines)
             if changeCount == 0:
-                self.writeToOutputView(i18n().tr("Nothing changed"))
+                self.writeToOutputView(self._tr("Nothing changed"))
                 return
 
             # Give some option to check values and to cancel the write
-            # SICHERHEIT: Automatisches Backup vor Zone-Schreibung
-            backup_created = False
+            # SICHERHEIT: Automatisches Backup vor Zone-Schreibung (im Hintergrund, während der Dialog offen ist)
+            backupThread = None
             if hasattr(self, 'enhanced_system') and self.enhanced_system:
-                try:
-                    ecu_name = self.ecuObjectList.get("name", "Unknown_ECU")
-                    snapshot = self.enhanced_system.backup_manager.create_snapshot(
-                        name=f"Auto_Backup_before_{ecu_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                        description=f"Automatisches Backup vor Zone-Schreibung: {changeCount} Änderungen",
-                        backup_type="pre_write",
-                        ecu_addresses=[ecu_name]
-                    )
-                    if snapshot:
-                        backup_created = True
-                        print(f"[BACKUP] Automatisches Backup erstellt: {snapshot.id}")
-                        self.writeToOutputView(f"[SICHERHEIT] Backup erstellt: {snapshot.id}")
-                except Exception as e:
-                    print(f"[BACKUP] Warnung - Backup fehlgeschlagen: {e}")
-                    self.writeToOutputView(f"[WARNUNG] Backup fehlgeschlagen: {e}")
+                # Backup Manager braucht die aktuelle ECU-Liste
+                self._pushEnhancedEcuList()
+                ecu_name = self.ecuObjectList.get("name", "Unknown_ECU")
+                backupThread = BackupThread(
+                    self.enhanced_system.backup_manager, self,
+                    name=f"Auto_Backup_before_{ecu_name}_{time.strftime('%Y%m%d_%H%M%S')}",
+                    description=f"Automatisches Backup vor Zone-Schreibung: {changeCount} Änderungen",
+                    backup_type="pre_write",
+                    ecu_addresses=[ecu_name]
+                )
+
+            changedialog = MessageDialog(self, self._tr("Write zone(s) to ECU"), self._tr("Write"), 
+                                       text + ("\n[SICHERHEIT] Backup wird erstellt..." if backupThread else "\n[WARNUNG] Kein Backup erstellt!"))
+            if backupThread is not None:
+                # Schreiben erst freigeben wenn das Backup fertig (oder fehlgeschlagen) ist
+                changedialog.acceptButton.setEnabled(False)
 
-            changedialog = MessageDialog(self, i18n().tr("Write zone(s) to ECU"), i18n().tr("Write"), 
-                                       text + (f"\n[SICHERHEIT] Backup erstellt: ✓" if backup_created else "\n[WARNUNG] Kein Backup erstellt!"))
+                def backupDone(snapshot, error):
+                    if not changedialog.isVisible():
+                        # Dialog bereits geschlossen (abgebrochen)
+                        return
+                    if snapshot:
+                        changedialog.output.append("[SICHERHEIT] Backup erstellt: ✓")
+                    else:
+                        changedialog.output.append("[WARNUNG] Kein Backup erstellt!")
+                    changedialog.acceptButton.setEnabled(True)
+
+                # Thread gehört dem Fenster und räumt sich nach Ende selbst weg;
+                # das Ergebnis wird auch nach Abbruch des Dialogs noch protokolliert
+                backupThread.backupDoneSignal.connect(self.backupDoneCallback)
+                backupThread.backupDoneSignal.connect(backupDone)
+                backupThread.finished.connect(backupThread.deleteLater)
+                backupThread.start()
             if MessageDialog.Rejected == changedialog.exec():
                 return
 
             # Get the corresponding ECU Key from Combobox
             index = self.ui.ecuKeyComboBox.currentIndex()
             key = self.ui.ecuKeyComboBox.itemData(index)
-            # Setup CAN_EMIT_ID
-            ecu = ">" + self.ecuObjectList["tx_id"] + ":" + self.ecuObjectList["rx_id"]
-
-            # Setup LIN_ID if present
-            lin = ""
-            if "lin_id" in self.ecuObjectList:
-                lin = "L" + self.ecuObjectList["lin_id"]
-
-            if self.ecuObjectList["protocol"] == "uds":
-#                self.udsCommunication.writeZoneList(self.ui.useSketchSeedGenerator.isChecked(), ecu, lin, key, valueList, self.ui.writeSecureTraceability.isChecked())
-                self.udsCommunication.writeZoneList(False, ecu, lin, key, valueList, self.ui.writeSecureTraceability.isChecked())
-            elif self.ecuObjectList["protocol"] == "kwp_is":
-                self.kwpisCommunication.writeZoneList(False, ecu, lin, key, valueList, self.ui.writeSecureTraceability.isChecked())
-            elif self.ecuObjectList["protocol"] == "kwp_hab":
-                self.kwphabCommunication.writeZoneList(False, ecu, lin, key, valueList, self.ui.writeSecureTraceability.isChecked())
+            # CAN_EMIT_ID / LIN_ID (set up in openZoneFile)
+            ecu = self._ecuAddr
+            lin = self._linAddr
+
+            communication = self._communicationFor()
+            if communication is not None:
+#                communication.writeZoneList(self.ui.useSketchSeedGenerator.isChecked(), ecu, lin, key, valueList, self.ui.writeSecureTraceability.isChecked())
+                communication.writeZoneList(False, ecu, lin, key, valueList, self.ui.writeSecureTraceability.isChecked())
             else:
-                self.writeToOutputView(i18n().tr("Protocol not supported yet!"))
+                self.writeToOutputView(self._tr("Protocol not supported yet!"))
                 return
         else:
-            self.writeToOutputView(i18n().tr("Port not open!"))
+            self.writeToOutputView(self._tr("Port not open!"))
 
 
     @Slot()
     def rebootEcu(self):
         if self.serialController.isOpen():
-            # Setup CAN_EMIT_ID
-            ecu = ">" + self.ecuObjectList["tx_id"] + ":" + self.ecuObjectList["rx_id"]
+            # CAN_EMIT_ID (set up in openZoneFile)
+            ecu = self._ecuAddr
 
-            if self.ecuObjectList["protocol"] == "uds":
-                self.udsCommunication.rebootEcu(ecu)
-            elif self.ecuObjectList["protocol"] == "kwp_hab":
-                self.kwphabCommunication.rebootEcu(ecu)
+            communication = self._communicationFor(REBOOT_PROTOCOLS)
+            if communication is not None:
+                communication.rebootEcu(ecu)
             else:
-                self.writeToOutputView(i18n().tr("Protocol not supported yet!"))
+                self.writeToOutputView(self._tr("Protocol not supported yet!"))
                 return
         else:
-            self.writeToOutputView(i18n().tr("Port not open!"))
+            self.writeToOutputView(self._tr("Port not open!"))
 
     @Slot()
     def readEcuFaults(self):
         if self.serialController.isOpen():
-            # Setup CAN_EMIT_ID
-            ecu = ">" + self.ecuObjectList["tx_id"] + ":" + self.ecuObjectList["rx_id"]
+            # CAN_EMIT_ID (set up in openZoneFile)
+            ecu = self._ecuAddr
 
-            if self.ecuObjectList["protocol"] == "uds":
-                self.udsCommunication.readEcuFaults(ecu)
+            communication = self._communicationFor(FAULT_PROTOCOLS)
+            if communication is not None:
+                communication.readEcuFaults(ecu)
             else:
-                self.writeToOutputView(i18n().tr("Protocol not supported yet!"))
+                self.writeToOutputView(self._tr("Protocol not supported yet!"))
                 return
         else:
-            self.writeToOutputView(i18n().tr("Port not open!"))
+            self.writeToOutputView(self._tr("Port not open!"))
 
     @Slot()
     def clearEcuFaults(self):
         if self.serialController.isOpen():
-            # Setup CAN_EMIT_ID
-            ecu = ">" + self.ecuObjectList["tx_id"] + ":" + self.ecuObjectList["rx_id"]
+            # CAN_EMIT_ID (set up in openZoneFile)
+            ecu = self._ecuAddr
 
             # Give some option to cancel the Clear Fault Codes
-            changedialog = MessageDialog(self, i18n().tr("Clearing Fault Codes of ECU:"), i18n().tr("Ok"), ecu)
+            changedialog = MessageDialog(self, self._tr("Clearing Fault Codes of ECU:"), self._tr("Ok"), ecu)
             if MessageDialog.Rejected == changedialog.exec():
                 return
 
-            if self.ecuObjectList["protocol"] == "uds":
-                self.udsCommunication.clearEcuFaults(ecu)
+            communication = self._communicationFor(FAULT_PROTOCOLS)
+            if communication is not None:
+                communication.clearEcuFaults(ecu)
             else:
-                self.writeToOutputView(i18n().tr("Protocol not supported yet!"))
+                self.writeToOutputView(self._tr("Protocol not supported yet!"))
                 return
         else:
-            self.writeToOutputView(i18n().tr("Port not open!"))
+            self.writeToOutputView(self._tr("Port not open!"))
+
+    @Slot(object, str)
+    def backupDoneCallback(self, snapshot, error: str):
+        if snapshot:
+            print(f"[BACKUP] Automatisches Backup erstellt: {snapshot.id}")
+            self.writeToOutputView(f"[SICHERHEIT] Backup erstellt: {snapshot.id}")
+        elif error:
+            print(f"[BACKUP] Warnung - Backup fehlgeschlagen: {error}")
+            self.writeToOutputView(f"[WARNUNG] Backup fehlgeschlagen: {error}")
 
     @Slot()
-    def csvReadCallback(self, value: list):
-        # Did we had an empty line in CSV? Then skip it.
-        if len(value) >= 2:
-            self.ui.treeView.changeZoneOption(value[0], value[1]);
+    def csvReadCallback(self, rows: list):
+        changeZoneOption = self.ui.treeView.changeZoneOption
+        for value in rows:
+            # Did we had an empty line in CSV? Then skip it.
+            if len(value) >= 2:
+                changeZoneOption(value[0], value[1]);
 
     @Slot()
     def updateZoneDataback(self, zoneData: str, value: str):
@@ -885,7 +1093,17 @@ class MainWindow(QMainWindow):
         self.writeToOutputView(str(packet))
         if self.stream != None:
             self.csvWriter.writerow(packet)
-            self.stream.flush()
+            # Nur alle CSV_FLUSH_PACKETS Zeilen leeren statt pro Paket
+            self._packetsSinceFlush += 1
+            if self._packetsSinceFlush >= CSV_FLUSH_PACKETS:
+                self._packetsSinceFlush = 0
+                self.stream.flush()
+
+    def closeEvent(self, event):
+        if self.stream != None:
+            self.stream.close()
+            self.stream = None
+        super(MainWindow, self).closeEvent(event)
     
     def activatePSAREButton(self):
         """Aktiviert PSA-RE Button basierend auf verfügbaren Dependencies"""
@@ -1057,59 +1275,70 @@ class MainWindow(QMainWindow):
                                    "pip install requests pyyaml\n\n" +
                                    "Dann starte PyPSADiag neu.")
     
-    @Slot()
-    def startPSARESync(self):
-        """Startet PSA-RE Community-Synchronisation - mit Dependency-Check zur Laufzeit"""
-        self.writeToOutputView("=== Community Sync Button geklickt! ===")
+    def _loadPSAREModules(self):
+        """Importiert (und installiert ggf.) PSA-RE Dependencies; (requests, yaml, create_psa_re_integration) oder None"""
+        # Versuche Dependencies zu importieren
+        self.writeToOutputView("Prüfe PSA-RE Dependencies...")
         
         try:
-            # Versuche Dependencies zu importieren
-            self.writeToOutputView("Prüfe PSA-RE Dependencies...")
+            import requests
+            import yaml
+            self.writeToOutputView("OK Dependencies gefunden")
+        except ImportError as dep_error:
+            self.writeToOutputView(f"Dependencies fehlen - {dep_error}")
+            self.writeToOutputView("Installiere automatisch...")
+            
+            # Automatische Installation
+            import subprocess
+            import sys
             
             try:
-                import requests
-                import yaml
-                self.writeToOutputView(f"OK Dependencies gefunden: requests {requests.__version__}")
-            except ImportError as dep_error:
-                self.writeToOutputView(f"Dependencies fehlen - {dep_error}")
-                self.writeToOutputView("Installiere automatisch...")
-                
-                # Automatische Installation
-                import subprocess
-                import sys
+                self.writeToOutputView("Führe aus: pip install requests pyyaml")
+                result = subprocess.run([
+                    sys.executable, '-m', 'pip', 'install', 'requests', 'pyyaml'
+                ], capture_output=True, text=True, timeout=60)
                 
-                try:
-                    self.writeToOutputView("Führe aus: pip install requests pyyaml")
-                    result = subprocess.run([
-                        sys.executable, '-m', 'pip', 'install', 'requests', 'pyyaml'
-                    ], capture_output=True, text=True, timeout=60)
+                if result.returncode == 0:
+                    self.writeToOutputView("OK Dependencies installiert!")
+                    self.writeToOutputView("Versuche erneut...")
                     
-                    if result.returncode == 0:
-                        self.writeToOutputView("OK Dependencies installiert!")
-                        self.writeToOutputView("Versuche erneut...")
-                        
-                        # Versuche erneut zu importieren
-                        import requests
-                        import yaml
-                        self.writeToOutputView(f"OK Dependencies jetzt verfügbar: requests {requests.__version__}")
-                    else:
-                        self.writeToOutputView("FEHLER bei Installation:")
-                        self.writeToOutputView(result.stderr)
-                        return
-                        
-                except Exception as install_error:
-                    self.writeToOutputView(f"Installation fehlgeschlagen: {install_error}")
-                    self.writeToOutputView("Installiere manuell: pip install requests pyyaml")
+                    # Versuche erneut zu importieren
+                    import requests
+                    import yaml
+                    self.writeToOutputView("OK Dependencies jetzt verfügbar")
+                else:
+                    self.writeToOutputView("FEHLER bei Installation:")
+                    self.writeToOutputView(result.stderr)
+                    return None
+                    
+            except Exception as install_error:
+                self.writeToOutputView(f"Installation fehlgeschlagen: {install_error}")
+                self.writeToOutputView("Installiere manuell: pip install requests pyyaml")
+                return None
+        
+        # Versuche PSA-RE Integration zu importieren
+        try:
+            from PSA_RE_Integration import create_psa_re_integration
+            self.writeToOutputView("OK PSA-RE Integration Modul verfügbar")
+        except ImportError as mod_error:
+            self.writeToOutputView(f"FEHLER: PSA-RE Modul nicht verfügbar - {mod_error}")
+            return None
+
+        return requests, yaml, create_psa_re_integration
+
+    @Slot()
+    def startPSARESync(self):
+        """Startet PSA-RE Community-Synchronisation - mit Dependency-Check zur Laufzeit"""
+        self.writeToOutputView("=== Community Sync Button geklickt! ===")
+        
+        try:
+            # Dependencies nur beim ersten Klick prüfen/installieren, danach aus dem Cache
+            if self._psaReModules is None:
+                self._psaReModules = self._loadPSAREModules()
+                if self._psaReModules is None:
                     return
-            
-            # Versuche PSA-RE Integration zu importieren
-            try:
-                from PSA_RE_Integration import create_psa_re_integration
-                self.writeToOutputView("OK PSA-RE Integration Modul verfügbar")
-            except ImportError as mod_error:
-                self.writeToOutputView(f"FEHLER: PSA-RE Modul nicht verfügbar - {mod_error}")
-                return
-            
+            requests, yaml, create_psa_re_integration = self._psaReModules
+
             # Erstelle Integration falls nicht vorhanden
             if not hasattr(self, 'psaReIntegration') or not self.psaReIntegration:
                 self.writeToOutputView("Erstelle PSA-RE Integration...")
@@ -1136,13 +1365,9 @@ class MainWindow(QMainWindow):
                 self.writeToOutputView("WARNUNG: Repository nicht erreichbar (Offline?)")
                 
         except Exception as e:
-            self.writeToOutputView(f"=== PSA-RE Sync Fehler ===")
-            self.writeToOutputView(f"Fehler: {str(e)}")
             import traceback
-            self.writeToOutputView("Stack Trace:")
-            for line in traceback.format_exc().split('\n'):
-                if line.strip():
-                    self.writeToOutputView(f"  {line}")
+            self.writeLinesToOutputView(["=== PSA-RE Sync Fehler ===", f"Fehler: {str(e)}", "Stack Trace:"] +
+                                        [f"  {line}" for line in traceback.format_exc().split('\n') if line.strip()])
     
     @Slot()
     def onPSARESyncStarted(self):
@@ -1152,7 +1377,11 @@ class MainWindow(QMainWindow):
     
     @Slot(int, str)
     def onPSARESyncProgress(self, progress, message):
-        """PSA-RE Sync Fortschritt"""
+        """PSA-RE Sync Fortschritt (höchstens 10 Meldungen pro Sekunde, 100% immer)"""
+        now = time.monotonic()
+        if progress < 100 and now - self._lastProgressTs < PROGRESS_MIN_INTERVAL:
+            return
+        self._lastProgressTs = now
         self.writeToOutputView(f"PSA-RE [{progress}%]: {message}")
         
     @Slot(bool, str) 
@@ -1181,11 +1410,15 @@ class MainWindow(QMainWindow):
                 
                 # Zeige verfügbare Community-Definitionen
                 if definitions:
-                    self.writeToOutputView(f"Verfügbare Community-Definitionen: {len(definitions)}")
-                    for definition in definitions[:5]:  # Zeige erste 5
-                        arch = definition.get('architecture', 'Unknown')
-                        zones = definition.get('zone_count', 0)
-                        self.writeToOutputView(f"  - {definition['name']} ({arch}, {zones} Zonen)")
+                    shown = [(definition['name'], definition.get('architecture', 'Unknown'), definition.get('zone_count', 0))
+                             for definition in definitions[:5]]  # Zeige erste 5
+                    # Unverändert seit letzter Anzeige -> nicht erneut ausgeben
+                    fingerprint = (len(definitions), tuple(shown))
+                    if fingerprint == self._lastDefsPrinted:
+                        return
+                    self._lastDefsPrinted = fingerprint
+                    self.writeLinesToOutputView([f"Verfügbare Community-Definitionen: {len(definitions)}"] +
+                                                [f"  - {name} ({arch}, {zones} Zonen)" for name, arch, zones in shown])
                         
                     # Hier könnte man die Definitionen in die Zone-File Auswahl integrieren
                     
@@ -1208,9 +1441,13 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    args = _parse_args(sys.argv[1:])
+    if args.checkcalc:
+        _run_checkcalc()
+
     app = QApplication(sys.argv)
 
-    window = MainWindow()
+    window = MainWindow(args)
     window.show()
 
     sys.exit(app.exec())
@@ -6,135 +6,173 @@ Qt Framework Compatibility Layer
 Unterstützt sowohl PySide6 als auch PyQt5 automatisch
 """
 
+import logging
+import os
 import sys
 import types
 
+_log = logging.getLogger(__name__)
+
 # Try PySide6 first, fallback to PyQt5
-QT_FRAMEWORK = None
-
-try:
-    from PySide6.QtWidgets import *
-    from PySide6.QtCore import *
-    from PySide6.QtGui import *
-    QT_FRAMEWORK = "PySide6"
-    print(f"[OK] Using Qt Framework: {QT_FRAMEWORK}")
-    
-    # Store original modules for import hook
-    _pyside6_widgets = sys.modules.get('PySide6.QtWidgets')
-    _pyside6_core = sys.modules.get('PySide6.QtCore')
-    _pyside6_gui = sys.modules.get('PySide6.QtGui')
-    
-except ImportError:
+_FRAMEWORKS = ("PySide6", "PyQt5")
+
+# Framework of the last successful start, tried first so PyQt5 setups skip the failing PySide6 import.
+# Lives in the user cache dir: %LOCALAPPDATA% on Windows, $XDG_CACHE_HOME or ~/.cache elsewhere
+if sys.platform == "win32":
+    _CACHE_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "PyPSADiag")
+else:
+    _CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "pypsadiag")
+_FRAMEWORK_CACHE_FILE = os.path.join(_CACHE_DIR, "qt_framework")
+
+
+def _load_framework_cache():
+    """Framework name from the marker file (None if missing/invalid)"""
     try:
-        from PyQt5.QtWidgets import *
-        from PyQt5.QtCore import *
-        from PyQt5.QtGui import *
-        # Also ensure QThread is available globally
-        from PyQt5.QtCore import QThread
-        QT_FRAMEWORK = "PyQt5"
-        print(f"[OK] Using Qt Framework: {QT_FRAMEWORK}")
-        
-        # Create PySide6 compatibility modules using PyQt5
-        class PySide6Module:
-            def __init__(self, pyqt5_module):
-                self._pyqt5_module = pyqt5_module
-                
-            def __getattr__(self, name):
-                # Handle Signal/Slot compatibility
-                if name == 'Signal':
-                    from PyQt5.QtCore import pyqtSignal
-                    return pyqtSignal
-                elif name == 'Slot':
-                    from PyQt5.QtCore import pyqtSlot
-                    return pyqtSlot
-                return getattr(self._pyqt5_module, name)
-        
-        # Import PyQt5 modules
-        import PyQt5.QtWidgets as qt5_widgets
-        import PyQt5.QtCore as qt5_core 
-        import PyQt5.QtGui as qt5_gui
-        
-        # Create PySide6 compatibility modules
-        pyside6_widgets = PySide6Module(qt5_widgets)
-        pyside6_core = PySide6Module(qt5_core)
-        pyside6_gui = PySide6Module(qt5_gui)
-        
-        # Create PySide6 package structure
-        pyside6_package = types.ModuleType('PySide6')
-        pyside6_package.QtWidgets = pyside6_widgets
-        pyside6_package.QtCore = pyside6_core
-        pyside6_package.QtGui = pyside6_gui
-        
-        # Inject into sys.modules for import compatibility
-        sys.modules['PySide6'] = pyside6_package
-        sys.modules['PySide6.QtWidgets'] = pyside6_widgets
-        sys.modules['PySide6.QtCore'] = pyside6_core
-        sys.modules['PySide6.QtGui'] = pyside6_gui
-        
+        with open(_FRAMEWORK_CACHE_FILE, "r", encoding="utf-8") as f:
+            name = f.read().strip()
+    except OSError:
+        return None
+    return name if name in _FRAMEWORKS else None
+
+
+def _save_framework_cache(name):
+    """Remember the framework (None removes the marker)"""
+    try:
+        if name is None:
+            os.remove(_FRAMEWORK_CACHE_FILE)
+            return
+        os.makedirs(os.path.dirname(_FRAMEWORK_CACHE_FILE), exist_ok=True)
+        with open(_FRAMEWORK_CACHE_FILE, "w", encoding="utf-8") as f:
+            f.write(name)
+    except OSError:
+        pass
+
+
+def _loaded_framework():
+    """Framework already imported in this process (PyQt5 aliased as PySide6 does not count)"""
+    core = sys.modules.get("PySide6.QtCore")
+    if core is not None and core.__name__ == "PySide6.QtCore":
+        return "PySide6"
+    if "PyQt5.QtCore" in sys.modules:
+        return "PyQt5"
+    return None
+
+
+# PYPSADIAG_QT=PySide6|PyQt5 forces a framework and bypasses the marker file
+_forced = os.environ.get("PYPSADIAG_QT")
+_loaded = None
+_cached = None
+if _forced in _FRAMEWORKS:
+    _candidates = (_forced,)
+else:
+    # A framework that is already imported wins; the marker file is only read on a cold start
+    _loaded = _loaded_framework()
+    _cached = None if _loaded else _load_framework_cache()
+    _first = _loaded or _cached
+    _candidates = _FRAMEWORKS if _first is None else (_first,) + tuple(n for n in _FRAMEWORKS if n != _first)
+
+# Only the submodules are imported here; Qt classes are resolved on first
+# access through the module __getattr__ below (PEP 562)
+for _name in _candidates:
+    try:
+        if _name == "PySide6":
+            from PySide6 import QtWidgets as _qtw, QtCore as _qtc, QtGui as _qtg
+        else:
+            from PyQt5 import QtWidgets as _qtw, QtCore as _qtc, QtGui as _qtg
     except ImportError:
-        raise ImportError("Neither PySide6 nor PyQt5 is available. Please install one of them.")
+        if _name == _cached:
+            # Stale marker (framework uninstalled)
+            _save_framework_cache(None)
+        continue
+    _framework = _name
+    break
+else:
+    _framework = None
 
-# Compatibility adjustments for PyQt5 vs PySide6
-if QT_FRAMEWORK == "PyQt5":
-    # PyQt5 uses different signal names in some cases
-    # Also handle QRegExp vs QRegularExpression differences
+if _framework is None:
+    if _forced in _FRAMEWORKS:
+        raise ImportError(f"PYPSADIAG_QT={_forced} is set, but {_forced} is not available.")
+    raise ImportError("Neither PySide6 nor PyQt5 is available. Please install one of them.")
+# Bound exactly once, so importers and the interpreter see a stable module constant
+QT_FRAMEWORK = _framework
+if _forced not in _FRAMEWORKS and _loaded is None and QT_FRAMEWORK != _cached:
+    _save_framework_cache(QT_FRAMEWORK)
+_log.info("Using Qt Framework: %s", QT_FRAMEWORK)
+
+# One dispatch on the detected framework; each branch is straight-line setup
+if QT_FRAMEWORK == "PySide6":
+    # PySide6 is the preferred framework
     try:
-        from PyQt5.QtCore import QRegExp
-        from PyQt5.QtGui import QRegExpValidator
+        from PySide6.QtCore import QRegularExpression
+        from PySide6.QtGui import QRegularExpressionValidator as QRegExpValidator
     except ImportError:
-        # Fallback if QRegExpValidator is not available
         QRegExpValidator = None
     
-    # In PyQt5, QAction is in QtWidgets, not QtGui
     try:
-        from PyQt5.QtWidgets import QAction
+        from PySide6.QtGui import QAction
     except ImportError:
         try:
-            from PyQt5.QtGui import QAction
+            from PySide6.QtWidgets import QAction
         except ImportError:
             QAction = None
-            
-elif QT_FRAMEWORK == "PySide6":
-    # PySide6 is the preferred framework
+
+else:
+    # PySide6 names for PyQt5: the PyQt5 modules are aliased directly, Signal/Slot are
+    # added to PyQt5.QtCore itself so every lookup stays a plain module attribute access
+    from PyQt5.QtCore import pyqtSignal, pyqtSlot
+    _qtc.Signal = pyqtSignal
+    _qtc.Slot = pyqtSlot
+    
+    # Create PySide6 package structure
+    pyside6_package = types.ModuleType('PySide6')
+    pyside6_package.QtWidgets = _qtw
+    pyside6_package.QtCore = _qtc
+    pyside6_package.QtGui = _qtg
+    
+    # Inject into sys.modules for import compatibility
+    sys.modules['PySide6'] = pyside6_package
+    sys.modules['PySide6.QtWidgets'] = _qtw
+    sys.modules['PySide6.QtCore'] = _qtc
+    sys.modules['PySide6.QtGui'] = _qtg
+
+    # Also handle QRegExp vs QRegularExpression differences
     try:
-        from PySide6.QtCore import QRegularExpression
-        from PySide6.QtGui import QRegularExpressionValidator as QRegExpValidator
+        from PyQt5.QtCore import QRegExp
+        from PyQt5.QtGui import QRegExpValidator
     except ImportError:
+        # Fallback if QRegExpValidator is not available
         QRegExpValidator = None
     
+    # In PyQt5, QAction is in QtWidgets, not QtGui
     try:
-        from PySide6.QtGui import QAction
+        from PyQt5.QtWidgets import QAction
     except ImportError:
         try:
-            from PySide6.QtWidgets import QAction
+            from PyQt5.QtGui import QAction
         except ImportError:
             QAction = None
 
-# Ensure all commonly used Qt classes are available in the global namespace
-# This is needed because 'from X import *' doesn't always work as expected with __all__
-
-# Core classes that should always be available
-globals().update({
-    'QT_FRAMEWORK': QT_FRAMEWORK,
-})
-
-# Make QRegExpValidator available if it was imported
-if 'QRegExpValidator' in locals():
-    globals()['QRegExpValidator'] = QRegExpValidator
-
-# Ensure Signal and Slot are available for both frameworks
-if QT_FRAMEWORK == "PyQt5":
-    from PyQt5.QtCore import pyqtSignal as Signal, pyqtSlot as Slot, QThread
-elif QT_FRAMEWORK == "PySide6":
-    from PySide6.QtCore import Signal, Slot, QThread
-
-# Make these available globally
-globals().update({
-    'Signal': Signal,
-    'Slot': Slot, 
-    'QThread': QThread
-})
-
-# Add QAction if available
-if 'QAction' in locals() and QAction is not None:
-    globals()['QAction'] = QAction
\ No newline at end of file
+# Signal and Slot for both frameworks (PyQt5.QtCore carries the aliases set above)
+Signal, Slot = _qtc.Signal, _qtc.Slot
+QThread = _qtc.QThread
+
+
+# Lookup order matches the former star imports (QtGui overrode QtCore, which overrode QtWidgets)
+_QT_MODULES = (_qtg, _qtc, _qtw)
+
+
+def __getattr__(name):
+    for module in _QT_MODULES:
+        value = getattr(module, name, None)
+        if value is not None:
+            # Cache, later lookups hit the module dict directly
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    names = set(globals())
+    for module in _QT_MODULES:
+        names.update(dir(module))
+    return sorted(names)